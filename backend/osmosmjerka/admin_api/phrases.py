@@ -4,6 +4,7 @@ import csv
 import io
 import os
 import re
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -592,38 +593,43 @@ async def merge_duplicate_categories(
         return JSONResponse({"error": f"Failed to merge categories: {str(e)}"}, status_code=status.HTTP_400_BAD_REQUEST)
 
 
-@router.get("/export")
-@rate_limit(max_requests=5, window_seconds=60)  # 5 exports per minute
-async def export_data(
-    category: str = Query(None), language_set_id: int = Query(None), user=Depends(require_admin_access)
-) -> StreamingResponse:
-    """Export phrases as CSV from specified language set"""
-    try:
-        # Export every phrase (including ignored categories), matching what the admin browse
-        # table shows — get_phrases() would strip the set's default-ignored categories.
-        rows = await db_manager.get_phrases_for_admin(language_set_id, category)
-        output = io.StringIO()
+# Rows written to the CSV buffer between yields of a streamed export
+EXPORT_CSV_BATCH_ROWS = 500
+
 
-        # Use CSV writer to properly handle semicolon delimiter and escape special characters
-        csv_writer = csv.writer(output, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+async def _export_csv_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """Render phrase rows as semicolon-separated CSV text, yielding a chunk per batch of rows."""
+    output = io.StringIO()
 
-        # Write header
-        csv_writer.writerow(["categories", "phrase", "translation"])
+    # Use CSV writer to properly handle semicolon delimiter and escape special characters
+    csv_writer = csv.writer(output, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL)
 
-        # Write data rows
-        for row in rows:
-            categories = row["categories"]
-            phrase = row["phrase"]
-            translation = row["translation"]
+    # Write header
+    csv_writer.writerow(["categories", "phrase", "translation"])
 
-            # Normalize line breaks for export (use <br> for HTML compatibility)
-            translation_export = translation.replace("\n", "<br>")
+    # Write data rows
+    batched = 0
+    async for row in rows:
+        # Normalize line breaks for export (use <br> for HTML compatibility)
+        translation_export = row["translation"].replace("\n", "<br>")
+        csv_writer.writerow([row["categories"], row["phrase"], translation_export])
+        batched += 1
+        if batched == EXPORT_CSV_BATCH_ROWS:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+            batched = 0
 
-            csv_writer.writerow([categories, phrase, translation_export])
+    yield output.getvalue()
 
-        content = output.getvalue()
-        output.close()
 
+@router.get("/export")
+@rate_limit(max_requests=5, window_seconds=60)  # 5 exports per minute
+async def export_data(
+    category: str = Query(None), language_set_id: int = Query(None), user=Depends(require_admin_access)
+) -> StreamingResponse:
+    """Export phrases as CSV from specified language set"""
+    try:
         # Get language set info for filename
         language_set = None
         if language_set_id:
@@ -632,8 +638,26 @@ async def export_data(
         language_name = language_set["name"] if language_set else "default"
         filename = f"export_{language_name}_{category or 'all'}.csv"
 
+        # Export every phrase (including ignored categories), matching what the admin browse
+        # table shows — get_phrases() would strip the set's default-ignored categories.
+        # Rows are streamed to the client batch by batch rather than built into one string.
+        chunks = _export_csv_chunks(db_manager.iter_phrases_for_admin(language_set_id, category))
+        # Pull the first batch now, so a failing query still turns into an error response
+        first_chunk = await anext(chunks)
+
+        async def content() -> AsyncIterator[str]:
+            yield first_chunk
+            try:
+                async for chunk in chunks:
+                    yield chunk
+            except Exception:
+                # The 200 status is already sent; log the failure and re-raise so the server aborts
+                # the response instead of completing it, leaving the client a visibly broken download
+                logger.exception("Export failed mid-stream", extra={"export_file": filename})
+                raise
+
         return StreamingResponse(
-            io.StringIO(content),
+            content(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
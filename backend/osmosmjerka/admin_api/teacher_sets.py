@@ -10,6 +10,7 @@ from osmosmjerka.game_api.helpers import generate_formatted_crossword_grid
 from osmosmjerka.grid_generator.word_search import generate_grid
 from osmosmjerka.logging_config import get_logger
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 logger = get_logger(__name__)
 
@@ -373,7 +374,7 @@ async def delete_all_sessions(
 
     count = await db_manager.delete_all_sessions_for_set(set_id)
 
-    logger.info(f"Deleted {count} sessions for phrase set {set_id} by user {user['id']}")
+    logger.info("Deleted %s sessions for phrase set %s by user %s", count, set_id, user["id"])
 
     return JSONResponse({"message": f"Deleted {count} sessions", "count": count})
 
@@ -417,7 +418,9 @@ async def preview_phrase_set(
     # Generate grid
     if config.get("game_type") == "crossword":
         # Pass number of phrases as target for crossword
-        grid, placed_phrases = generate_formatted_crossword_grid(phrases_for_grid, grid_size, len(phrases_for_grid))
+        grid, placed_phrases = await run_in_threadpool(
+            generate_formatted_crossword_grid, phrases_for_grid, grid_size, len(phrases_for_grid)
+        )
     else:
         grid, placed_phrases = generate_grid(phrases_for_grid, size=grid_size)
 
@@ -616,7 +619,9 @@ async def start_session(
     # Use correct generator based on game type
     game_type = config.get("game_type", "word_search")
     if game_type == "crossword":
-        grid, placed_phrases = generate_formatted_crossword_grid(phrases_for_grid, grid_size, len(phrases_for_grid))
+        grid, placed_phrases = await run_in_threadpool(
+            generate_formatted_crossword_grid, phrases_for_grid, grid_size, len(phrases_for_grid)
+        )
     else:
         grid, placed_phrases = generate_grid(phrases_for_grid, size=grid_size)
 
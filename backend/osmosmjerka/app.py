@@ -15,7 +15,10 @@ from osmosmjerka.admin_api import router as admin_router
 from osmosmjerka.auth import ROOT_ADMIN_PASSWORD_HASH, ROOT_ADMIN_USERNAME, SECRET_KEY
 from osmosmjerka.database import db_manager
 from osmosmjerka.game_api import router as game_router
+from osmosmjerka.game_api.export import shutdown_export_executor, start_export_executor
+from osmosmjerka.game_api.helpers import shutdown_crossword_executor, start_crossword_executor
 from osmosmjerka.maintenance import start_maintenance, stop_maintenance
+from starlette.concurrency import run_in_threadpool
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -183,6 +186,8 @@ async def lifespan(_: FastAPI):
             logger.info("Demo account not configured (skipped)")
 
         maintenance_task = start_maintenance()
+        start_crossword_executor()
+        start_export_executor()
 
         logger.info("Application ready to accept requests")
     except Exception as e:
@@ -193,6 +198,9 @@ async def lifespan(_: FastAPI):
 
     logger.info("Application shutdown initiated")
     await stop_maintenance(maintenance_task)
+    # Waits for crossword attempts and exports still running in worker processes, so keep it off the event loop
+    await run_in_threadpool(shutdown_crossword_executor)
+    await run_in_threadpool(shutdown_export_executor)
     await db_manager.disconnect()
     logger.info("Application shutdown complete")
 
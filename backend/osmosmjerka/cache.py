@@ -35,10 +35,11 @@ class AsyncLRUCache:
 
     def set(self, key: str, value: Any) -> None:
         """Set cached value, removing oldest entry if cache is full."""
+        # Re-insert rather than overwrite so the dict stays ordered oldest-first
+        self.cache.pop(key, None)
         if len(self.cache) >= self.maxsize:
             # Remove oldest entry
-            oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k][1])
-            del self.cache[oldest_key]
+            del self.cache[next(iter(self.cache))]
         self.cache[key] = (value, time.time())
 
     def invalidate(self, pattern: str | None = None) -> None:
@@ -77,6 +78,7 @@ class RateLimiter:
 categories_cache = AsyncLRUCache(maxsize=50, ttl=300)  # 5 min TTL
 language_sets_cache = AsyncLRUCache(maxsize=10, ttl=600)  # 10 min TTL
 phrases_cache = AsyncLRUCache(maxsize=100, ttl=180)  # 3 min TTL
+exports_cache = AsyncLRUCache(maxsize=32, ttl=300)  # 5 min TTL, rendered DOCX/PNG bytes
 rate_limiter = RateLimiter()
 
 
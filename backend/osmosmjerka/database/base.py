@@ -134,14 +134,18 @@ class BaseDatabaseManager:
             alembic_cfg = Config(alembic_ini)
             alembic_cfg.set_main_option("sqlalchemy.url", str(self.engine.url))
 
-            if not inspect(self.engine).has_table("alembic_version"):
-                # First run: create all static tables then stamp so future upgrades apply cleanly
-                metadata.create_all(bind=self.engine)
-                command.stamp(alembic_cfg, "head")
-                logger.debug("Database schema bootstrapped and stamped at Alembic head")
-            else:
-                command.upgrade(alembic_cfg, "head")
-                logger.debug("Database migrations applied")
+            # One connection serves the catalog check and Alembic, instead of a fresh engine per step.
+            # engine.begin() wraps it all in a single transaction: one commit, rolled back on failure.
+            with self.engine.begin() as connection:
+                alembic_cfg.attributes["connection"] = connection
+                if not inspect(connection).has_table("alembic_version"):
+                    # First run: create all static tables then stamp so future upgrades apply cleanly
+                    metadata.create_all(bind=connection)
+                    command.stamp(alembic_cfg, "head")
+                    logger.debug("Database schema bootstrapped and stamped at Alembic head")
+                else:
+                    command.upgrade(alembic_cfg, "head")
+                    logger.debug("Database migrations applied")
         except Exception as exc:
             logger.exception("Failed to initialise database schema", extra={"error": str(exc)})
             raise
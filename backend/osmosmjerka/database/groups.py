@@ -1,7 +1,9 @@
 """Teacher groups database operations."""
 
 import json
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from osmosmjerka.database.models import (
@@ -13,14 +15,16 @@ from osmosmjerka.database.models import (
 from sqlalchemy import and_, func, or_
 from sqlalchemy.sql import delete, insert, select, update
 
-# Default settings
-DEFAULT_SETTINGS = {
-    "tier1_group_member_limit": 10,
-    "tier2_group_member_limit": 50,
-    "tier1_student_group_limit": 1,
-    "tier2_student_group_limit": 10,
-    "invitation_expiry_days": 7,
-}
+# Default settings (read-only view shared by every lookup)
+DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "tier1_group_member_limit": 10,
+        "tier2_group_member_limit": 50,
+        "tier1_student_group_limit": 1,
+        "tier2_student_group_limit": 10,
+        "invitation_expiry_days": 7,
+    }
+)
 
 
 class TeacherGroupsMixin:
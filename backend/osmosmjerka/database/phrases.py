@@ -1,9 +1,14 @@
 """Phrase management database operations."""
 
+from collections.abc import AsyncIterator
+
 from osmosmjerka.database.models import language_sets_table, phrases_table
 from sqlalchemy import func
 from sqlalchemy.sql import delete, insert, select, update
 
+# Rows fetched per query while streaming an admin export
+ADMIN_EXPORT_PAGE_SIZE = 1000
+
 
 class PhrasesMixin:
     """Mixin class providing phrase management methods.
@@ -344,6 +349,41 @@ class PhrasesMixin:
             row_list.append(row)
         return row_list
 
+    async def iter_phrases_for_admin(
+        self, language_set_id: int | None = None, category: str | None = None
+    ) -> AsyncIterator[dict[str, str]]:
+        """Stream the rows get_phrases_for_admin would return, for exporting a whole language set.
+
+        Rows are fetched in keyset-paginated pages of ADMIN_EXPORT_PAGE_SIZE, so no cursor (or pooled
+        connection) stays open while the caller waits on a slow client between pages. Only the
+        exported columns are selected.
+        """
+        database = self._ensure_database()
+
+        language_set = await self._resolve_language_set(language_set_id)
+        if not language_set:
+            return
+
+        query = select(
+            phrases_table.c.id, phrases_table.c.categories, phrases_table.c.phrase, phrases_table.c.translation
+        ).where(phrases_table.c.language_set_id == language_set["id"])
+        if category:
+            query = query.where(phrases_table.c.categories.like(f"%{category}%"))
+        query = query.order_by(phrases_table.c.id).limit(ADMIN_EXPORT_PAGE_SIZE)
+
+        last_id = None
+        while True:
+            page_query = query if last_id is None else query.where(phrases_table.c.id > last_id)
+            page = await database.fetch_all(page_query)
+            for row in page:
+                # Only skip phrases shorter than 3 characters - NO category filtering
+                if len(str(row["phrase"]).strip()) < 3:
+                    continue
+                yield {"categories": row["categories"], "phrase": row["phrase"], "translation": row["translation"]}
+            if len(page) < ADMIN_EXPORT_PAGE_SIZE:
+                return
+            last_id = page[-1]["id"]
+
     async def get_phrase_count_for_admin(
         self, language_set_id: int | None = None, category: str | None = None, search_term: str | None = None
     ) -> int:
@@ -39,7 +39,7 @@ class TeacherSetsAccessMixin:
             try:
                 row_dict["config"] = json.loads(row_dict["config"])
             except json.JSONDecodeError:
-                row_dict["config"] = DEFAULT_CONFIG.copy()
+                row_dict["config"] = dict(DEFAULT_CONFIG)
 
         return self._serialize_datetimes(row_dict)
 
@@ -280,7 +280,7 @@ class TeacherSetsAccessMixin:
                 try:
                     row_dict["config"] = json.loads(row_dict["config"])
                 except json.JSONDecodeError:
-                    row_dict["config"] = DEFAULT_CONFIG.copy()
+                    row_dict["config"] = dict(DEFAULT_CONFIG)
             puzzles.append(self._serialize_datetimes(row_dict))
 
         return {
@@ -2,7 +2,9 @@
 
 import json
 import secrets
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from osmosmjerka.database.models import (
@@ -19,17 +21,19 @@ from sqlalchemy.sql import delete, func, insert, select, update
 
 logger = get_logger(__name__)
 
-# Default configuration for teacher phrase sets
-DEFAULT_CONFIG = {
-    "allow_hints": True,
-    "show_translations": True,
-    "require_translation_input": False,
-    "show_timer": False,
-    "strict_grid_size": False,
-    "grid_size": 10,
-    "time_limit_minutes": None,
-    "difficulty": "medium",
-}
+# Default configuration for teacher phrase sets (read-only; copy before mutating)
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "allow_hints": True,
+        "show_translations": True,
+        "require_translation_input": False,
+        "show_timer": False,
+        "strict_grid_size": False,
+        "grid_size": 10,
+        "time_limit_minutes": None,
+        "difficulty": "medium",
+    }
+)
 
 
 def generate_hotlink_token() -> str:
@@ -237,7 +241,7 @@ class TeacherSetsMixin:
                 try:
                     row_dict["config"] = json.loads(row_dict["config"])
                 except json.JSONDecodeError:
-                    row_dict["config"] = DEFAULT_CONFIG.copy()
+                    row_dict["config"] = dict(DEFAULT_CONFIG)
             sets.append(self._serialize_datetimes(row_dict))
 
         # Get phrase counts and session counts for all sets
@@ -329,7 +333,7 @@ class TeacherSetsMixin:
             try:
                 row_dict["config"] = json.loads(row_dict["config"])
             except json.JSONDecodeError:
-                row_dict["config"] = DEFAULT_CONFIG.copy()
+                row_dict["config"] = dict(DEFAULT_CONFIG)
 
         # Get phrase count
         phrase_counts = await self._get_phrase_set_counts([set_id])
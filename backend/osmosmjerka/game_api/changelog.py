@@ -3,6 +3,7 @@
 import logging
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter, Query, Request
@@ -20,22 +21,41 @@ PYPROJECT_PATH = Path(__file__).parent.parent.parent.parent / "pyproject.toml"
 
 # Cache for parsed changelog (15 minute TTL)
 CACHE_TTL_SECONDS = 15 * 60  # 15 minutes
-_changelog_cache: dict = {"entries": None, "version": None, "timestamp": 0}
+_changelog_cache: dict = {"entries": None, "version": None, "timestamp": 0, "mtime_ns": None}
 
 
 def get_current_version() -> str | None:
     """Get the current app version from pyproject.toml."""
     try:
         if PYPROJECT_PATH.exists():
-            content = PYPROJECT_PATH.read_text()
-            match = re.search(r'version\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+            return _read_version(PYPROJECT_PATH, PYPROJECT_PATH.stat().st_mtime_ns)
     except Exception:
         logger.debug("Could not read version from pyproject.toml", exc_info=True)
     return None
 
 
+@lru_cache(maxsize=4)
+def _read_version(path: Path, mtime_ns: int) -> str | None:
+    """Version declared in a pyproject.toml; keyed on mtime_ns so an edited file is read again."""
+    # Nothing else in the app parses TOML, so the parser is only loaded once a version is asked for
+    import tomllib
+
+    return tomllib.loads(path.read_text()).get("project", {}).get("version")
+
+
+def _changelog_mtime_ns() -> int | None:
+    """Modification time of CHANGELOG.md in nanoseconds, or None if it can't be read."""
+    try:
+        return CHANGELOG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _clear_changelog_cache() -> None:
+    """Drop the cached changelog so the next request re-reads it."""
+    _changelog_cache.update(entries=None, version=None, timestamp=0, mtime_ns=None)
+
+
 def _get_cached_changelog() -> tuple[list[dict], str | None]:
     """Get changelog entries from cache or parse if expired."""
     now = time.time()
@@ -44,98 +64,118 @@ def _get_cached_changelog() -> tuple[list[dict], str | None]:
     if _changelog_cache["entries"] is not None and now - _changelog_cache["timestamp"] < CACHE_TTL_SECONDS:
         return _changelog_cache["entries"], _changelog_cache["version"]
 
-    # Parse and cache
-    entries = parse_changelog()
+    # Past the TTL, re-parse only if CHANGELOG.md changed; otherwise a stat() renews the entry
+    mtime_ns = _changelog_mtime_ns()
+    if _changelog_cache["entries"] is not None and mtime_ns is not None and mtime_ns == _changelog_cache["mtime_ns"]:
+        entries = _changelog_cache["entries"]
+    else:
+        entries = parse_changelog()
     version = get_current_version()
 
     _changelog_cache["entries"] = entries
     _changelog_cache["version"] = version
     _changelog_cache["timestamp"] = now
+    _changelog_cache["mtime_ns"] = mtime_ns
 
     return entries, version
 
 
-# Patterns that indicate renovate/dependency update entries (skip these)
-RENOVATE_PATTERNS = [
-    r"\*\*deps\*\*:",  # **deps**: prefix from renovate
-    r"update\s+dependency",  # "Update dependency X"
-    r"renovate",  # Direct renovate mentions
-    r"bump\s+\w+\s+from",  # "Bump X from Y to Z"
-]
+# Patterns that indicate renovate/dependency update entries (skip these). "**deps**:" prefixes
+# and direct renovate mentions are plain substrings; the two below need a regex for the spacing.
+_UPDATE_DEPENDENCY_RE = re.compile(r"update\s+dependency")  # "Update dependency X"
+_BUMP_RE = re.compile(r"bump\s+\w+\s+from")  # "Bump X from Y to Z"
+
+
+# Changelog line patterns, compiled once for parse_changelog
+_VERSION_HEADER_RE = re.compile(r"^##\s+v?(\d+\.\d+\.\d+)\s*\(([^)]+)\)?")  # "## v1.38.1 (2026-01-08)"
+_SECTION_RES = (
+    (re.compile(r"^###?\s*(Feature|New Feature)", re.IGNORECASE), "features"),
+    (re.compile(r"^###?\s*(Bug\s*Fix|Fix|Bugfix|Bug)", re.IGNORECASE), "bugfixes"),
+    (re.compile(r"^###?\s*(Improvement|Enhancement|Chore|Refactor)", re.IGNORECASE), "improvements"),
+    (re.compile(r"^###?\s"), None),  # Other section, ignore
+)
+_LIST_ITEM_RE = re.compile(r"^[-*]\s+")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_COMMIT_HASH_RE = re.compile(r"`[a-f0-9]{7,40}`", re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r",\s*$")
+
+
+def _section_for_header(line: str, current: str | None) -> str | None:
+    """Map a "##"/"###" section header to its entry key; lines that aren't headers keep the current one."""
+    for pattern, section in _SECTION_RES:
+        if pattern.match(line):
+            return section
+    return current
 
 
 def _is_renovate_entry(text: str) -> bool:
     """Check if a changelog entry is a renovate/dependency update (not useful for users)."""
     text_lower = text.lower()
-    for pattern in RENOVATE_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-    return False
+    if "**deps**:" in text_lower or "renovate" in text_lower:
+        return True
+    # Only reach for a regex when its leading word is actually present
+    if "dependency" in text_lower and _UPDATE_DEPENDENCY_RE.search(text_lower):
+        return True
+    return "bump" in text_lower and _BUMP_RE.search(text_lower) is not None
 
 
 def parse_changelog() -> list[dict]:
-    """Parse CHANGELOG.md into structured version entries."""
+    """Parse CHANGELOG.md into structured version entries, streaming it line by line."""
     if not CHANGELOG_PATH.exists():
         return []
 
-    try:
-        content = CHANGELOG_PATH.read_text(encoding="utf-8")
-    except Exception:
-        logger.debug("Could not read CHANGELOG.md", exc_info=True)
-        return []
-
     entries = []
     current_entry = None
     current_section = None
 
-    for line in content.split("\n"):
-        line = line.strip()
-
-        # Match version headers like "## v1.38.1 (2026-01-08)"
-        version_match = re.match(r"^##\s+v?(\d+\.\d+\.\d+)\s*\(([^)]+)\)?", line)
-        if version_match:
-            if current_entry:
-                entries.append(current_entry)
-            current_entry = {
-                "version": version_match.group(1),
-                "date": version_match.group(2) if version_match.group(2) else None,
-                "features": [],
-                "bugfixes": [],
-                "improvements": [],
-            }
-            current_section = None
-            continue
-
-        if not current_entry:
-            continue
-
-        # Match section headers
-        if re.match(r"^###?\s*(Feature|New Feature)", line, re.IGNORECASE):
-            current_section = "features"
-        elif re.match(r"^###?\s*(Bug\s*Fix|Fix|Bugfix|Bug)", line, re.IGNORECASE):
-            current_section = "bugfixes"
-        elif re.match(r"^###?\s*(Improvement|Enhancement|Chore|Refactor)", line, re.IGNORECASE):
-            current_section = "improvements"
-        elif re.match(r"^###?\s", line):
-            # Other section, ignore
-            current_section = None
-        elif current_section and re.match(r"^[-*]\s+", line):
-            # List item - extract text
-            text = re.sub(r"^[-*]\s+", "", line)
-
-            # Skip renovate/dependency updates - not useful for end users
-            if _is_renovate_entry(text):
-                continue
-
-            # Remove markdown links but keep text: [text](url) -> text
-            text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-            # Remove commit hashes
-            text = re.sub(r"`[a-f0-9]{7,40}`", "", text, flags=re.IGNORECASE)
-            # Clean up
-            text = re.sub(r",\s*$", "", text).strip()
-
-            if text:
-                current_entry[current_section].append(text)
+    try:
+        with CHANGELOG_PATH.open(encoding="utf-8") as changelog:
+            for line in changelog:
+                line = line.strip()
+
+                # Headers all start with "##"; only those lines need the header regexes
+                if line.startswith("##"):
+                    version_match = _VERSION_HEADER_RE.match(line)
+                    if version_match:
+                        if current_entry:
+                            entries.append(current_entry)
+                        current_entry = {
+                            "version": version_match.group(1),
+                            "date": version_match.group(2) if version_match.group(2) else None,
+                            "features": [],
+                            "bugfixes": [],
+                            "improvements": [],
+                        }
+                        current_section = None
+                    elif current_entry:
+                        current_section = _section_for_header(line, current_section)
+                    continue
+
+                if not current_section or not line.startswith(("-", "*")):
+                    continue
+
+                # List item - extract text
+                item_match = _LIST_ITEM_RE.match(line)
+                if not item_match:
+                    continue
+                text = line[item_match.end() :]
+
+                # Skip renovate/dependency updates - not useful for end users
+                if _is_renovate_entry(text):
+                    continue
+
+                # Remove markdown links but keep text: [text](url) -> text
+                text = _MARKDOWN_LINK_RE.sub(r"\1", text)
+                # Remove commit hashes
+                text = _COMMIT_HASH_RE.sub("", text)
+                # Clean up
+                text = _TRAILING_COMMA_RE.sub("", text).strip()
+
+                if text:
+                    current_entry[current_section].append(text)
+    except Exception:
+        logger.debug("Could not read CHANGELOG.md", exc_info=True)
+        return []
 
     # Don't forget the last entry
     if current_entry:
@@ -144,6 +184,12 @@ def parse_changelog() -> list[dict]:
     return entries
 
 
+@lru_cache(maxsize=256)
+def _version_parts(version: str) -> tuple[int, ...]:
+    """Numeric parts of a version string; the What's New filter compares the same few repeatedly."""
+    return tuple(int(x) for x in version.replace("v", "").split("."))
+
+
 def compare_versions(v1: str, v2: str) -> int:
     """
     Compare two semantic version strings.
@@ -156,21 +202,15 @@ def compare_versions(v1: str, v2: str) -> int:
     if not v2:
         return 1
 
-    parts1 = [int(x) for x in v1.replace("v", "").split(".")]
-    parts2 = [int(x) for x in v2.replace("v", "").split(".")]
-
-    max_length = max(len(parts1), len(parts2))
-
-    for i in range(max_length):
-        num1 = parts1[i] if i < len(parts1) else 0
-        num2 = parts2[i] if i < len(parts2) else 0
+    parts1 = _version_parts(v1)
+    parts2 = _version_parts(v2)
 
-        if num1 > num2:
-            return 1
-        if num1 < num2:
-            return -1
+    # Pad the shorter version with zeros so "1.2" and "1.2.0" compare equal
+    length = max(len(parts1), len(parts2))
+    parts1 += (0,) * (length - len(parts1))
+    parts2 += (0,) * (length - len(parts2))
 
-    return 0
+    return (parts1 > parts2) - (parts1 < parts2)
 
 
 @router.get("/version")
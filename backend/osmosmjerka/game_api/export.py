@@ -1,43 +1,91 @@
 """Export functionality for game API."""
 
-import io
+import asyncio
+import hashlib
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from osmosmjerka.cache import rate_limit
+from fastapi import APIRouter, HTTPException, Response
+from osmosmjerka.cache import exports_cache, rate_limit
 from osmosmjerka.game_api.schemas import ExportPuzzleRequest
 from osmosmjerka.utils import export_to_docx, export_to_png
+from starlette.concurrency import run_in_threadpool
 
 router = APIRouter()
 
+# Exports of grids at least this large render in a worker process: document layout and Pillow
+# drawing mostly hold the GIL, so on threads alone concurrent exports would share one core
+PROCESS_EXPORT_MIN_GRID_SIZE = 12
+
+# Upper bound on export worker processes, whatever the host's core count
+EXPORT_MAX_WORKERS = 4
+
+_export_executor: ProcessPoolExecutor | None = None
+
+
+def start_export_executor() -> None:
+    """
+    Start the shared process pool for rendering larger exports; called from the app lifespan.
+
+    Spawned like the crossword pool: a forked child would inherit the root QueueHandler without
+    the listener thread that drains it, losing its log records. Single-core hosts get no pool.
+    """
+    global _export_executor
+    workers = min(EXPORT_MAX_WORKERS, os.cpu_count() or 1)
+    if _export_executor is None and workers > 1:
+        _export_executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def shutdown_export_executor() -> None:
+    """Stop the export process pool, dropping queued renders and waiting for running ones."""
+    global _export_executor
+    if _export_executor is not None:
+        _export_executor.shutdown(wait=True, cancel_futures=True)
+        _export_executor = None
+
 
 @router.post("/export")
 @rate_limit(max_requests=5, window_seconds=60)  # 5 exports per minute
-async def export_puzzle(body: ExportPuzzleRequest) -> StreamingResponse:
+async def export_puzzle(body: ExportPuzzleRequest) -> Response:
     """Export puzzle in specified format (docx or png)"""
     try:
         if body.format == "docx":
-            content = export_to_docx(
-                body.category, body.grid, body.phrases, body.game_type, body.across_label, body.down_label
-            )
+            exporter = export_to_docx
             media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             extension = "docx"
         elif body.format == "png":
-            content = export_to_png(
-                body.category, body.grid, body.phrases, body.game_type, body.across_label, body.down_label
-            )
+            exporter = export_to_png
             media_type = "image/png"
             extension = "png"
         else:
             raise HTTPException(status_code=400, detail="Unsupported export format")
 
+        # Downloading the same puzzle again (or from another tab) reuses the rendered file
+        cache_key = f"export_{hashlib.sha256(body.model_dump_json().encode()).hexdigest()}"
+        content = exports_cache.get(cache_key)
+        if content is None:
+            # Rendering is CPU-bound, so it never runs on the event loop itself; small grids render
+            # on the threadpool, where handing off costs less than it would to a worker process, as
+            # does everything when no export pool was started
+            args = (body.category, body.grid, body.phrases, body.game_type, body.across_label, body.down_label)
+            executor = _export_executor
+            if executor is not None and len(body.grid) >= PROCESS_EXPORT_MIN_GRID_SIZE:
+                loop = asyncio.get_running_loop()
+                content = await loop.run_in_executor(executor, exporter, *args)
+            else:
+                content = await run_in_threadpool(exporter, *args)
+            exports_cache.set(cache_key, content)
+
         prefix = "crossword" if body.game_type == "crossword" else "wordsearch"
         safe_category = re.sub(r"[^a-z0-9]+", "_", (body.category or prefix).lower())
         filename = f"{prefix}-{safe_category}.{extension}"
 
-        return StreamingResponse(
-            io.BytesIO(content),
+        # The file is already fully rendered in memory; send it as one body with a Content-Length
+        # rather than re-wrapping it in a BytesIO and streaming it back out line by line
+        return Response(
+            content,
             media_type=media_type,
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
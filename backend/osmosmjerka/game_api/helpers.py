@@ -1,10 +1,25 @@
 """Helper functions for game API endpoints."""
 
+import multiprocessing
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from osmosmjerka.grid_generator.crossword import generate_crossword_grid
+from osmosmjerka.grid_generator.shared import normalize_phrase
 from osmosmjerka.grid_generator.word_search import generate_grid
 
+# Crossword attempts on grids smaller than this run serially - process hand-off costs more than the work itself
+PARALLEL_CROSSWORD_MIN_GRID_SIZE = 12
+
+# Upper bound on crossword worker processes, so one large-grid request can't occupy every core
+CROSSWORD_MAX_WORKERS = 4
+
+# How many random pools to draw per crossword attempt before settling for fewer, distinct attempts
+CROSSWORD_POOL_DRAWS_PER_ATTEMPT = 4
+
+_crossword_executor: ProcessPoolExecutor | None = None
+
 
 def get_grid_size_and_num_phrases(selected: list, difficulty: str) -> tuple:
     """Get grid size and number of phrases based on difficulty and available phrases."""
@@ -127,9 +142,11 @@ def generate_formatted_crossword_grid(
 
     Uses an expanded phrase pool (3x target) and retry logic to improve
     success rate when some phrases can't be placed due to lack of intersections.
+    Attempts are independent, so on larger grids they run concurrently and the
+    first successful one wins.
 
     Args:
-        all_phrases: List of phrase dictionaries with 'phrase' and 'translation' keys
+        all_phrases: Sequence of phrase dictionaries with 'phrase' and 'translation' keys
         grid_size: Size of the grid
         target_phrase_count: Target number of phrases to place
         max_retries: Number of generation attempts before giving up
@@ -142,47 +159,60 @@ def generate_formatted_crossword_grid(
     best_grid = None
     best_placed_phrases = []
 
-    for attempt in range(max_retries):
-        # Select an expanded pool of phrases (3x target, but at least all available)
-        pool_size = min(len(all_phrases), target_phrase_count * 3)
-        if pool_size <= target_phrase_count:
-            # Not enough phrases - use all of them
-            selected_phrases = all_phrases.copy()
+    # Select an expanded pool of phrases (3x target, but at least all available)
+    pool_size = min(len(all_phrases), target_phrase_count * 3)
+    # Not enough phrases - every attempt uses all of them
+    use_all = pool_size <= target_phrase_count
+
+    # Prepare every attempt's phrase pool up front - attempts are independent of each other.
+    # Generation is deterministic, so a pool arranged like an earlier one would end the same way; redraw instead.
+    phrase_pools = []
+    seen_arrangements = set()
+    for _ in range(max_retries * CROSSWORD_POOL_DRAWS_PER_ATTEMPT):
+        if len(phrase_pools) == max_retries:
+            break
+        if use_all:
+            selected_phrases = list(all_phrases)
         else:
             # Random sample from pool for variety on each retry
             selected_phrases = random.sample(all_phrases, pool_size)
 
         # Shuffle for different ordering on each attempt
         random.shuffle(selected_phrases)
+        arrangement = _crossword_arrangement(selected_phrases)
+        if arrangement in seen_arrangements:
+            continue
+        seen_arrangements.add(arrangement)
+        phrase_pools.append(selected_phrases)
+
+    for result in _iter_crossword_attempts(phrase_pools, grid_size):
+        if isinstance(result, ValueError):
+            # Continue to next attempt
+            continue
 
-        try:
-            # Generate crossword grid - pass the expanded pool
-            grid, placed_phrases = generate_crossword_grid(selected_phrases, grid_size)
+        grid, placed_phrases = result
 
-            # Track best result so far
-            if len(placed_phrases) > len(best_placed_phrases):
-                best_grid = grid
-                best_placed_phrases = placed_phrases
+        # Track best result so far
+        if len(placed_phrases) > len(best_placed_phrases):
+            best_grid = grid
+            best_placed_phrases = placed_phrases
 
-            # Success! We placed enough phrases
-            if len(placed_phrases) >= min_phrases:
-                # Trim to target count if we placed more
-                if len(placed_phrases) > target_phrase_count:
-                    placed_phrases = placed_phrases[:target_phrase_count]
+        # Success! We placed enough phrases
+        if len(placed_phrases) >= min_phrases:
+            # Trim to target count if we placed more
+            if len(placed_phrases) > target_phrase_count:
+                placed_phrases = placed_phrases[:target_phrase_count]
 
-                # Convert grid to simple character array, filtering out ghost words
-                simple_grid = _convert_crossword_grid_to_simple(grid, limit_phrases=len(placed_phrases))
+            # Convert grid to simple character array, filtering out ghost words
+            simple_grid = _convert_crossword_grid_to_simple(grid, limit_phrases=len(placed_phrases))
 
-                # Convert coords to frontend format
-                for phrase in placed_phrases:
-                    if phrase.get("coords"):
-                        phrase["coords"] = [[r, c] for r, c in phrase["coords"]]
+            # Convert coords to frontend format
+            for phrase in placed_phrases:
+                if phrase.get("coords"):
+                    phrase["coords"] = [[r, c] for r, c in phrase["coords"]]
 
-                return simple_grid, placed_phrases
+            return simple_grid, placed_phrases
 
-        except ValueError:
-            # Continue to next attempt
-            pass
     # All retries exhausted - return best result if it meets minimum, else error
     if len(best_placed_phrases) >= min_phrases:
         if len(best_placed_phrases) > target_phrase_count:
@@ -200,11 +230,79 @@ def generate_formatted_crossword_grid(
 
     # Truly failed - raise the last error or a summary
     raise ValueError(
-        f"Could not generate crossword after {max_retries} attempts. "
+        f"Could not generate crossword after {len(phrase_pools)} attempts. "
         f"Best result: {len(best_placed_phrases)} phrases, needed {min_phrases} for grid size {grid_size}"
     )
 
 
+def _crossword_arrangement(phrases: list) -> tuple:
+    """
+    Return the phrase order the crossword generator will actually work through.
+
+    The generator stably sorts phrases by normalized length, longest first, so shuffles that
+    differ only in the order of different-length phrases produce the same crossword.
+    """
+    texts = [phrase["phrase"] for phrase in phrases]
+    return tuple(sorted(texts, key=lambda text: len(normalize_phrase(text.replace(" ", "").upper())), reverse=True))
+
+
+def start_crossword_executor() -> None:
+    """
+    Start the shared process pool for parallel crossword attempts; called from the app lifespan.
+
+    Workers are spawned rather than forked: by the time the pool starts, the app process already
+    runs threads (logging listener, threadpool), and a forked child could inherit their held locks.
+    Single-core hosts get no pool and keep generating serially.
+    """
+    global _crossword_executor
+    workers = min(CROSSWORD_MAX_WORKERS, os.cpu_count() or 1)
+    if _crossword_executor is None and workers > 1:
+        _crossword_executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def shutdown_crossword_executor() -> None:
+    """Stop the crossword process pool, dropping queued attempts and waiting for running ones."""
+    global _crossword_executor
+    if _crossword_executor is not None:
+        _crossword_executor.shutdown(wait=True, cancel_futures=True)
+        _crossword_executor = None
+
+
+def _iter_crossword_attempts(phrase_pools: list, grid_size: int):
+    """
+    Run one crossword generation attempt per phrase pool and yield the outcomes.
+
+    Each outcome is either the (grid, placed_phrases) tuple or the ValueError raised by the
+    generator. Attempts are independent, so on larger grids they run concurrently in the process
+    pool started by start_crossword_executor and are yielded in completion order; attempts still
+    queued when the caller stops iterating are cancelled, while running ones finish in their worker.
+    Small grids, or no pool (single-core host, or outside the app), fall back to serial generation.
+
+    Args:
+        phrase_pools: One list of phrase dictionaries per attempt
+        grid_size: Size of the grid
+    """
+    executor = _crossword_executor
+    if executor is None or grid_size < PARALLEL_CROSSWORD_MIN_GRID_SIZE or len(phrase_pools) < 2:
+        for phrases in phrase_pools:
+            try:
+                yield generate_crossword_grid(phrases, grid_size)
+            except ValueError as e:
+                yield e
+        return
+
+    futures = [executor.submit(generate_crossword_grid, phrases, grid_size) for phrases in phrase_pools]
+    try:
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except ValueError as e:
+                yield e
+    finally:
+        for future in futures:
+            future.cancel()
+
+
 def _convert_crossword_grid_to_simple(grid: list, limit_phrases: int = None) -> list:
     """
     Convert crossword grid format to simple character array for frontend.
@@ -214,20 +312,17 @@ def _convert_crossword_grid_to_simple(grid: list, limit_phrases: int = None) ->
         limit_phrases: If set, only include cells belonging to phrases with index < limit_phrases.
                       Used to filter out ghost phrases when the list was trimmed.
     """
-    simple_grid = []
-    for row in grid:
-        simple_row = []
-        for cell in row:
-            if cell is None:
-                simple_row.append(None)
-            else:
-                # If we have a limit, check if this cell belongs to any valid phrase
-                if limit_phrases is not None:
-                    indices = cell.get("phrase_indices", [])
-                    if not any(idx < limit_phrases for idx in indices):
-                        simple_row.append(None)  # Belongs only to removed phrases
-                        continue
-
-                simple_row.append(cell.get("letter", ""))
-        simple_grid.append(simple_row)
-    return simple_grid
+    if limit_phrases is None:
+        return [[None if cell is None else cell.get("letter", "") for cell in row] for row in grid]
+
+    # Keep a cell only if it belongs to a phrase with index < limit_phrases; cells of
+    # removed (ghost) phrases become empty
+    return [
+        [
+            cell.get("letter", "")
+            if cell is not None and min(cell.get("phrase_indices", ()), default=limit_phrases) < limit_phrases
+            else None
+            for cell in row
+        ]
+        for row in grid
+    ]
@@ -54,7 +54,7 @@ async def share_private_list(
         )
 
     except Exception as e:
-        logger.exception(f"Failed to share list {list_id}")
+        logger.exception("Failed to share list %s", list_id)
         raise HTTPException(status_code=500, detail="Failed to share list") from e
 
 
@@ -77,7 +77,7 @@ async def unshare_private_list(list_id: int, shared_with_user_id: int, user=Depe
         return JSONResponse({"message": "Sharing access removed"})
 
     except Exception as e:
-        logger.exception(f"Failed to unshare list {list_id}")
+        logger.exception("Failed to unshare list %s", list_id)
         raise HTTPException(status_code=500, detail="Failed to remove sharing") from e
 
 
@@ -96,7 +96,7 @@ async def get_list_shares(list_id: int, user=Depends(get_current_user)) -> JSONR
         return JSONResponse({"shares": shares})
 
     except Exception as e:
-        logger.exception(f"Failed to get shares for list {list_id}")
+        logger.exception("Failed to get shares for list %s", list_id)
         raise HTTPException(status_code=500, detail="Failed to get shares") from e
 
 
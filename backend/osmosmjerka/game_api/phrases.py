@@ -9,6 +9,7 @@ from osmosmjerka.cache import cache_response, categories_cache, language_sets_ca
 from osmosmjerka.database import db_manager
 from osmosmjerka.game_api.helpers import _generate_grid_with_exact_phrase_count, get_grid_size_and_num_phrases
 from osmosmjerka.logging_config import get_logger
+from starlette.concurrency import run_in_threadpool
 
 logger = get_logger(__name__)
 
@@ -108,9 +109,12 @@ async def get_phrases(
 
     # Try to generate grid with exactly the required number of phrases
     try:
-        grid, placed_phrases = _generate_grid_with_exact_phrase_count(selected, grid_size, num_phrases, game_type)
+        # Generation is CPU-bound (crosswords may fan out to worker processes); keep it off the event loop
+        grid, placed_phrases = await run_in_threadpool(
+            _generate_grid_with_exact_phrase_count, selected, grid_size, num_phrases, game_type
+        )
     except ValueError as e:
-        logger.warning(f"Crossword generation failed: {e}")
+        logger.warning("Crossword generation failed: %s", e)
         return JSONResponse(
             {
                 "error_code": "CROSSWORD_GENERATION_FAILED",
@@ -19,6 +19,7 @@ from osmosmjerka.game_api.schemas import (
     UpdatePrivateListRequest,
 )
 from osmosmjerka.logging_config import get_logger
+from starlette.concurrency import run_in_threadpool
 
 logger = get_logger(__name__)
 
@@ -155,8 +156,10 @@ async def get_private_list_phrases_endpoint(
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Generate grid with exact phrase count
-        grid, selected_phrases = _generate_grid_with_exact_phrase_count(all_phrases, grid_size, num_phrases, game_type)
+        # Generate grid with exact phrase count, off the event loop since generation is CPU-bound
+        grid, selected_phrases = await run_in_threadpool(
+            _generate_grid_with_exact_phrase_count, all_phrases, grid_size, num_phrases, game_type
+        )
 
         response_data = {
             "grid": grid,
@@ -172,7 +175,7 @@ async def get_private_list_phrases_endpoint(
         return JSONResponse(response_data)
 
     except Exception as e:
-        logger.exception(f"Failed to get phrases from private list {list_id}")
+        logger.exception("Failed to get phrases from private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -188,7 +191,7 @@ async def get_private_list_categories_endpoint(
         categories = await db_manager.get_private_list_categories(list_id, user["id"], language_set_id)
         return JSONResponse(categories)
     except Exception as e:
-        logger.exception(f"Failed to get categories for private list {list_id}")
+        logger.exception("Failed to get categories for private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -227,7 +230,7 @@ async def get_private_list_entries_endpoint(
         )
 
     except Exception as e:
-        logger.exception(f"Failed to load entries for private list {list_id}")
+        logger.exception("Failed to load entries for private list %s", list_id)
         raise HTTPException(status_code=500, detail="Failed to load list entries") from e
 
 
@@ -308,7 +311,7 @@ async def update_private_list(
         return JSONResponse({"id": list_id, "list_name": new_name, "message": "List renamed successfully"})
 
     except Exception as e:
-        logger.exception(f"Failed to update private list {list_id}")
+        logger.exception("Failed to update private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -331,7 +334,7 @@ async def delete_private_list_endpoint(list_id: int, user=Depends(get_current_us
         return JSONResponse({"message": "List deleted successfully", "id": list_id})
 
     except Exception as e:
-        logger.exception(f"Failed to delete private list {list_id}")
+        logger.exception("Failed to delete private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -386,7 +389,7 @@ async def add_phrase_to_private_list(
             return JSONResponse({"error": error_msg}, status_code=status.HTTP_409_CONFLICT)
         return JSONResponse({"error": error_msg}, status_code=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
-        logger.exception(f"Failed to add phrase to private list {list_id}")
+        logger.exception("Failed to add phrase to private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -461,7 +464,7 @@ async def batch_add_phrases_to_private_list(
         )
 
     except Exception as e:
-        logger.exception(f"Failed to batch add phrases to private list {list_id}")
+        logger.exception("Failed to batch add phrases to private list %s", list_id)
         raise HTTPException(status_code=500, detail="Batch import failed") from e
 
 
@@ -489,7 +492,7 @@ async def remove_phrase_from_private_list(
         )
 
     except Exception as e:
-        logger.exception(f"Failed to remove phrase from private list {list_id}")
+        logger.exception("Failed to remove phrase from private list %s", list_id)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -517,7 +520,7 @@ async def get_list_statistics(list_id: int, user=Depends(get_current_user)) -> J
         return JSONResponse(stats)
 
     except Exception as e:
-        logger.exception(f"Failed to get statistics for list {list_id}")
+        logger.exception("Failed to get statistics for list %s", list_id)
         raise HTTPException(status_code=500, detail="Failed to get statistics") from e
 
 
@@ -596,5 +599,5 @@ async def export_private_list(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Failed to export list {list_id}")
+        logger.exception("Failed to export list %s", list_id)
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}") from e
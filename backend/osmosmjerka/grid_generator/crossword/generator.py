@@ -5,7 +5,7 @@ Unlike word search grids, crossword grids only use horizontal (across) and verti
 orientations, and phrases must intersect at common letters.
 """
 
-from osmosmjerka.grid_generator.shared.normalization import find_intersections, normalize_phrase
+from osmosmjerka.grid_generator.shared.normalization import normalize_phrase
 
 # Crossword directions: horizontal (across) and vertical (down) only
 CROSSWORD_DIRECTIONS = [(0, 1), (1, 0)]  # right, down
@@ -34,27 +34,27 @@ def generate_crossword_grid(
     if not valid_phrases:
         return [], []
 
-    # Step 2: Sort by length (longest first for better placement)
-    phrase_pairs = [(w, w["phrase"], w["translation"]) for w in valid_phrases]
-    phrase_pairs.sort(key=lambda x: len(normalize_phrase(x[1].replace(" ", "").upper())), reverse=True)
+    # Step 2: Sort by length (longest first for better placement), normalizing each phrase once
+    phrase_pairs = [(w, normalize_phrase(w["phrase"].replace(" ", "").upper())) for w in valid_phrases]
+    phrase_pairs.sort(key=lambda x: len(x[1]), reverse=True)
 
     # Step 3: Calculate grid size if not provided
     if size is None:
-        longest = max(len(normalize_phrase(p[1].replace(" ", "").upper())) for p in phrase_pairs)
+        longest = max(len(p[1]) for p in phrase_pairs)
         size = max(longest + 4, 10)  # At least 4 cells padding and minimum 10
 
     # Step 4: Initialize grid with None (empty cells)
-    grid = [[None for _ in range(size)] for _ in range(size)]
+    grid = [[None] * size for _ in range(size)]
     placed_phrases = []
-    start_number = 1
+    # (letter positions, coords, direction) of each placed phrase, kept alongside placed_phrases
+    # so later candidates don't re-derive them from the output records
+    placed_words = []
 
     # Step 5: Place each phrase
-    for phrase_data in phrase_pairs:
-        result = _place_crossword_phrase(grid, phrase_data, placed_phrases, size)
+    for phrase_obj, normalized in phrase_pairs:
+        result = _place_crossword_phrase(grid, normalized, placed_words, size)
         if result:
             coords, direction = result
-            phrase_obj, orig_phrase, translation = phrase_data
-            normalized = normalize_phrase(orig_phrase.replace(" ", "").upper())
 
             # Place letters on grid
             for i, (r, c) in enumerate(coords):
@@ -62,27 +62,17 @@ def generate_crossword_grid(
                     grid[r][c] = {"letter": normalized[i], "phrase_indices": []}
                 grid[r][c]["phrase_indices"].append(len(placed_phrases))
 
-            # Determine if this is a new starting position
-            start_r, start_c = coords[0]
-            is_new_start = True
-            for existing in placed_phrases:
-                if existing["coords"][0] == [start_r, start_c]:
-                    is_new_start = False
-                    break
-
-            placed_phrase = {
-                **phrase_obj,
-                "coords": coords,
-                "direction": "across" if direction == (0, 1) else "down",
-                "start_number": start_number
-                if is_new_start
-                else _find_existing_start_number(placed_phrases, start_r, start_c),
-            }
-
-            if is_new_start:
-                start_number += 1
-
-            placed_phrases.append(placed_phrase)
+            # Every placed phrase gets its own number; the frontend joins the numbers of
+            # phrases sharing a start cell ("1/2")
+            placed_phrases.append(
+                {
+                    **phrase_obj,
+                    "coords": coords,
+                    "direction": "across" if direction == (0, 1) else "down",
+                    "start_number": len(placed_phrases) + 1,
+                }
+            )
+            placed_words.append((_letter_positions(normalized), coords, direction))
 
     # Step 6: Validate minimum phrase count
     # Rule: At least size // 2 + 1 phrases must be placed
@@ -97,24 +87,26 @@ def generate_crossword_grid(
     return grid, placed_phrases
 
 
-def _find_existing_start_number(placed_phrases: list[dict], row: int, col: int) -> int:
-    """Find the start number for a phrase that shares a starting position."""
-    for phrase in placed_phrases:
-        if phrase["coords"][0] == [row, col]:
-            return phrase["start_number"]
-    return 0
+def _letter_positions(phrase: str) -> dict[str, list[int]]:
+    """Index a placed phrase by letter, in phrase order, so intersections are looked up rather than scanned."""
+    positions = {}
+    for i, letter in enumerate(phrase):
+        positions.setdefault(letter, []).append(i)
+    return positions
 
 
 def _place_crossword_phrase(
-    grid: list[list], phrase_data: tuple[dict, str, str], placed_phrases: list[dict], size: int
+    grid: list[list],
+    normalized: str,
+    placed_words: list[tuple[dict[str, list[int]], list[tuple[int, int]], tuple[int, int]]],
+    size: int,
 ) -> tuple[list[tuple[int, int]], tuple[int, int]] | None:
     """
-    Place a phrase in the crossword grid.
+    Place a normalized phrase in the crossword grid.
 
+    placed_words holds (letter positions, coords, direction) for every phrase placed so far.
     Returns (coords, direction) if successful, None otherwise.
     """
-    phrase_obj, orig_phrase, translation = phrase_data
-    normalized = normalize_phrase(orig_phrase.replace(" ", "").upper())
     phrase_len = len(normalized)
 
     # Skip if too long for grid
@@ -122,43 +114,44 @@ def _place_crossword_phrase(
         return None
 
     # If no phrases placed yet, place in center
-    if not placed_phrases:
+    if not placed_words:
         return _place_first_phrase(grid, normalized, size)
 
     # Try to find an intersection with existing phrases
     best_placement = None
     best_score = -1
 
-    for placed in placed_phrases:
-        placed_normalized = normalize_phrase(placed["phrase"].replace(" ", "").upper())
-        placed_coords = placed["coords"]
-        placed_dir = (0, 1) if placed["direction"] == "across" else (1, 0)
-
-        # Find intersection points
-        intersections = find_intersections(normalized, placed_normalized)
-
-        for phrase_pos, placed_pos in intersections:
-            # Get the intersection cell
-            int_r, int_c = placed_coords[placed_pos]
-
-            # Try perpendicular direction
-            for dr, dc in CROSSWORD_DIRECTIONS:
-                if (dr, dc) == placed_dir:
-                    continue  # Skip same direction
-
-                # Calculate start position
-                start_r = int_r - dr * phrase_pos
-                start_c = int_c - dc * phrase_pos
-
-                # Generate coords
-                coords = [(start_r + dr * i, start_c + dc * i) for i in range(phrase_len)]
-
-                # Validate placement
-                if _is_valid_crossword_placement(grid, normalized, coords, size):
-                    score = _score_crossword_placement(grid, coords, placed_phrases)
-                    if score > best_score:
-                        best_score = score
-                        best_placement = (coords, (dr, dc))
+    for letter_positions, placed_coords, placed_dir in placed_words:
+        # Find intersection points: only the placed phrase's positions holding each of our letters
+        for phrase_pos, letter in enumerate(normalized):
+            for placed_pos in letter_positions.get(letter, ()):
+                # Get the intersection cell
+                int_r, int_c = placed_coords[placed_pos]
+
+                # Try perpendicular direction
+                for dr, dc in CROSSWORD_DIRECTIONS:
+                    if (dr, dc) == placed_dir:
+                        continue  # Skip same direction
+
+                    # Calculate start position
+                    start_r = int_r - dr * phrase_pos
+                    start_c = int_c - dc * phrase_pos
+
+                    # Skip lines running off the grid before allocating their coords
+                    end_r = start_r + dr * (phrase_len - 1)
+                    end_c = start_c + dc * (phrase_len - 1)
+                    if not (0 <= start_r and 0 <= start_c and end_r < size and end_c < size):
+                        continue
+
+                    # Generate coords
+                    coords = [(start_r + dr * i, start_c + dc * i) for i in range(phrase_len)]
+
+                    # Validate placement
+                    if _is_valid_crossword_placement(grid, normalized, coords, size):
+                        score = _score_crossword_placement(grid, coords)
+                        if score > best_score:
+                            best_score = score
+                            best_placement = (coords, (dr, dc))
 
     return best_placement
 
@@ -183,72 +176,63 @@ def _is_valid_crossword_placement(grid: list[list], phrase: str, coords: list[tu
     3. No adjacent parallel words (would create invalid crossword)
     4. Buffer space before and after the phrase (no adjacent words in same direction)
     """
-    for i, (r, c) in enumerate(coords):
-        # Bounds check
-        if not (0 <= r < size and 0 <= c < size):
-            return False
-
-        # Cell compatibility check
-        cell = grid[r][c]
-        if cell is not None and cell["letter"] != phrase[i]:
-            return False
-
-    # Determine phrase direction
-    if len(coords) >= 2:
+    check_sides = len(coords) >= 2
+    if check_sides:
+        # Determine phrase direction
         dr = coords[1][0] - coords[0][0]
         dc = coords[1][1] - coords[0][1]
+        vertical = dr == 1
 
         # Rule 4: Check buffer before first cell and after last cell
         # This prevents phrases from running into each other along their direction
-        first_r, first_c = coords[0]
-        before_r, before_c = first_r - dr, first_c - dc
-        if 0 <= before_r < size and 0 <= before_c < size:
-            if grid[before_r][before_c] is not None:
-                return False  # Cell before phrase start is occupied
-
-        last_r, last_c = coords[-1]
-        after_r, after_c = last_r + dr, last_c + dc
-        if 0 <= after_r < size and 0 <= after_c < size:
-            if grid[after_r][after_c] is not None:
-                return False  # Cell after phrase end is occupied
-
-        # Rule 3: Check perpendicular adjacent cells
-        perp_dr, perp_dc = (-dc, dr) if dc != 0 else (0, 1 if dr == 0 else 0)
-        if dr == 1:  # Vertical phrase
-            perp_dr, perp_dc = 0, 1
-        else:  # Horizontal phrase
-            perp_dr, perp_dc = 1, 0
-
-        for i, (r, c) in enumerate(coords):
-            # Check cells perpendicular to this position
-            for delta in [-1, 1]:
-                adj_r = r + perp_dr * delta
-                adj_c = c + perp_dc * delta
-
-                if 0 <= adj_r < size and 0 <= adj_c < size:
-                    adj_cell = grid[adj_r][adj_c]
-                    if adj_cell is not None:
-                        # This adjacent cell has a letter - check if it's from an intersecting word
-                        # If we're not intersecting here (our cell is empty), this is invalid
-                        if grid[r][c] is None:
-                            return False
+        before_r, before_c = coords[0][0] - dr, coords[0][1] - dc
+        if 0 <= before_r < size and 0 <= before_c < size and grid[before_r][before_c] is not None:
+            return False  # Cell before phrase start is occupied
+
+        after_r, after_c = coords[-1][0] + dr, coords[-1][1] + dc
+        if 0 <= after_r < size and 0 <= after_c < size and grid[after_r][after_c] is not None:
+            return False  # Cell after phrase end is occupied
+
+    # Rules 1-3 in a single pass, bailing out at the first failing cell
+    for i, (r, c) in enumerate(coords):
+        # Bounds check
+        if not (0 <= r < size and 0 <= c < size):
+            return False
+
+        row = grid[r]
+        cell = row[c]
+        if cell is not None:
+            # Cell compatibility check: an intersection must share the letter
+            if cell["letter"] != phrase[i]:
+                return False
+        elif check_sides:
+            # Rule 3: where we don't intersect, the cells on either side of the phrase
+            # (left/right of a vertical one, above/below a horizontal one) must be empty
+            if vertical:
+                if (c > 0 and row[c - 1] is not None) or (c + 1 < size and row[c + 1] is not None):
+                    return False
+            elif (r > 0 and grid[r - 1][c] is not None) or (r + 1 < size and grid[r + 1][c] is not None):
+                return False
 
     return True
 
 
-def _score_crossword_placement(grid: list[list], coords: list[tuple[int, int]], placed_phrases: list[dict]) -> int:
+def _score_crossword_placement(grid: list[list], coords: list[tuple[int, int]]) -> int:
     """Score a crossword placement - prefer more intersections."""
     score = 0
+    sum_r = sum_c = 0
 
     for r, c in coords:
         if grid[r][c] is not None:
             score += 10  # Bonus for intersection
+        sum_r += r
+        sum_c += c
 
     # Penalty for being too far from center
     size = len(grid)
     center = size // 2
-    avg_r = sum(c[0] for c in coords) / len(coords)
-    avg_c = sum(c[1] for c in coords) / len(coords)
+    avg_r = sum_r / len(coords)
+    avg_c = sum_c / len(coords)
     distance_from_center = abs(avg_r - center) + abs(avg_c - center)
     score -= int(distance_from_center)
 
@@ -1,5 +1,10 @@
 """Phrase normalization utilities for grid generation."""
 
+# Translation table deleting every ASCII character that is neither a letter nor a hyphen
+_ASCII_NON_PHRASE_CHARS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not (chr(i).isalpha() or chr(i) == "-"))
+)
+
 
 def normalize_phrase(phrase: str) -> str:
     """
@@ -11,8 +16,12 @@ def normalize_phrase(phrase: str) -> str:
     Returns:
         str: The normalized phrase.
     """
-    # Keep only alphabetic (any language) and hyphens
-    result = "".join(c.upper() for c in phrase if c.isalpha() or c == "-")
+    if phrase.isascii():
+        # Fast path: drop non-letters in a single C-level pass
+        result = phrase.translate(_ASCII_NON_PHRASE_CHARS).upper()
+    else:
+        # Keep only alphabetic (any language) and hyphens
+        result = "".join(c.upper() for c in phrase if c.isalpha() or c == "-")
     # Remove leading/trailing hyphens
     return result.strip("-")
 
@@ -46,10 +46,17 @@ def calculate_optimal_grid_size(phrase_pairs: list[tuple[str, str]]) -> int:
     """
     from osmosmjerka.grid_generator.shared.normalization import normalize_phrase
 
-    normalized_phrases = [normalize_phrase(phrase.replace(" ", "").upper()) for phrase, _ in phrase_pairs]
-    max_phrase_len = max(len(w) for w in normalized_phrases)
-    avg_phrase_len = sum(len(w) for w in normalized_phrases) / len(normalized_phrases)
-    phrase_count = len(normalized_phrases)
+    # Single pass over the phrases collecting the longest and total normalized length
+    max_phrase_len = 0
+    total_len = 0
+    phrase_count = 0
+    for phrase, _ in phrase_pairs:
+        phrase_len = len(normalize_phrase(phrase.replace(" ", "").upper()))
+        total_len += phrase_len
+        phrase_count += 1
+        if phrase_len > max_phrase_len:
+            max_phrase_len = phrase_len
+    avg_phrase_len = total_len / phrase_count
 
     # Base size ensures longest phrase fits
     base_size = max_phrase_len + 1
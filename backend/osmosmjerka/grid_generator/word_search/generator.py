@@ -52,7 +52,7 @@ def generate_grid(phrases: list, size: int | None = None) -> tuple[list, list]:
     grid_size = size if size is not None else calculate_optimal_grid_size(phrase_text_pairs)
 
     # Step 4: Initialize empty grid and placement tracking
-    grid = [["" for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = [[""] * grid_size for _ in range(grid_size)]
     placed_phrases = []
 
     # Step 5: Place each phrase using intelligent multi-strategy approach
@@ -1,23 +1,46 @@
 """Phrase placement strategies for grid generation."""
 
 import random
+from functools import cache
 
 from osmosmjerka.grid_generator.shared.normalization import find_intersections, normalize_phrase
 from osmosmjerka.grid_generator.shared.utils import _place_phrase_on_grid
 from osmosmjerka.grid_generator.word_search.scoring import score_phrase_placement
 
 
-def _is_valid_placement(grid: list[list[str]], phrase: str, coords: list[tuple[int, int]], size: int) -> bool:
+@cache
+def _line_offsets(length: int, dr: int, dc: int) -> tuple[tuple[int, int], ...]:
     """
-    Check if a phrase can be placed at the given coordinates.
-    Helper function for placement validation.
+    Return the (row, col) offsets of every cell on a line of the given length and direction.
+    There are only a handful of phrase lengths and eight directions, so each line shape is
+    computed once and shared by every candidate start position.
     """
-    # Check bounds
-    if not all(0 <= r < size and 0 <= c < size for r, c in coords):
+    return tuple((dr * i, dc * i) for i in range(length))
+
+
+def _line_fits(grid: list[list[str]], phrase: str, row: int, col: int, dr: int, dc: int, size: int) -> bool:
+    """
+    Check if a phrase fits on the line starting at (row, col) in direction (dr, dc).
+    Works on the start cell and direction only, so candidates that get rejected never
+    allocate a coordinate list.
+    """
+    last = len(phrase) - 1
+    end_r = row + dr * last
+    end_c = col + dc * last
+    # Both ends in bounds means the whole straight line is in bounds
+    if not (0 <= row < size and 0 <= col < size and 0 <= end_r < size and 0 <= end_c < size):
         return False
 
-    # Check conflicts (each position must be empty or match the phrase letter)
-    return all(grid[r][c] in ("", phrase[i]) for i, (r, c) in enumerate(coords))
+    for letter, (ro, co) in zip(phrase, _line_offsets(len(phrase), dr, dc)):
+        cell = grid[row + ro][col + co]
+        if cell and cell != letter:
+            return False
+    return True
+
+
+def _line_coords(row: int, col: int, dr: int, dc: int, length: int) -> list[tuple[int, int]]:
+    """Build the coordinate list for a line of the given length."""
+    return [(row + ro, col + co) for ro, co in _line_offsets(length, dr, dc)]
 
 
 def try_place_phrase_with_intersections(
@@ -60,11 +83,11 @@ def try_place_phrase_with_intersections(
                 start_r = placed_r - dr * phrase_pos
                 start_c = placed_c - dc * phrase_pos
 
-                # Generate all coordinates the phrase would occupy
-                coords = [(start_r + dr * i, start_c + dc * i) for i in range(len(phrase))]
-
                 # Check if this placement is valid
-                if _is_valid_placement(grid, phrase, coords, size):
+                if _line_fits(grid, phrase, start_r, start_c, dr, dc, size):
+                    # Generate all coordinates the phrase would occupy
+                    coords = _line_coords(start_r, start_c, dr, dc, len(phrase))
+
                     # Score this placement opportunity
                     score = score_phrase_placement(grid, phrase, coords, placed_phrases, (dr, dc))
                     if score > best_score:
@@ -94,19 +117,17 @@ def try_systematic_placement(
 
     # Try every position and direction systematically
     for row in range(size):
-        for col in range(size):
-            for dr, dc in directions:
-                # Calculate end position
-                end_r = row + dr * (phrase_len - 1)
-                end_c = col + dc * (phrase_len - 1)
-
-                # Check if phrase fits in bounds
-                if 0 <= end_r < size and 0 <= end_c < size:
-                    coords = [(row + dr * i, col + dc * i) for i in range(phrase_len)]
+        # Drop directions whose vertical extent leaves the grid from this row once,
+        # instead of re-checking them for every column
+        row_directions = [(dr, dc) for dr, dc in directions if 0 <= row + dr * (phrase_len - 1) < size]
+        if not row_directions:
+            continue
 
-                    # Check if placement is valid (no conflicts)
-                    if all(grid[r][c] in ("", phrase[i]) for i, (r, c) in enumerate(coords)):
-                        return (coords, (dr, dc))
+        for col in range(size):
+            for dr, dc in row_directions:
+                # Check if phrase fits in bounds without conflicts
+                if _line_fits(grid, phrase, row, col, dr, dc, size):
+                    return (_line_coords(row, col, dr, dc, phrase_len), (dr, dc))
 
     return None
 
@@ -133,19 +154,13 @@ def _try_random_placement_with_scoring(
 
         random.shuffle(directions)  # Try directions in random order
         for dr, dc in directions:
-            # Check if phrase fits in this direction
-            end_r = row + dr * (phrase_len - 1)
-            end_c = col + dc * (phrase_len - 1)
-
-            if 0 <= end_r < size and 0 <= end_c < size:
-                coords = [(row + dr * i, col + dc * i) for i in range(phrase_len)]
-
-                # Check if placement is valid
-                if all(grid[r][c] in ("", phrase[i]) for i, (r, c) in enumerate(coords)):
-                    score = score_phrase_placement(grid, phrase, coords, placed_phrases, (dr, dc))
-                    if score > best_score:
-                        best_score = score
-                        best_placement = (coords, (dr, dc))
+            # Check if phrase fits in this direction without conflicts
+            if _line_fits(grid, phrase, row, col, dr, dc, size):
+                coords = _line_coords(row, col, dr, dc, phrase_len)
+                score = score_phrase_placement(grid, phrase, coords, placed_phrases, (dr, dc))
+                if score > best_score:
+                    best_score = score
+                    best_placement = (coords, (dr, dc))
 
         # Use progressively lower thresholds to ensure eventual placement
         threshold = max(1, 5 - (attempt // 20))
@@ -8,14 +8,97 @@ Provides hybrid logging:
 No file logging - all logs go to streams for container environments.
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
+import time
 import traceback
-from datetime import UTC, datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
+
+# Standard LogRecord attributes; anything else on a record came in through `extra=`
+_RESERVED_LOGRECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "taskName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "exc_traceback",
+    }
+)
+
+
+# Checked once at import; a formatter built after stderr is redirected keeps this answer
+_STDERR_IS_TTY = sys.stderr.isatty()
+
+# Number of attributes set on every LogRecord, before any `extra=` fields are added
+_BASE_LOGRECORD_ATTR_COUNT = len(logging.makeLogRecord({}).__dict__)
+
+
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """Render the record's creation time as an ISO8601 UTC timestamp with millisecond precision."""
+    tm = time.gmtime(record.created)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{int(record.msecs):03d}Z"
+    )
+
+
+def _cached_exc_text(formatter: logging.Formatter, record: logging.LogRecord) -> str:
+    """
+    Return the record's formatted traceback, formatting it only the first time.
+
+    Follows the stdlib convention of caching the text in record.exc_text, so a record
+    passed through several formatters or handlers pays for the traceback once.
+    """
+    if not record.exc_text:
+        record.exc_text = formatter.formatException(record.exc_info)
+    return record.exc_text
+
+
+def _cached_exc_traceback(record: logging.LogRecord) -> list[str]:
+    """
+    Return traceback.format_exception() output for the record, computing it only once.
+
+    The list is kept on the record (in the reserved exc_traceback attribute) so repeated
+    JSON formatting of the same record reuses it, mirroring the exc_text cache above.
+    """
+    cached = record.__dict__.get("exc_traceback")
+    if cached is None:
+        cached = traceback.format_exception(*record.exc_info)
+        record.exc_traceback = cached
+    return cached
+
+
+@lru_cache(maxsize=1024)
+def _json_str(value: str | None) -> str:
+    """JSON-encode a string that recurs across records (logger, module and function names)."""
+    return orjson.dumps(value).decode("utf-8")
+
 
 class PlainTextFormatter(logging.Formatter):
     """
@@ -37,66 +120,38 @@ class PlainTextFormatter(logging.Formatter):
 
     def __init__(self, use_colors: bool = True):
         super().__init__()
-        self.use_colors = use_colors and sys.stderr.isatty()
+        self.use_colors = use_colors and _STDERR_IS_TTY
+        # Rendered level names, colored once up front when colors are enabled
+        self._level_repr = {
+            level: f"{color}{level}{self.RESET}" if self.use_colors else level for level, color in self.COLORS.items()
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         # Timestamp in ISO8601 UTC format
-        timestamp = datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds")
-        timestamp = timestamp.replace("+00:00", "Z")
+        timestamp = _format_timestamp(record)
 
         # Component name (module name)
         component = record.name
 
         # Log level with optional color
-        level = record.levelname
-        if self.use_colors:
-            color = self.COLORS.get(level, "")
-            level = f"{color}{level}{self.RESET}"
+        level = self._level_repr.get(record.levelname, record.levelname)
 
         # Base message
         message = record.getMessage()
 
         # Build the log line
-        log_parts = [f"[{timestamp}]", f"[{level}]", f"[{component}]", message]
+        log_line = f"[{timestamp}] [{level}] [{component}] {message}"
 
-        # Add extra fields if present
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "taskName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
-                extra_fields[key] = value
-
-        if extra_fields:
-            extra_str = " ".join([f"{k}={v}" for k, v in extra_fields.items()])
-            log_parts.append(f"| {extra_str}")
-
-        log_line = " ".join(log_parts)
+        # Add extra fields if present; a record carrying no more attributes than a bare
+        # LogRecord cannot have any, so the scan is skipped for plain log calls
+        if len(record.__dict__) > _BASE_LOGRECORD_ATTR_COUNT:
+            extra_str = " ".join(f"{k}={v}" for k, v in record.__dict__.items() if k not in _RESERVED_LOGRECORD_ATTRS)
+            if extra_str:
+                log_line = f"{log_line} | {extra_str}"
 
         # Add exception info if present
         if record.exc_info:
-            log_line += "\n" + self.formatException(record.exc_info)
+            log_line = f"{log_line}\n{_cached_exc_text(self, record)}"
 
         return log_line
 
@@ -112,8 +167,18 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         # Timestamp in ISO8601 UTC format
-        timestamp = datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds")
-        timestamp = timestamp.replace("+00:00", "Z")
+        timestamp = _format_timestamp(record)
+
+        # Records without extras or exceptions have a fixed key layout: write the keys
+        # literally and encode only the values, instead of building and serializing a dict
+        if not record.exc_info and len(record.__dict__) <= _BASE_LOGRECORD_ATTR_COUNT:
+            return (
+                f'{{"timestamp":"{timestamp}","level":{_json_str(record.levelname)},'
+                f'"component":{_json_str(record.name)},'
+                f'"message":{orjson.dumps(record.getMessage()).decode("utf-8")},'
+                f'"module":{_json_str(record.module)},"function":{_json_str(record.funcName)},'
+                f'"line":{record.lineno:d}}}'
+            )
 
         # Build the base log entry
         log_entry: dict[str, Any] = {
@@ -128,30 +193,7 @@ class JSONFormatter(logging.Formatter):
 
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "taskName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
+            if key not in _RESERVED_LOGRECORD_ATTRS:
                 log_entry[key] = value
 
         # Add exception info if present
@@ -159,36 +201,108 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info),
+                "traceback": _cached_exc_traceback(record),
             }
 
-        return json.dumps(log_entry, default=str)
+        try:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects a few values stdlib json accepts (e.g. integers wider than 64 bits)
+            return json.dumps(log_entry, default=str, separators=(",", ":"), ensure_ascii=False)
 
 
 class LevelBasedStreamHandler(logging.Handler):
     """
     Handler that sends INFO/DEBUG to stdout and WARNING/ERROR/CRITICAL to stderr.
     This is best practice for containerized applications.
+
+    With defer_flush=True records are only written to the stream buffers and reach the
+    streams on flush(), which lets a caller batch many records into a single write.
     """
 
-    def __init__(self, formatter: logging.Formatter):
+    terminator = "\n"
+
+    def __init__(self, formatter: logging.Formatter, defer_flush: bool = False):
         super().__init__()
         self.setFormatter(formatter)
+        self.defer_flush = defer_flush
+        self.stdout_stream = sys.stdout
+        self.stderr_stream = sys.stderr
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record)
+            stream = self.stdout_stream if record.levelno < logging.WARNING else self.stderr_stream
+            stream.write(msg + self.terminator)
+            if not self.defer_flush:
+                stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            self.stdout_stream.flush()
+            self.stderr_stream.flush()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps records intact for a listener in the same process.
 
-        # Create separate handlers for stdout and stderr
-        self.stdout_handler = logging.StreamHandler(sys.stdout)
-        self.stdout_handler.setFormatter(formatter)
-        self.stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    The stock prepare() pre-formats the message and drops exc_info so records can be pickled,
+    which would leave the JSON formatter without the structured exception. Records never leave
+    the process here, so only the message arguments are merged to freeze the message text.
+    """
 
-        self.stderr_handler = logging.StreamHandler(sys.stderr)
-        self.stderr_handler.setFormatter(formatter)
-        self.stderr_handler.addFilter(lambda record: record.levelno >= logging.WARNING)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-    def emit(self, record: logging.LogRecord) -> None:
-        if record.levelno < logging.WARNING:
-            self.stdout_handler.emit(record)
-        else:
-            self.stderr_handler.emit(record)
+
+class _BatchFlushingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers only once the queue has been drained.
+
+    A burst of records is written to the stream buffers and reaches stdout/stderr in one
+    flush, while a lone record is still flushed straight away.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._flush_handlers()
+            return self.queue.get(block)
+
+    def stop(self) -> None:
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream may already be closed, e.g. during interpreter shutdown
+                pass
+
+
+# Listener draining the log queue into the stream handler, set by configure_logging
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, flushing records still in the queue."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def configure_logging(
@@ -214,9 +328,19 @@ def configure_logging(
         formatter = JSONFormatter()
 
     # Create level-based stream handler
-    handler = LevelBasedStreamHandler(formatter)
+    handler = LevelBasedStreamHandler(formatter, defer_flush=True)
     handler.setLevel(log_level)
 
+    # Stream writes happen on a background listener thread so slow stdout/stderr
+    # consumers never block the thread that logged the record
+    global _queue_listener
+    _stop_queue_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    _queue_listener = _BatchFlushingQueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -225,7 +349,7 @@ def configure_logging(
     root_logger.handlers.clear()
 
     # Add our handler
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
 
     # Reduce noise from third-party libraries
     logging.getLogger("databases").setLevel(logging.WARNING)
@@ -233,14 +357,13 @@ def configure_logging(
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)  # Uvicorn access logs can be noisy
 
     # Log the configuration
-    logger = logging.getLogger(__name__)
-    logger.info(
+    log_if(
+        logging.getLogger(__name__),
+        logging.INFO,
         "Logging configured",
-        extra={
-            "mode": "development" if development_mode else "production",
-            "format": "plain_text" if development_mode else "json",
-            "level": level.upper(),
-        },
+        mode="development" if development_mode else "production",
+        format="plain_text" if development_mode else "json",
+        level=level.upper(),
     )
 
 
@@ -257,6 +380,24 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def log_if(logger: logging.Logger, level: int, msg: str, /, *args: Any, **extras: Any) -> None:
+    """
+    Log a message with structured extras only if the level is enabled.
+
+    Preferred over ``logger.log(..., extra={...})`` when the extras take work to
+    build: the level check runs before any LogRecord is created.
+
+    Args:
+        logger: Logger to emit through
+        level: Numeric log level (e.g. logging.DEBUG)
+        msg: Constant message, with %-style placeholders for args
+        *args: Arguments for the message placeholders
+        **extras: Structured fields attached to the record
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, msg, *args, extra=extras or None, stacklevel=2)
+
+
 # Auto-configure on import based on environment variables
 def _auto_configure() -> None:
     """Auto-configure logging based on environment variables."""
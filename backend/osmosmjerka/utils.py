@@ -1,10 +1,17 @@
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from io import BytesIO
+from types import MappingProxyType
+from xml.sax.saxutils import escape
 
 from docx import Document
-from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.oxml.table import CT_Tbl
 from docx.shared import Cm, Pt
 from osmosmjerka.logging_config import get_logger
 from PIL import Image, ImageDraw, ImageFont
@@ -12,13 +19,120 @@ from PIL import Image, ImageDraw, ImageFont
 logger = get_logger(__name__)
 
 
-def _shade_cell(cell_obj, fill_hex: str, pattern: str = "clear", pattern_color: str = "auto") -> None:
-    """Set a table cell's background fill/pattern (used for crossword blank/blocked cells)."""
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), pattern)
-    shd.set(qn("w:color"), pattern_color)
-    shd.set(qn("w:fill"), fill_hex)
-    cell_obj._tc.get_or_add_tcPr().append(shd)
+# DOCX export dimensions, converted once instead of on every cell or run
+_DOCX_WORD_SEARCH_CELL_WIDTH = Cm(0.8).twips
+_DOCX_CROSSWORD_CELL_WIDTH = Cm(1.0).twips
+
+# Character styles defined once in the export template: style id -> (font, size, bold, superscript).
+# Runs reference a style instead of repeating its formatting, which also keeps documents smaller.
+_DOCX_RUN_STYLES = {
+    "GridLetter": ("Courier New", Pt(12), True, False),
+    "CellNumber": ("Arial", Pt(6), False, True),
+    "PhraseList": ("Arial", Pt(11), True, False),
+    "ClueText": ("Arial", Pt(11), False, False),
+    "ClueHeading": (None, Pt(13), True, False),
+}
+
+
+def _docx_run_xml(text: str, style: str) -> str:
+    """Serialize a single text run in one of the template's character styles as WordprocessingML."""
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<w:r><w:rPr><w:rStyle w:val="{style}"/></w:rPr><w:t{space}>{escape(text)}</w:t></w:r>'
+
+
+@cache
+def _docx_template() -> bytes:
+    """python-docx's blank default document plus the export character styles, serialized once.
+
+    Opening these bytes is roughly twice as fast as Document(), which unpacks and
+    resolves the bundled template from disk on every call.
+    """
+    doc = Document()
+    for name, (font, size, bold, superscript) in _DOCX_RUN_STYLES.items():
+        style = doc.styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+        if font:
+            style.font.name = font
+        style.font.size = size
+        style.font.bold = bold
+        style.font.superscript = superscript or None
+    output = BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def _docx_paragraph_xml(runs: str = "", centered: bool = False) -> str:
+    """Wrap serialized runs in a `w:p` paragraph, optionally centered."""
+    props = '<w:pPr><w:jc w:val="center"/></w:pPr>' if centered else ""
+    return f"<w:p>{props}{runs}</w:p>"
+
+
+def _append_docx_paragraphs(doc: Document, paragraphs: list[str]) -> None:
+    """Parse serialized paragraphs in one go and append them to the end of the document body."""
+    wrapper = parse_xml(f"<w:body {nsdecls('w')}>{''.join(paragraphs)}</w:body>")
+    # The section properties must remain the body's last child
+    section_props = doc.element.body.sectPr
+    for paragraph in list(wrapper):
+        section_props.addprevious(paragraph)
+
+
+def _docx_grid_table(grid: list, is_crossword: bool, numbers: dict) -> CT_Tbl:
+    """Build the borderless, centered letter-grid table as a single `w:tbl` element.
+
+    The whole table is serialized in one pass and parsed once, the same way python-docx
+    builds new tables itself. Going through `table.cell(r, c)` instead re-walks every cell
+    of the table on each call, which makes populating a large grid quadratic in its size.
+    """
+    cell_width = _DOCX_CROSSWORD_CELL_WIDTH if is_crossword else _DOCX_WORD_SEARCH_CELL_WIDTH
+    if is_crossword:
+        # Gray diagonal-stripe pattern for non-playable squares.
+        blank_shading = '<w:shd w:val="diagStripe" w:color="808080" w:fill="D9D9D9"/>'
+    else:
+        blank_shading = '<w:shd w:val="clear" w:color="auto" w:fill="000000"/>'
+    cell_props = f'<w:tcPr><w:tcW w:type="dxa" w:w="{cell_width}"/></w:tcPr>'
+    blank_cell = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{cell_width}"/>{blank_shading}</w:tcPr><w:p/></w:tc>'
+    row_props = f'<w:trPr><w:trHeight w:val="{cell_width}"/></w:trPr>'
+
+    def text_cell(runs: str) -> str:
+        return f'<w:tc>{cell_props}<w:p><w:pPr><w:jc w:val="center"/></w:pPr>{runs}</w:p></w:tc>'
+
+    rows_xml = []
+    if is_crossword:
+        # A crossword is exported blank, for solving on paper — the answer
+        # letters aren't shown, only the clue numbers.
+        empty_cell = text_cell("")
+        for r, row in enumerate(grid):
+            cells_xml = []
+            for c, cell in enumerate(row):
+                if cell is None:
+                    cells_xml.append(blank_cell)
+                    continue
+                number = numbers.get((r, c))
+                cells_xml.append(text_cell(_docx_run_xml(number, "CellNumber")) if number else empty_cell)
+            rows_xml.append(f"<w:tr>{row_props}{''.join(cells_xml)}</w:tr>")
+    else:
+        # Word search cells differ only by letter; serialize each distinct letter once
+        letter_cells = {None: blank_cell}
+        for row in grid:
+            for cell in row:
+                if cell not in letter_cells:
+                    letter_cells[cell] = text_cell(_docx_run_xml(cell, "GridLetter"))
+        for row in grid:
+            rows_xml.append(f"<w:tr>{row_props}{''.join(map(letter_cells.__getitem__, row))}</w:tr>")
+
+    grid_cols = f'<w:gridCol w:w="{cell_width}"/>' * len(grid[0])
+    return parse_xml(
+        f"<w:tbl {nsdecls('w')}>"
+        "<w:tblPr>"
+        '<w:tblW w:type="auto" w:w="0"/>'
+        '<w:jc w:val="center"/>'
+        '<w:tblLayout w:type="fixed"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+        ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        "</w:tblPr>"
+        f"<w:tblGrid>{grid_cols}</w:tblGrid>"
+        f"{''.join(rows_xml)}"
+        "</w:tbl>"
+    )
 
 
 def _crop_crossword_grid(grid: list) -> tuple[list, int, int]:
@@ -79,18 +193,36 @@ def _crossword_clues(phrases: list) -> tuple[list[str], list[str]]:
     return [clue_text(p) for p in across], [clue_text(p) for p in down]
 
 
-def _add_docx_clue_section(doc: Document, label: str, lines: list[str]) -> None:
+@dataclass(frozen=True)
+class _PreparedPuzzle:
+    title: str
+    grid: list  # cropped to the used area for crosswords
+    is_crossword: bool
+    numbers: dict  # (row, col) in `grid` -> clue number label; crosswords only
+    across_lines: list[str]
+    down_lines: list[str]
+    phrase_words: list[str]  # uppercased phrases for the word search footer
+
+
+def _prepare_puzzle(category: str, grid: list, phrases: list, game_type: str) -> _PreparedPuzzle:
+    """Validate export input and derive everything both export formats render from it."""
+    if not category or not grid or not phrases:
+        raise ValueError("Category, grid, and phrases must be provided.")
+    if game_type != "crossword":
+        return _PreparedPuzzle(category.upper(), grid, False, {}, [], [], [w["phrase"].upper() for w in phrases])
+
+    grid, row_offset, col_offset = _crop_crossword_grid(grid)
+    # Clue numbers are keyed by coordinates in the full grid; shift them onto the cropped one
+    numbers = {(r - row_offset, c - col_offset): n for (r, c), n in _crossword_start_numbers(phrases).items()}
+    across_lines, down_lines = _crossword_clues(phrases)
+    return _PreparedPuzzle(category.upper(), grid, True, numbers, across_lines, down_lines, [])
+
+
+def _docx_clue_section_xml(label: str, lines: list[str]) -> list[str]:
     if not lines:
-        return
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run(label.upper())
-    heading_run.bold = True
-    heading_run.font.size = Pt(13)
-    for line in lines:
-        p = doc.add_paragraph(line)
-        for run in p.runs:
-            run.font.name = "Arial"
-            run.font.size = Pt(11)
+        return []
+    heading = _docx_paragraph_xml(_docx_run_xml(label.upper(), "ClueHeading"))
+    return [heading, *(_docx_paragraph_xml(_docx_run_xml(line, "ClueText")) for line in lines)]
 
 
 def export_to_docx(
@@ -119,121 +251,105 @@ def export_to_docx(
     Returns:
         bytes: The DOCX file content as bytes.
     """
-    if not category or not grid or not phrases:
-        raise ValueError("Category, grid, and phrases must be provided.")
-    is_crossword = game_type == "crossword"
-    row_offset = col_offset = 0
-    if is_crossword:
-        grid, row_offset, col_offset = _crop_crossword_grid(grid)
-    doc = Document()
+    puzzle = _prepare_puzzle(category, grid, phrases, game_type)
+    doc = Document(BytesIO(_docx_template()))
     # Uppercase header with category name, centered
-    heading = doc.add_heading(category.upper(), 0)
+    heading = doc.add_heading(puzzle.title, 0)
     heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # Letter grid, monospace font, centered, no borders
-    table = doc.add_table(rows=len(grid), cols=len(grid[0]))
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False  # Turn off auto-fit
-
-    # Remove all borders
-    tbl = table._tbl
-    for border in tbl.xpath(".//w:tblBorders"):
-        border.getparent().remove(border)
-
-    cell_dim = Cm(1.0) if is_crossword else Cm(0.8)
-    numbers = _crossword_start_numbers(phrases) if is_crossword else {}
-
-    for r, row in enumerate(grid):
-        for c, cell in enumerate(row):
-            cell_obj = table.cell(r, c)
-            cell_obj.width = cell_dim
-            if cell is None:
-                if is_crossword:
-                    # Gray diagonal-stripe pattern for non-playable squares.
-                    _shade_cell(cell_obj, "D9D9D9", pattern="diagStripe", pattern_color="808080")
-                else:
-                    _shade_cell(cell_obj, "000000")
-                continue
-            p = cell_obj.paragraphs[0]
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            number = numbers.get((r + row_offset, c + col_offset))
-            if number:
-                num_run = p.add_run(number)
-                num_run.font.superscript = True
-                num_run.font.name = "Arial"
-                num_run.font.size = Pt(6)
-            if is_crossword:
-                # A crossword is exported blank, for solving on paper — the answer
-                # letters aren't shown, only the clue numbers.
-                continue
-            letter_run = p.add_run(cell)
-            letter_run.font.name = "Courier New"
-            letter_run.font.size = Pt(12)
-            letter_run.bold = True  # Make grid letters bold
+    heading._p.addnext(_docx_grid_table(puzzle.grid, puzzle.is_crossword, puzzle.numbers))
 
-    # Set row height for uniform appearance
-    for row in table.rows:
-        row.height = cell_dim
+    paragraphs = [_docx_paragraph_xml()]  # Add a blank line for spacing
 
-    doc.add_paragraph()  # Add a blank line for spacing
-
-    if is_crossword:
-        across_lines, down_lines = _crossword_clues(phrases)
-        _add_docx_clue_section(doc, across_label, across_lines)
-        _add_docx_clue_section(doc, down_label, down_lines)
+    if puzzle.is_crossword:
+        paragraphs += _docx_clue_section_xml(across_label, puzzle.across_lines)
+        paragraphs += _docx_clue_section_xml(down_label, puzzle.down_lines)
     else:
-        # Convert phrases to uppercase and join them with commas
-        phrases_line = ", ".join(w["phrase"].upper() for w in phrases)
-        p = doc.add_paragraph(phrases_line)
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in p.runs:
-            run.font.name = "Arial"
-            run.font.size = Pt(11)
-            run.bold = True  # Make phrases bold
+        # Phrases joined with commas, bold and centered
+        phrases_line = ", ".join(puzzle.phrase_words)
+        paragraphs.append(_docx_paragraph_xml(_docx_run_xml(phrases_line, "PhraseList"), centered=True))
 
-    output = BytesIO()
-    doc.save(output)
-    return output.getvalue()
+    _append_docx_paragraphs(doc, paragraphs)
+
+    with BytesIO() as output:
+        doc.save(output)
+        return output.getvalue()
+
+
+# Bundled export fonts in order of preference, resolved once against the backend directory
+# rather than relative to whatever the working directory happens to be
+_FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts")
+_EXPORT_FONT_PATH = next(
+    (
+        path
+        for path in (os.path.join(_FONTS_DIR, "DejaVuSans-Bold.ttf"), os.path.join(_FONTS_DIR, "arialbd.ttf"))
+        if os.path.isfile(path)
+    ),
+    None,
+)
 
 
-def _load_export_fonts(cell_size: int) -> dict:
+@lru_cache(maxsize=32)
+def _truetype_font(path: str, size: int) -> ImageFont.FreeTypeFont | None:
+    """Load a TrueType font once per (path, size); None if the font file can't be loaded.
+
+    Failures are cached too, so a missing font file isn't probed again on every export.
+    """
     try:
-        return {
-            "title": ImageFont.truetype("fonts/DejaVuSans-Bold.ttf", 24),
-            "grid": ImageFont.truetype("fonts/DejaVuSans-Bold.ttf", max(18, cell_size // 2)),
-            "phrases": ImageFont.truetype("fonts/DejaVuSans-Bold.ttf", 16),
-            "header": ImageFont.truetype("fonts/DejaVuSans-Bold.ttf", 18),
-            "number": ImageFont.truetype("fonts/DejaVuSans-Bold.ttf", max(10, cell_size // 3)),
-        }
+        return ImageFont.truetype(path, size)
     except OSError:
-        try:
-            return {
-                "title": ImageFont.truetype("fonts/arialbd.ttf", 24),
-                "grid": ImageFont.truetype("fonts/arialbd.ttf", max(18, cell_size // 2)),
-                "phrases": ImageFont.truetype("fonts/arialbd.ttf", 16),
-                "header": ImageFont.truetype("fonts/arialbd.ttf", 18),
-                "number": ImageFont.truetype("fonts/arialbd.ttf", max(10, cell_size // 3)),
-            }
-        except OSError:
-            logger.warning("Could not load custom fonts, falling back to default font")
-            default = ImageFont.load_default()
-            return dict.fromkeys(("title", "grid", "phrases", "header", "number"), default)
-
-
-def _wrap_text_line(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> list[str]:
-    words = text.split(" ")
+        return None
+
+
+@cache
+def _default_font() -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """Pillow's built-in font, created once and shared by every fallback export."""
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=32)
+def _load_export_fonts(cell_size: int) -> Mapping[str, ImageFont.ImageFont | ImageFont.FreeTypeFont]:
+    """Resolve the PNG export's font set for a cell size, once per size.
+
+    Cell sizes are clamped to 30-50px, so only a handful of font sets ever exist;
+    the result is a read-only mapping shared by every export using that size.
+    """
+    sizes = {
+        "title": 24,
+        "grid": max(18, cell_size // 2),
+        "phrases": 16,
+        "header": 18,
+        "number": max(10, cell_size // 3),
+    }
+    if _EXPORT_FONT_PATH:
+        fonts = {name: _truetype_font(_EXPORT_FONT_PATH, size) for name, size in sizes.items()}
+        if all(font is not None for font in fonts.values()):
+            return MappingProxyType(fonts)
+    logger.warning("Could not load custom fonts, falling back to default font")
+    return MappingProxyType(dict.fromkeys(sizes, _default_font()))
+
+
+def _wrap_text(items: list[str], separator: str, font, max_width: int) -> list[str]:
+    """Greedily pack items into lines no wider than max_width, joined by separator.
+
+    Each item and the separator are measured once and their advance widths summed,
+    instead of re-measuring every growing candidate line. An item wider than
+    max_width on its own still gets a line of its own.
+    """
+    separator_width = font.getlength(separator)
     lines: list[str] = []
-    current = ""
-    for word in words:
-        test = f"{current} {word}".strip()
-        bbox = draw.textbbox((0, 0), test, font=font)
-        if bbox[2] - bbox[0] <= max_width or not current:
-            current = test
-        else:
-            lines.append(current)
-            current = word
+    current: list[str] = []
+    current_width = 0.0
+    for item in items:
+        width = font.getlength(item)
+        if current and current_width + separator_width + width > max_width:
+            lines.append(separator.join(current))
+            current = []
+        current_width = current_width + separator_width + width if current else width
+        current.append(item)
     if current:
-        lines.append(current)
+        lines.append(separator.join(current))
     return lines
 
 
@@ -274,13 +390,10 @@ def export_to_png(
     Returns:
         bytes: The PNG file content as bytes.
     """
-    if not category or not grid or not phrases:
-        raise ValueError("Category, grid, and phrases must be provided.")
-
-    is_crossword = game_type == "crossword"
-    row_offset = col_offset = 0
-    if is_crossword:
-        grid, row_offset, col_offset = _crop_crossword_grid(grid)
+    puzzle = _prepare_puzzle(category, grid, phrases, game_type)
+    grid = puzzle.grid
+    is_crossword = puzzle.is_crossword
+    numbers = puzzle.numbers
 
     grid_rows = len(grid)
     grid_cols = len(grid[0])
@@ -292,23 +405,20 @@ def export_to_png(
     image_width = max(grid_width + (2 * margin), 700) if is_crossword else grid_width + (2 * margin)
 
     fonts = _load_export_fonts(cell_size)
-    numbers = _crossword_start_numbers(phrases) if is_crossword else {}
 
     # Crossword clue lines (numbered, split Across/Down) need to be measured and
     # word-wrapped up front so the image can be sized to fit them, unlike word
     # search's short comma-joined phrase list which fits a fixed-height footer.
-    measurer = ImageDraw.Draw(Image.new("RGB", (1, 1)))
     line_height = 22
     render_lines: list[tuple[str, str]] = []  # (text, "header" | "clue")
     if is_crossword:
         max_clue_width = image_width - (2 * margin)
-        across_lines, down_lines = _crossword_clues(phrases)
-        for label, lines in ((across_label, across_lines), (down_label, down_lines)):
+        for label, lines in ((across_label, puzzle.across_lines), (down_label, puzzle.down_lines)):
             if not lines:
                 continue
             render_lines.append((label.upper(), "header"))
             for line in lines:
-                for wrapped in _wrap_text_line(measurer, line, fonts["phrases"], max_clue_width):
+                for wrapped in _wrap_text(line.split(" "), " ", fonts["phrases"], max_clue_width):
                     render_lines.append((wrapped, "clue"))
         phrases_height = 30 + len(render_lines) * line_height + 8
     else:
@@ -319,7 +429,7 @@ def export_to_png(
     draw = ImageDraw.Draw(img)
 
     # Draw title
-    title_text = category.upper()
+    title_text = puzzle.title
     title_bbox = draw.textbbox((0, 0), title_text, font=fonts["title"])
     title_width = title_bbox[2] - title_bbox[0]
     title_x = (image_width - title_width) // 2
@@ -329,6 +439,18 @@ def export_to_png(
     grid_start_y = margin + title_height
     grid_start_x = (image_width - grid_width) // 2
 
+    # Rasterize each distinct letter once; the grid repeats a small alphabet many times,
+    # so every cell just stamps a cached glyph bitmap instead of laying out text again
+    letter_glyphs = {}
+    if not is_crossword:
+        for letter in {cell for row in grid for cell in row if cell is not None}:
+            left, top, right, bottom = draw.textbbox((0, 0), letter, font=fonts["grid"])
+            glyph = Image.new("L", (max(1, right - left), max(1, bottom - top)))
+            ImageDraw.Draw(glyph).text((-left, -top), letter, fill=255, font=fonts["grid"])
+            # Centered in the cell, shifted by the glyph's bearing like draw.text would
+            offset = ((cell_size - (right - left)) // 2 + left, (cell_size - (bottom - top)) // 2 + top)
+            letter_glyphs[letter] = (glyph, offset)
+
     for i, row in enumerate(grid):
         for j, cell in enumerate(row):
             x = grid_start_x + (j * cell_size)
@@ -341,24 +463,31 @@ def export_to_png(
                     draw.rectangle([x, y, x + cell_size, y + cell_size], fill="black")
                 continue
 
-            # Draw cell border
-            draw.rectangle([x, y, x + cell_size, y + cell_size], outline="black", width=1)
-
             if is_crossword:
+                # Crossword borders go around letter cells only, so they're drawn per cell
+                draw.rectangle([x, y, x + cell_size, y + cell_size], outline="black", width=1)
                 # A crossword is exported blank, for solving on paper — the answer
                 # letters aren't shown, only the clue numbers.
-                number = numbers.get((i + row_offset, j + col_offset))
+                number = numbers.get((i, j))
                 if number:
                     draw.text((x + 2, y + 1), number, fill="black", font=fonts["number"])
                 continue
 
             # Draw cell text
-            text_bbox = draw.textbbox((0, 0), cell, font=fonts["grid"])
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            text_x = x + (cell_size - text_width) // 2
-            text_y = y + (cell_size - text_height) // 2
-            draw.text((text_x, text_y), cell, fill="black", font=fonts["grid"])
+            glyph, (offset_x, offset_y) = letter_glyphs[cell]
+            draw.bitmap((x + offset_x, y + offset_y), glyph, fill="black")
+
+    if not is_crossword:
+        # Every word search cell is bordered, so the borders form a full lattice:
+        # draw it as grid_rows + grid_cols + 2 lines instead of one rectangle per cell
+        grid_end_x = grid_start_x + grid_width
+        grid_end_y = grid_start_y + grid_height
+        for i in range(grid_rows + 1):
+            y = grid_start_y + i * cell_size
+            draw.line([(grid_start_x, y), (grid_end_x, y)], fill="black")
+        for j in range(grid_cols + 1):
+            x = grid_start_x + j * cell_size
+            draw.line([(x, grid_start_y), (x, grid_end_y)], fill="black")
 
     phrases_y = grid_start_y + grid_height + 30
 
@@ -376,34 +505,26 @@ def export_to_png(
             first = False
     else:
         # Draw phrases, centered, wrapped into multiple comma-joined lines
-        phrases_text = ", ".join(w["phrase"].upper() for w in phrases)
-        max_width = image_width - (2 * margin)
-        phrases_lines = []
-        current_line = ""
-
-        for phrase in phrases_text.split(", "):
-            test_line = current_line + (", " if current_line else "") + phrase
-            test_bbox = draw.textbbox((0, 0), test_line, font=fonts["phrases"])
-            test_width = test_bbox[2] - test_bbox[0]
-
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    phrases_lines.append(current_line)
-                current_line = phrase
-
-        if current_line:
-            phrases_lines.append(current_line)
-
-        for i, line in enumerate(phrases_lines):
-            line_bbox = draw.textbbox((0, 0), line, font=fonts["phrases"])
-            line_width = line_bbox[2] - line_bbox[0]
-            line_x = (image_width - line_width) // 2
-            line_y = phrases_y + (i * 20)
-            draw.text((line_x, line_y), line, fill="black", font=fonts["phrases"])
-
-    # Save to BytesIO
-    buffer = BytesIO()
-    img.save(buffer, format="PNG")
-    return buffer.getvalue()
+        phrases_lines = _wrap_text(puzzle.phrase_words, ", ", fonts["phrases"], image_width - (2 * margin))
+
+        # Draw all lines in one call, centered on the image; spacing keeps a 20px line pitch
+        line_spacing = 20 - draw.textbbox((0, 0), "A", font=fonts["phrases"])[3]
+        draw.multiline_text(
+            (image_width // 2, phrases_y),
+            "\n".join(phrases_lines),
+            fill="black",
+            font=fonts["phrases"],
+            anchor="ma",
+            spacing=line_spacing,
+            align="center",
+        )
+
+    # Save to BytesIO, then free the pixel buffers now rather than whenever the GC gets to them
+    try:
+        with BytesIO() as buffer:
+            img.save(buffer, format="PNG")
+            return buffer.getvalue()
+    finally:
+        img.close()
+        for glyph, _ in letter_glyphs.values():
+            glyph.close()
@@ -1,11 +1,74 @@
+import asyncio
 import os
 import sys
 
 import pytest
+import starlette.staticfiles
+from fastapi.testclient import TestClient
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
+# Patch StaticFiles before the app is first imported, so the test session never mounts real static files
+class DummyStaticFiles:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, scope):
+        pass
+
+
+# Only patch ahead of the first import: once the app module is loaded (e.g. by a plugin or an
+# earlier conftest), swapping the class again would just churn without affecting the app
+if "osmosmjerka.app" not in sys.modules:
+    starlette.staticfiles.StaticFiles = DummyStaticFiles
+
+from osmosmjerka.app import app  # noqa: E402
+
+
+def pytest_asyncio_loop_factories(config, item):
+    # Run async tests on uvloop where uvicorn[standard] installs it (not Windows); otherwise use the default loop
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    # The app module is imported once per session; every test file shares this instance
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    # Test files that need their own app or per-test state override this with a local fixture
+    return TestClient(app_instance)
+
+
+@pytest.fixture(scope="module")
+def module_client(request):
+    """One entered TestClient per test module, built on that module's own ``app``.
+
+    Entering the client once keeps a single event loop portal for the whole module instead
+    of starting a fresh one for every request, as an un-entered TestClient does.
+    """
+    with TestClient(request.module.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth_mod(monkeypatch):
+    # Patch the auth module's env-derived globals directly; reloading it per test re-runs all its imports
+    import osmosmjerka.auth as module
+
+    monkeypatch.setattr(module, "SECRET_KEY", "testsecret")
+    monkeypatch.setattr(module, "ROOT_ADMIN_USERNAME", "admin")
+    monkeypatch.setattr(module, "ROOT_ADMIN_PASSWORD_HASH", "hash")
+    return module
+
+
 @pytest.fixture
 def mock_admin_user():
     return {"username": "admin", "role": "administrative", "id": 1, "is_active": True}
@@ -10,11 +10,20 @@ app = FastAPI()
 app.include_router(router)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    # Clear any existing overrides before each test
+    # One client for the whole module; per-test state is reset by the fixture below
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client_state(client):
+    # Each test starts without dependency overrides or cookies left behind by another test
+    app.dependency_overrides = {}
+    client.cookies.clear()
+    yield
     app.dependency_overrides = {}
-    return TestClient(app)
 
 
 @pytest.fixture
@@ -309,16 +318,23 @@ def test_upload_text_with_tab_separator_auto_detect(
 
 
 # Test export functionality
-@patch("osmosmjerka.database.db_manager.get_phrases_for_admin")
+async def _async_rows(rows):
+    for row in rows:
+        yield row
+
+
+@patch("osmosmjerka.database.db_manager.iter_phrases_for_admin")
 def test_export_data(mock_get_phrases, client, mock_admin_user):
     """Test exporting data as CSV — uses the admin (unfiltered) fetch so ignored categories
     are still exported."""
     # Override the dependency
     app.dependency_overrides[require_admin_access] = lambda: mock_admin_user
-    mock_get_phrases.return_value = [
-        {"categories": "Spanish", "phrase": "hola", "translation": "hello"},
-        {"categories": "French", "phrase": "bonjour", "translation": "hello\nhi"},
-    ]
+    mock_get_phrases.side_effect = lambda *args: _async_rows(
+        [
+            {"categories": "Spanish", "phrase": "hola", "translation": "hello"},
+            {"categories": "French", "phrase": "bonjour", "translation": "hello\nhi"},
+        ]
+    )
 
     response = client.get("/admin/export?category=Spanish")
 
@@ -333,15 +349,17 @@ def test_export_data(mock_get_phrases, client, mock_admin_user):
     mock_get_phrases.assert_called_once_with(None, "Spanish")
 
 
-@patch("osmosmjerka.database.db_manager.get_phrases_for_admin")
+@patch("osmosmjerka.database.db_manager.iter_phrases_for_admin")
 def test_export_data_all_categories(mock_get_phrases, client, mock_admin_user):
     """Test exporting all categories"""
     # Override the dependency
     app.dependency_overrides[require_admin_access] = lambda: mock_admin_user
-    mock_get_phrases.return_value = [
-        {"categories": "Spanish", "phrase": "hola", "translation": "hello"},
-        {"categories": "French", "phrase": "bonjour", "translation": "hello"},
-    ]
+    mock_get_phrases.side_effect = lambda *args: _async_rows(
+        [
+            {"categories": "Spanish", "phrase": "hola", "translation": "hello"},
+            {"categories": "French", "phrase": "bonjour", "translation": "hello"},
+        ]
+    )
 
     response = client.get("/admin/export")
 
@@ -351,6 +369,60 @@ def test_export_data_all_categories(mock_get_phrases, client, mock_admin_user):
     mock_get_phrases.assert_called_once_with(None, None)
 
 
+@patch("osmosmjerka.admin_api.phrases.EXPORT_CSV_BATCH_ROWS", 2)
+@patch("osmosmjerka.database.db_manager.iter_phrases_for_admin")
+def test_export_data_streams_rows_in_batches(mock_iter_phrases, client, mock_admin_user):
+    """Rows spanning several batches are all exported, in order, with line breaks encoded"""
+    app.dependency_overrides[require_admin_access] = lambda: mock_admin_user
+    rows = [{"categories": "Cat", "phrase": f"phrase{i}", "translation": f"line{i}\nmore"} for i in range(5)]
+    mock_iter_phrases.side_effect = lambda *args: _async_rows(rows)
+
+    response = client.get("/admin/export")
+
+    assert response.status_code == 200
+    lines = response.content.decode("utf-8").splitlines()
+    assert lines[0] == "categories;phrase;translation"
+    assert lines[1:] == [f"Cat;phrase{i};line{i}<br>more" for i in range(5)]
+
+
+@patch("osmosmjerka.database.db_manager.iter_phrases_for_admin")
+def test_export_data_query_failure_returns_error(mock_iter_phrases, client, mock_admin_user):
+    """A query that fails before any rows are sent still produces a 400 error response"""
+    app.dependency_overrides[require_admin_access] = lambda: mock_admin_user
+
+    async def failing_rows(*args):
+        raise RuntimeError("connection lost")
+        yield  # pragma: no cover - makes this an async generator
+
+    mock_iter_phrases.side_effect = failing_rows
+
+    response = client.get("/admin/export")
+
+    assert response.status_code == 400
+    assert "Export failed: connection lost" in response.content.decode("utf-8")
+
+
+@patch("osmosmjerka.admin_api.phrases.logger")
+@patch("osmosmjerka.admin_api.phrases.EXPORT_CSV_BATCH_ROWS", 1)
+@patch("osmosmjerka.database.db_manager.iter_phrases_for_admin")
+def test_export_data_mid_stream_failure_is_logged(mock_iter_phrases, mock_logger, client, mock_admin_user):
+    """A query failing after the first batch is logged and aborts the response instead of ending it"""
+    app.dependency_overrides[require_admin_access] = lambda: mock_admin_user
+
+    async def failing_rows(*args):
+        yield {"categories": "Cat", "phrase": "phrase0", "translation": "line0"}
+        yield {"categories": "Cat", "phrase": "phrase1", "translation": "line1"}
+        raise RuntimeError("connection lost")
+
+    mock_iter_phrases.side_effect = failing_rows
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        client.get("/admin/export")
+
+    mock_logger.exception.assert_called_once()
+    assert mock_logger.exception.call_args.args[0] == "Export failed mid-stream"
+
+
 # Test user management endpoints (root admin only)
 @patch("osmosmjerka.database.db_manager.get_accounts")
 @patch("osmosmjerka.database.db_manager.get_account_count")
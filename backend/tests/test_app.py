@@ -1,37 +1,13 @@
-# isort: skip_file
-import sys
 from unittest.mock import AsyncMock
 
-import pytest
-
-import starlette.staticfiles
-
 import osmosmjerka.app as app_module
-from osmosmjerka.app import app, ensure_demo_account
-from fastapi.testclient import TestClient
-
-
-# Patch StaticFiles before importing app
-class DummyStaticFiles:
-    def __init__(self, *args, **kwargs):
-        pass
-
-    def __call__(self, scope):
-        pass
-
-
-starlette.staticfiles.StaticFiles = DummyStaticFiles
-sys.modules.pop("osmosmjerka.app", None)
-
-
-@pytest.fixture
-def client():
-    return TestClient(app)
+import pytest
+from osmosmjerka.app import ensure_demo_account
 
 
-def test_main_app_structure():
+def test_main_app_structure(app_instance):
     """Test that the main app imports correctly and includes the expected routers"""
-    from osmosmjerka.app import app
+    app = app_instance
 
     # Check that the app object exists and is a FastAPI instance
     assert app is not None
@@ -43,7 +19,7 @@ def test_main_app_structure():
 
 def test_game_api_module_exists():
     """Test that the game_api module can be imported"""
-    from osmosmjerka.game_api import router, get_grid_size_and_num_phrases
+    from osmosmjerka.game_api import get_grid_size_and_num_phrases, router
 
     assert router is not None
     assert hasattr(router, "prefix")
@@ -60,38 +36,44 @@ def test_admin_api_module_exists():
     assert router.prefix == "/admin"
 
 
-def test_get_grid_size_and_num_phrases_function():
+@pytest.mark.parametrize(
+    "phrase_count,difficulty,expected",
+    [
+        (10, "easy", (10, 7)),
+        (10, "medium", (13, 10)),
+        (15, "hard", (15, 12)),
+        (20, "very_hard", (20, 16)),
+        # Unknown difficulty defaults to easy
+        (10, "unknown", (10, 7)),
+    ],
+    ids=["easy", "medium", "hard", "very_hard", "unknown"],
+)
+def test_get_grid_size_and_num_phrases_function(phrase_count, difficulty, expected):
     """Test the helper function works correctly"""
     from osmosmjerka.game_api import get_grid_size_and_num_phrases
 
-    # Test easy difficulty
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "easy")
-    assert size == 10 and num_phrases == 7
+    assert get_grid_size_and_num_phrases([{"phrase": "a"}] * phrase_count, difficulty) == expected
 
-    # Test medium difficulty (new)
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "medium")
-    assert size == 13 and num_phrases == 10
 
-    # Test hard difficulty (previously medium)
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 15, "hard")
-    assert size == 15 and num_phrases == 12
+@pytest.fixture
+def mock_db(monkeypatch):
+    db = AsyncMock()
+    monkeypatch.setattr(app_module, "db_manager", db)
+    return db
 
-    # Test very_hard difficulty (previously hard)
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 20, "very_hard")
-    assert size == 20 and num_phrases == 16
 
-    # Test unknown difficulty defaults to easy
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "unknown")
-    assert size == 10 and num_phrases == 7
+@pytest.fixture
+def demo_credentials(monkeypatch):
+    def set_credentials(username, password_hash):
+        monkeypatch.setattr(app_module, "DEMO_USERNAME", username)
+        monkeypatch.setattr(app_module, "DEMO_PASSWORD_HASH", password_hash)
+
+    return set_credentials
 
 
-@pytest.mark.asyncio
-async def test_ensure_demo_account_noop_when_unconfigured(monkeypatch):
+async def test_ensure_demo_account_noop_when_unconfigured(demo_credentials, mock_db):
     """Prod (and any env that just doesn't set these two vars) must never get a demo account."""
-    monkeypatch.setattr(app_module, "DEMO_USERNAME", "")
-    monkeypatch.setattr(app_module, "DEMO_PASSWORD_HASH", "")
-    mock_db = AsyncMock()
-    monkeypatch.setattr(app_module, "db_manager", mock_db)
+    demo_credentials("", "")
 
     await ensure_demo_account()()
 
@@ -99,13 +81,9 @@ async def test_ensure_demo_account_noop_when_unconfigured(monkeypatch):
     mock_db.create_account.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_ensure_demo_account_creates_when_missing(monkeypatch):
-    monkeypatch.setattr(app_module, "DEMO_USERNAME", "demo")
-    monkeypatch.setattr(app_module, "DEMO_PASSWORD_HASH", "hashed-demo-pw")
-    mock_db = AsyncMock()
+async def test_ensure_demo_account_creates_when_missing(demo_credentials, mock_db):
+    demo_credentials("demo", "hashed-demo-pw")
     mock_db.get_account_by_username.return_value = None
-    monkeypatch.setattr(app_module, "db_manager", mock_db)
 
     await ensure_demo_account()()
 
@@ -118,13 +96,9 @@ async def test_ensure_demo_account_creates_when_missing(monkeypatch):
     mock_db.update_account.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_ensure_demo_account_refreshes_stale_password_hash(monkeypatch):
-    monkeypatch.setattr(app_module, "DEMO_USERNAME", "demo")
-    monkeypatch.setattr(app_module, "DEMO_PASSWORD_HASH", "new-hash")
-    mock_db = AsyncMock()
+async def test_ensure_demo_account_refreshes_stale_password_hash(demo_credentials, mock_db):
+    demo_credentials("demo", "new-hash")
     mock_db.get_account_by_username.return_value = {"id": 7, "password_hash": "old-hash"}
-    monkeypatch.setattr(app_module, "db_manager", mock_db)
 
     await ensure_demo_account()()
 
@@ -132,15 +106,29 @@ async def test_ensure_demo_account_refreshes_stale_password_hash(monkeypatch):
     mock_db.update_account.assert_called_once_with(7, password_hash="new-hash")
 
 
-@pytest.mark.asyncio
-async def test_ensure_demo_account_leaves_matching_account_untouched(monkeypatch):
-    monkeypatch.setattr(app_module, "DEMO_USERNAME", "demo")
-    monkeypatch.setattr(app_module, "DEMO_PASSWORD_HASH", "same-hash")
-    mock_db = AsyncMock()
+async def test_ensure_demo_account_leaves_matching_account_untouched(demo_credentials, mock_db):
+    demo_credentials("demo", "same-hash")
     mock_db.get_account_by_username.return_value = {"id": 7, "password_hash": "same-hash"}
-    monkeypatch.setattr(app_module, "db_manager", mock_db)
 
     await ensure_demo_account()()
 
     mock_db.create_account.assert_not_called()
     mock_db.update_account.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "path,expected_status",
+    [
+        ("/some/random/path", 302),
+        ("/api/something", 404),
+        ("/admin/something", 404),
+        ("/favicon.ico", 404),
+    ],
+)
+def test_serve_spa_routing(client, monkeypatch, path, expected_status):
+    """Unknown API and static paths 404; everything else goes to the SPA (the dev server redirect here)"""
+    monkeypatch.setattr(app_module, "DEVELOPMENT_MODE", True)
+
+    response = client.get(path, follow_redirects=False)
+
+    assert response.status_code == expected_status
@@ -1,29 +1,30 @@
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
 
+import osmosmjerka.auth as auth_mod
 import pytest
-from fastapi import HTTPException, Request
+from fastapi import HTTPException
 from jose import jwt
 
 
-class DummyRequest(MagicMock):
+class DummyRequest:
     def __init__(self, token):
-        super().__init__(spec=Request)
         self.headers = {"Authorization": token}
 
 
-def test_create_access_token_and_verify(monkeypatch):
-    # Patch env vars and reload module-level vars
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    monkeypatch.setenv("ADMIN_PASSWORD_HASH", "hash")
-    # Reload module-level vars
-    import importlib
+# Every test here runs against the secret and root admin credentials patched in by auth_mod
+pytestmark = pytest.mark.usefixtures("auth_mod")
 
-    import osmosmjerka.auth as auth_mod
 
-    importlib.reload(auth_mod)
+@pytest.fixture(scope="module")
+def admin_token():
+    """Root admin token, encoded once with the same settings the auth_mod fixture patches in."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_mod, "SECRET_KEY", "testsecret")
+        mp.setattr(auth_mod, "ROOT_ADMIN_USERNAME", "admin")
+        return auth_mod.create_access_token({"sub": "admin"})
 
+
+def test_create_access_token_and_verify():
     data = {"sub": "admin"}
     token = auth_mod.create_access_token(data)
     assert isinstance(token, str)
@@ -32,35 +33,19 @@ def test_create_access_token_and_verify(monkeypatch):
 
 
 def test_create_access_token_missing_secret(monkeypatch):
-    import osmosmjerka.auth as auth_mod
-
     monkeypatch.setattr(auth_mod, "SECRET_KEY", "")
     with pytest.raises(HTTPException) as exc:
         auth_mod.create_access_token({"sub": "admin"})
     assert exc.value.status_code == 500
 
 
-def test_verify_token_invalid_token(monkeypatch):
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    import importlib
-
-    import osmosmjerka.auth as auth_mod
-
-    importlib.reload(auth_mod)
+def test_verify_token_invalid_token():
     with pytest.raises(HTTPException) as exc:
         auth_mod.verify_token("not.a.jwt")
     assert exc.value.status_code == 401
 
 
-def test_verify_token_wrong_user(monkeypatch):
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    import importlib
-
-    import osmosmjerka.auth as auth_mod
-
-    importlib.reload(auth_mod)
+def test_verify_token_wrong_user():
     # Create token with wrong username and explicit role/user_id
     token = jwt.encode(
         {"sub": "notadmin", "role": "user", "user_id": 123, "exp": datetime.now(UTC) + timedelta(minutes=5)},
@@ -71,47 +56,21 @@ def test_verify_token_wrong_user(monkeypatch):
     assert auth_mod.verify_token(token) == {"id": 123, "role": "user", "username": "notadmin"}
 
 
-@pytest.mark.asyncio
-async def test_get_current_user_success(monkeypatch):
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    import importlib
-
-    import osmosmjerka.auth as auth_mod
-
-    importlib.reload(auth_mod)
-    token = auth_mod.create_access_token({"sub": "admin"})
-    req = DummyRequest(f"Bearer {token}")
+async def test_get_current_user_success(admin_token):
+    req = DummyRequest(f"Bearer {admin_token}")
     result = await auth_mod.get_current_user(req)
     assert result == {"id": 0, "role": "root_admin", "username": "admin"}
 
 
-@pytest.mark.asyncio
-async def test_get_current_user_missing_header(monkeypatch):
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    import importlib
-
-    import osmosmjerka.auth as auth_mod
-
-    importlib.reload(auth_mod)
+async def test_get_current_user_missing_header():
     req = DummyRequest("")
     with pytest.raises(HTTPException) as exc:
         await auth_mod.get_current_user(req)
     assert exc.value.status_code == 401
 
 
-@pytest.mark.asyncio
-async def test_get_current_user_invalid_prefix(monkeypatch):
-    monkeypatch.setenv("ADMIN_SECRET_KEY", "testsecret")
-    monkeypatch.setenv("ADMIN_USERNAME", "admin")
-    import importlib
-
-    import osmosmjerka.auth as auth_mod
-
-    importlib.reload(auth_mod)
-    token = auth_mod.create_access_token({"sub": "admin"})
-    req = DummyRequest(f"Token {token}")
+async def test_get_current_user_invalid_prefix(admin_token):
+    req = DummyRequest(f"Token {admin_token}")
     with pytest.raises(HTTPException) as exc:
         await auth_mod.get_current_user(req)
     assert exc.value.status_code == 401
@@ -1,8 +1,9 @@
 """Tests for the cache module."""
 
-import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import osmosmjerka.cache as cache_module
 import pytest
 from osmosmjerka.cache import (
     AsyncLRUCache,
@@ -13,37 +14,47 @@ from osmosmjerka.cache import (
 )
 
 
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual clock for the cache module: tests advance clock.now instead of sleeping."""
+    fake = SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def cache():
+    """A fresh cache for every test."""
+    return AsyncLRUCache(maxsize=10, ttl=300)
+
+
 class TestAsyncLRUCache:
     """Test cases for AsyncLRUCache class."""
 
-    def test_get_returns_none_for_missing_key(self):
+    def test_get_returns_none_for_missing_key(self, cache):
         """Get returns None when key doesn't exist."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         assert cache.get("nonexistent") is None
 
-    def test_set_and_get_basic(self):
+    def test_set_and_get_basic(self, cache):
         """Basic set and get operation works."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
-    def test_ttl_expiration(self):
+    def test_ttl_expiration(self, clock):
         """Cache entries expire after TTL."""
         cache = AsyncLRUCache(maxsize=10, ttl=1)  # 1 second TTL
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
-        # Wait for TTL to expire
-        time.sleep(1.1)
+        # Move past the TTL
+        clock.now += 1.1
         assert cache.get("key1") is None
 
     def test_maxsize_eviction(self):
         """Oldest entry is evicted when cache is full."""
         cache = AsyncLRUCache(maxsize=3, ttl=300)
         cache.set("key1", "value1")
-        time.sleep(0.01)  # Ensure different timestamps
         cache.set("key2", "value2")
-        time.sleep(0.01)
         cache.set("key3", "value3")
 
         # Cache is now full, adding a new entry should evict key1 (oldest)
@@ -54,9 +65,22 @@ class TestAsyncLRUCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
-    def test_invalidate_all(self):
+    def test_overwrite_refreshes_age_and_keeps_others(self):
+        """Re-setting a key in a full cache neither evicts another entry nor keeps its old age."""
+        cache = AsyncLRUCache(maxsize=3, ttl=300)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")
+
+        cache.set("key1", "value1b")  # Overwrite, not a new entry
+        assert cache.get("key2") == "value2"
+
+        cache.set("key4", "value4")  # key2 is now the oldest
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "value1b"
+
+    def test_invalidate_all(self, cache):
         """Invalidating without pattern clears all entries."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         cache.set("key1", "value1")
         cache.set("key2", "value2")
 
@@ -65,9 +89,8 @@ class TestAsyncLRUCache:
         assert cache.get("key1") is None
         assert cache.get("key2") is None
 
-    def test_invalidate_with_pattern(self):
+    def test_invalidate_with_pattern(self, cache):
         """Invalidating with pattern only removes matching keys."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         cache.set("user_1_data", "data1")
         cache.set("user_2_data", "data2")
         cache.set("category_1", "cat1")
@@ -78,9 +101,8 @@ class TestAsyncLRUCache:
         assert cache.get("user_2_data") is None
         assert cache.get("category_1") == "cat1"
 
-    def test_set_overwrites_existing(self):
+    def test_set_overwrites_existing(self, cache):
         """Setting a key that exists overwrites the value."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         cache.set("key1", "old_value")
         cache.set("key1", "new_value")
 
@@ -117,7 +139,7 @@ class TestRateLimiter:
         # user2 should still be allowed
         assert limiter.is_allowed("user2", max_requests=3, window_seconds=60) is True
 
-    def test_window_reset(self):
+    def test_window_reset(self, clock):
         """Requests are allowed again after window expires."""
         limiter = RateLimiter()
 
@@ -127,57 +149,39 @@ class TestRateLimiter:
 
         assert limiter.is_allowed("user1", max_requests=3, window_seconds=1) is False
 
-        # Wait for window to expire
-        time.sleep(1.1)
+        # Move past the window
+        clock.now += 1.1
         assert limiter.is_allowed("user1", max_requests=3, window_seconds=1) is True
 
 
 class TestGetClientIp:
     """Test cases for _get_client_ip helper function."""
 
-    def test_x_forwarded_for_single_ip(self):
-        """Extracts IP from X-Forwarded-For header."""
-        request = MagicMock()
-        request.headers = {"X-Forwarded-For": "192.168.1.1"}
-        assert _get_client_ip(request) == "192.168.1.1"
-
-    def test_x_forwarded_for_multiple_ips(self):
-        """Takes first IP from X-Forwarded-For header."""
-        request = MagicMock()
-        request.headers = {"X-Forwarded-For": "192.168.1.1, 10.0.0.1, 172.16.0.1"}
-        assert _get_client_ip(request) == "192.168.1.1"
-
-    def test_x_real_ip(self):
-        """Falls back to X-Real-IP header."""
-        request = MagicMock()
-        request.headers = {"X-Real-IP": "10.0.0.5"}
-        assert _get_client_ip(request) == "10.0.0.5"
-
-    def test_x_forwarded_for_takes_priority(self):
-        """X-Forwarded-For takes priority over X-Real-IP."""
-        request = MagicMock()
-        request.headers = {"X-Forwarded-For": "192.168.1.1", "X-Real-IP": "10.0.0.5"}
-        assert _get_client_ip(request) == "192.168.1.1"
-
-    def test_falls_back_to_client_host(self):
-        """Falls back to request.client.host when no headers."""
-        request = MagicMock()
-        request.headers = {}
-        request.client.host = "127.0.0.1"
-        assert _get_client_ip(request) == "127.0.0.1"
-
-    def test_returns_unknown_when_no_client(self):
-        """Returns 'unknown' when no client info available."""
-        request = MagicMock()
-        request.headers = {}
-        request.client = None
-        assert _get_client_ip(request) == "unknown"
+    @pytest.mark.parametrize(
+        "headers,client,expected",
+        [
+            # Extracts IP from X-Forwarded-For header
+            ({"X-Forwarded-For": "192.168.1.1"}, None, "192.168.1.1"),
+            # Takes first IP from X-Forwarded-For header
+            ({"X-Forwarded-For": "192.168.1.1, 10.0.0.1, 172.16.0.1"}, None, "192.168.1.1"),
+            # Falls back to X-Real-IP header
+            ({"X-Real-IP": "10.0.0.5"}, None, "10.0.0.5"),
+            # X-Forwarded-For takes priority over X-Real-IP
+            ({"X-Forwarded-For": "192.168.1.1", "X-Real-IP": "10.0.0.5"}, None, "192.168.1.1"),
+            # Falls back to request.client.host when no headers
+            ({}, SimpleNamespace(host="127.0.0.1"), "127.0.0.1"),
+            # Returns 'unknown' when no client info available
+            ({}, None, "unknown"),
+        ],
+    )
+    def test_client_ip(self, headers, client, expected):
+        """Resolves the client IP from proxy headers, then the socket peer."""
+        assert _get_client_ip(SimpleNamespace(headers=headers, client=client)) == expected
 
 
 class TestRateLimitDecorator:
     """Test cases for rate_limit decorator."""
 
-    @pytest.mark.asyncio
     async def test_skips_rate_limiting_in_test_env(self):
         """Rate limiting is skipped when TESTING=true."""
 
@@ -190,7 +194,6 @@ class TestRateLimitDecorator:
             assert await test_endpoint() == "success"
             assert await test_endpoint() == "success"
 
-    @pytest.mark.asyncio
     async def test_skips_for_root_admin(self):
         """Rate limiting is skipped for root admin users."""
 
@@ -208,10 +211,8 @@ class TestRateLimitDecorator:
 class TestCacheResponseDecorator:
     """Test cases for cache_response decorator."""
 
-    @pytest.mark.asyncio
-    async def test_caches_response(self):
+    async def test_caches_response(self, cache):
         """Response is cached on subsequent calls."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         call_count = 0
 
         @cache_response(cache, key_prefix="test")
@@ -227,8 +228,7 @@ class TestCacheResponseDecorator:
         assert result2 == "result_foo"
         assert call_count == 1  # Function only called once
 
-    @pytest.mark.asyncio
-    async def test_vary_on_user_isolates_entries_per_caller(self):
+    async def test_vary_on_user_isolates_entries_per_caller(self, cache):
         """Two users hitting the same URL must not share a cached response.
 
         Regression test: the cache key is assembled from scalar arguments only, so the
@@ -236,7 +236,6 @@ class TestCacheResponseDecorator:
         response was handed to every later caller, leaking one user's personalised
         category/phrase list to others - including anonymous visitors.
         """
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
 
         @cache_response(cache, key_prefix="test", vary_on_user=True)
         async def per_user_endpoint(*, request):
@@ -260,10 +259,8 @@ class TestCacheResponseDecorator:
         assert first == "data_for_1"
         assert second == "data_for_2", "user 2 was served user 1's cached response"
 
-    @pytest.mark.asyncio
-    async def test_vary_on_user_still_caches_for_the_same_caller(self):
+    async def test_vary_on_user_still_caches_for_the_same_caller(self, cache):
         """Per-user isolation must not disable caching outright."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         calls = 0
 
         @cache_response(cache, key_prefix="test", vary_on_user=True)
@@ -282,10 +279,8 @@ class TestCacheResponseDecorator:
 
         assert calls == 1
 
-    @pytest.mark.asyncio
-    async def test_refresh_bypasses_cache(self):
+    async def test_refresh_bypasses_cache(self, cache):
         """Setting refresh=True bypasses cache."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         call_count = 0
 
         @cache_response(cache, key_prefix="test")
@@ -300,10 +295,8 @@ class TestCacheResponseDecorator:
         # Function should be called twice (second time bypasses cache)
         assert call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_different_params_different_cache(self):
+    async def test_different_params_different_cache(self, cache):
         """Different parameters produce different cache keys."""
-        cache = AsyncLRUCache(maxsize=10, ttl=300)
         call_count = 0
 
         @cache_response(cache, key_prefix="test")
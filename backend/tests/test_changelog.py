@@ -1,9 +1,16 @@
 """Unit tests for changelog API module."""
 
+import io
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import osmosmjerka.game_api.changelog as changelog
+import pytest
 from osmosmjerka.game_api.changelog import (
+    CACHE_TTL_SECONDS,
     _changelog_cache,
+    _clear_changelog_cache,
+    _get_cached_changelog,
     _is_renovate_entry,
     compare_versions,
     get_current_version,
@@ -14,32 +21,39 @@ from osmosmjerka.game_api.changelog import (
 class TestCompareVersions:
     """Tests for semantic version comparison."""
 
-    def test_equal_versions(self):
-        assert compare_versions("1.0.0", "1.0.0") == 0
-        assert compare_versions("2.5.10", "2.5.10") == 0
-
-    def test_newer_version(self):
-        assert compare_versions("1.1.0", "1.0.0") == 1
-        assert compare_versions("2.0.0", "1.9.9") == 1
-        assert compare_versions("1.0.1", "1.0.0") == 1
-
-    def test_older_version(self):
-        assert compare_versions("1.0.0", "1.1.0") == -1
-        assert compare_versions("1.9.9", "2.0.0") == -1
-        assert compare_versions("1.0.0", "1.0.1") == -1
-
-    def test_with_v_prefix(self):
-        assert compare_versions("v1.0.0", "1.0.0") == 0
-        assert compare_versions("1.0.0", "v1.0.0") == 0
-        assert compare_versions("v2.0.0", "v1.0.0") == 1
-
-    def test_empty_versions(self):
-        assert compare_versions("", "") == 0
-        assert compare_versions("1.0.0", "") == 1
-        assert compare_versions("", "1.0.0") == -1
-        assert compare_versions(None, None) == 0
-        assert compare_versions("1.0.0", None) == 1
-        assert compare_versions(None, "1.0.0") == -1
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            # Equal
+            ("1.0.0", "1.0.0", 0),
+            ("2.5.10", "2.5.10", 0),
+            # Newer
+            ("1.1.0", "1.0.0", 1),
+            ("2.0.0", "1.9.9", 1),
+            ("1.0.1", "1.0.0", 1),
+            # Older
+            ("1.0.0", "1.1.0", -1),
+            ("1.9.9", "2.0.0", -1),
+            ("1.0.0", "1.0.1", -1),
+            # "v" prefix
+            ("v1.0.0", "1.0.0", 0),
+            ("1.0.0", "v1.0.0", 0),
+            ("v2.0.0", "v1.0.0", 1),
+            # Missing parts count as zero
+            ("1.2", "1.2.0", 0),
+            ("1.2", "1.2.1", -1),
+            ("1.3", "1.2.9", 1),
+            # Empty versions
+            ("", "", 0),
+            ("1.0.0", "", 1),
+            ("", "1.0.0", -1),
+            (None, None, 0),
+            ("1.0.0", None, 1),
+            (None, "1.0.0", -1),
+        ],
+    )
+    def test_compare_versions(self, a, b, expected):
+        assert compare_versions(a, b) == expected
 
 
 class TestIsRenovateEntry:
@@ -80,7 +94,7 @@ class TestParseChangelog:
     @patch("osmosmjerka.game_api.changelog.CHANGELOG_PATH")
     def test_parse_simple_changelog(self, mock_path):
         mock_path.exists.return_value = True
-        mock_path.read_text.return_value = """# Changelog
+        mock_path.open.return_value = io.StringIO("""# Changelog
 
 ## v1.38.1 (2026-01-08)
 
@@ -98,7 +112,7 @@ class TestParseChangelog:
 ### Feature
 
 - Initial release
-"""
+""")
         entries = parse_changelog()
 
         assert len(entries) == 2
@@ -113,7 +127,7 @@ class TestParseChangelog:
     @patch("osmosmjerka.game_api.changelog.CHANGELOG_PATH")
     def test_filters_renovate_entries(self, mock_path):
         mock_path.exists.return_value = True
-        mock_path.read_text.return_value = """# Changelog
+        mock_path.open.return_value = io.StringIO("""# Changelog
 
 ## v1.38.1 (2026-01-08)
 
@@ -126,7 +140,7 @@ class TestParseChangelog:
 
 - Fix grid issue
 - Update dependency pytest to v9
-"""
+""")
         entries = parse_changelog()
 
         assert len(entries) == 1
@@ -146,6 +160,17 @@ class TestGetCurrentVersion:
         mock_path.read_text.return_value = """[project]
 name = "osmosmjerka"
 version = "1.38.1"
+"""
+        assert get_current_version() == "1.38.1"
+
+    @patch("osmosmjerka.game_api.changelog.PYPROJECT_PATH")
+    def test_only_project_version_is_used(self, mock_path):
+        mock_path.exists.return_value = True
+        mock_path.read_text.return_value = """[tool.other]
+version = "9.9.9"
+
+[project]
+version = "1.38.1"
 """
         assert get_current_version() == "1.38.1"
 
@@ -154,15 +179,75 @@ version = "1.38.1"
         mock_path.exists.return_value = False
         assert get_current_version() is None
 
+    @patch("osmosmjerka.game_api.changelog.PYPROJECT_PATH")
+    def test_version_read_once_per_mtime(self, mock_path):
+        mock_path.exists.return_value = True
+        mock_path.stat.return_value.st_mtime_ns = 1
+        mock_path.read_text.return_value = '[project]\nversion = "1.0.0"\n'
+
+        assert get_current_version() == "1.0.0"
+        assert get_current_version() == "1.0.0"
+        assert mock_path.read_text.call_count == 1
+
+        # An edited file has a new mtime and is read again
+        mock_path.stat.return_value.st_mtime_ns = 2
+        mock_path.read_text.return_value = '[project]\nversion = "1.0.1"\n'
+        assert get_current_version() == "1.0.1"
+        assert mock_path.read_text.call_count == 2
+
 
 class TestCaching:
     """Tests for changelog caching."""
 
+    @pytest.fixture
+    def fake_changelog(self, monkeypatch):
+        """Counts parses and lets a test move the clock and the file's mtime."""
+        state = {"now": 1000.0, "mtime_ns": 1, "parses": 0}
+
+        def fake_parse():
+            state["parses"] += 1
+            return [{"version": "1.0.0", "features": ["x"], "bugfixes": [], "improvements": []}]
+
+        monkeypatch.setattr(changelog, "parse_changelog", fake_parse)
+        monkeypatch.setattr(changelog, "get_current_version", lambda: "1.0.0")
+        monkeypatch.setattr(changelog, "_changelog_mtime_ns", lambda: state["mtime_ns"])
+        monkeypatch.setattr(changelog, "time", SimpleNamespace(time=lambda: state["now"]))
+        _clear_changelog_cache()
+        yield state
+        _clear_changelog_cache()
+
     def test_cache_invalidation_after_ttl(self):
-        # Clear cache
-        _changelog_cache["entries"] = None
-        _changelog_cache["version"] = None
-        _changelog_cache["timestamp"] = 0
+        _clear_changelog_cache()
 
         # Cache should be empty initially
         assert _changelog_cache["entries"] is None
+
+    def test_cached_within_ttl(self, fake_changelog):
+        _get_cached_changelog()
+        _get_cached_changelog()
+        assert fake_changelog["parses"] == 1
+
+    def test_unchanged_file_is_not_reparsed_after_ttl(self, fake_changelog):
+        _get_cached_changelog()
+        fake_changelog["now"] += CACHE_TTL_SECONDS + 1
+        entries, version = _get_cached_changelog()
+
+        assert fake_changelog["parses"] == 1
+        assert entries[0]["version"] == "1.0.0"
+        assert version == "1.0.0"
+
+    def test_changed_file_is_reparsed_after_ttl(self, fake_changelog):
+        _get_cached_changelog()
+        fake_changelog["mtime_ns"] = 2
+        fake_changelog["now"] += CACHE_TTL_SECONDS + 1
+        _get_cached_changelog()
+
+        assert fake_changelog["parses"] == 2
+
+    def test_missing_file_is_always_reparsed_after_ttl(self, fake_changelog):
+        fake_changelog["mtime_ns"] = None
+        _get_cached_changelog()
+        fake_changelog["now"] += CACHE_TTL_SECONDS + 1
+        _get_cached_changelog()
+
+        assert fake_changelog["parses"] == 2
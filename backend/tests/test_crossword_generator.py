@@ -46,14 +46,11 @@ class TestGenerateCrosswordGrid:
 
         # At least one phrase should be placed
         assert len(placed) >= 1
-        # If both placed, they should have different directions or intersect
+        # If both placed, the second one can only have been placed crossing the first
         if len(placed) == 2:
-            # Check they share at least one cell (intersection)
-            coords1 = set(tuple(c) for c in placed[0]["coords"])
-            coords2 = set(tuple(c) for c in placed[1]["coords"])
-            intersection = coords1 & coords2
-            # Either they intersect or one couldn't fit perpendicular
-            assert len(intersection) >= 0
+            coords1 = frozenset(map(tuple, placed[0]["coords"]))
+            coords2 = frozenset(map(tuple, placed[1]["coords"]))
+            assert coords1 & coords2
 
     def test_grid_size_calculation(self):
         """Grid size should accommodate longest phrase."""
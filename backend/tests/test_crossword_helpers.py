@@ -1,47 +1,63 @@
 """Tests for crossword generation retry logic in helpers.py."""
 
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from unittest.mock import patch
 
+import osmosmjerka.game_api.helpers as helpers
 import pytest
 from osmosmjerka.game_api.helpers import (
     _convert_crossword_grid_to_simple,
     generate_formatted_crossword_grid,
 )
 
+_WORDS = (
+    "APPLE",
+    "BANANA",
+    "CHERRY",
+    "DATE",
+    "ELDERBERRY",
+    "FIG",
+    "GRAPE",
+    "HONEYDEW",
+    "KIWI",
+    "LEMON",
+    "MANGO",
+    "NECTARINE",
+    "ORANGE",
+    "PAPAYA",
+    "QUINCE",
+    "RASPBERRY",
+    "STRAWBERRY",
+    "TANGERINE",
+    "WATERMELON",
+    "APRICOT",
+)
+
+
+# Read-only 10x10 grid returned by mocked generators; every cell belongs to phrase 0
+_MOCK_CELL = {"letter": "A", "phrase_indices": [0]}
+_MOCK_GRID = tuple(tuple(_MOCK_CELL for _ in range(10)) for _ in range(10))
+
+
+@lru_cache
+def _make_phrases(count: int) -> tuple:
+    """Generate test phrases (built once per count)."""
+    return tuple({"phrase": _WORDS[i % len(_WORDS)], "translation": f"translation_{i}"} for i in range(count))
+
+
+@pytest.fixture(scope="module")
+def phrases_20():
+    return _make_phrases(20)
+
 
 class TestGenerateFormattedCrosswordGrid:
     """Tests for the crossword generation with retry logic."""
 
-    def _make_phrases(self, count: int) -> list:
-        """Generate test phrases."""
-        words = [
-            "APPLE",
-            "BANANA",
-            "CHERRY",
-            "DATE",
-            "ELDERBERRY",
-            "FIG",
-            "GRAPE",
-            "HONEYDEW",
-            "KIWI",
-            "LEMON",
-            "MANGO",
-            "NECTARINE",
-            "ORANGE",
-            "PAPAYA",
-            "QUINCE",
-            "RASPBERRY",
-            "STRAWBERRY",
-            "TANGERINE",
-            "WATERMELON",
-            "APRICOT",
-        ]
-        return [{"phrase": words[i % len(words)], "translation": f"translation_{i}"} for i in range(count)]
-
-    def test_success_on_first_attempt(self):
+    def test_success_on_first_attempt(self, phrases_20):
         """Test that generation succeeds when phrases can be placed."""
-        phrases = self._make_phrases(20)  # Plenty of phrases
-        grid, placed = generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
+        grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=10, target_phrase_count=5)
 
         # Should have placed at least minimum required (10//2 + 1 = 6)
         # But our target is 5, and we may get at least some
@@ -51,11 +67,10 @@ class TestGenerateFormattedCrosswordGrid:
 
     def test_uses_expanded_phrase_pool(self):
         """Test that the function uses more phrases than target."""
-        phrases = self._make_phrases(30)
+        phrases = _make_phrases(30)
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
             # Mock successful generation
-            mock_grid = [[{"letter": "A", "phrase_indices": [0]}] * 10 for _ in range(10)]
             mock_placed = [
                 {
                     "phrase": "TEST",
@@ -66,7 +81,7 @@ class TestGenerateFormattedCrosswordGrid:
                 }
                 for _ in range(6)  # Enough to satisfy minimum
             ]
-            mock_gen.return_value = (mock_grid, mock_placed)
+            mock_gen.return_value = (_MOCK_GRID, mock_placed)
 
             generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
 
@@ -74,13 +89,11 @@ class TestGenerateFormattedCrosswordGrid:
             called_phrases = mock_gen.call_args[0][0]
             assert len(called_phrases) > 5
 
-    def test_retries_on_failure(self):
+    def test_retries_on_failure(self, phrases_20):
         """Test that the function retries when generation fails."""
-        phrases = self._make_phrases(20)
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
             # First 3 attempts fail, 4th succeeds
-            mock_grid = [[{"letter": "A", "phrase_indices": [0]}] * 10 for _ in range(10)]
             mock_placed = [
                 {
                     "phrase": "TEST",
@@ -96,21 +109,19 @@ class TestGenerateFormattedCrosswordGrid:
                 ValueError("Not enough phrases"),
                 ValueError("Not enough phrases"),
                 ValueError("Not enough phrases"),
-                (mock_grid, mock_placed),  # Success on 4th attempt
+                (_MOCK_GRID, mock_placed),  # Success on 4th attempt
             ]
 
-            grid, placed = generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
+            grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=10, target_phrase_count=5)
 
             assert mock_gen.call_count == 4
             assert len(placed) >= 5
 
-    def test_returns_best_result_on_partial_success(self):
+    def test_returns_best_result_on_partial_success(self, phrases_20):
         """Test that best partial result is returned if it meets minimum."""
-        phrases = self._make_phrases(20)
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
             # All attempts produce partial results, last one is best
-            mock_grid = [[{"letter": "A", "phrase_indices": [0]}] * 10 for _ in range(10)]
 
             def make_placed(count):
                 return [
@@ -126,37 +137,65 @@ class TestGenerateFormattedCrosswordGrid:
 
             # Returns 4, 5, 6 phrases - 6 meets minimum (grid_size=10 -> min=6)
             mock_gen.side_effect = [
-                (mock_grid, make_placed(4)),
-                (mock_grid, make_placed(5)),
-                (mock_grid, make_placed(6)),  # Best result, meets minimum
-                (mock_grid, make_placed(5)),
-                (mock_grid, make_placed(4)),
+                (_MOCK_GRID, make_placed(4)),
+                (_MOCK_GRID, make_placed(5)),
+                (_MOCK_GRID, make_placed(6)),  # Best result, meets minimum
+                (_MOCK_GRID, make_placed(5)),
+                (_MOCK_GRID, make_placed(4)),
             ]
 
-            grid, placed = generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=8)
+            grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=10, target_phrase_count=8)
 
             # Should return the best result (6 phrases)
             assert len(placed) == 6
 
-    def test_raises_error_after_all_retries_exhausted(self):
+    def test_raises_error_after_all_retries_exhausted(self, monkeypatch):
         """Test that error is raised if all retries fail to meet minimum."""
-        phrases = self._make_phrases(5)  # Very few phrases
+        phrases = _make_phrases(5)  # Very few phrases
+        # Seeded so the shuffles, and so the distinct arrangements drawn, are deterministic
+        monkeypatch.setattr(helpers, "random", random.Random(0))
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
             # All attempts fail
             mock_gen.side_effect = ValueError("Not enough phrases")
 
-            with pytest.raises(ValueError, match="Could not generate crossword after"):
+            with pytest.raises(ValueError, match="Could not generate crossword after 2 attempts"):
+                generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
+
+            # BANANA and CHERRY are the only equal-length pair, so of the default 5 retries only
+            # 2 arrangements are distinct; the rest would repeat a failed attempt
+            assert mock_gen.call_count == 2
+
+    def test_attempts_use_distinct_arrangements(self, monkeypatch):
+        """Test that no two attempts get phrase pools the generator would process identically."""
+        monkeypatch.setattr(helpers, "random", random.Random(0))
+
+        with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
+            mock_gen.side_effect = ValueError("Not enough phrases")
+
+            with pytest.raises(ValueError):
+                generate_formatted_crossword_grid(_make_phrases(5), grid_size=10, target_phrase_count=5)
+
+        arrangements = [helpers._crossword_arrangement(call.args[0]) for call in mock_gen.call_args_list]
+        assert len(set(arrangements)) == len(arrangements)
+
+    def test_skips_repeated_arrangements(self):
+        """Test that pools the generator would process identically are only attempted once."""
+        # Distinct lengths: every shuffle is sorted back into the same order by the generator
+        phrases = [{"phrase": "FIG", "translation": "t"}, {"phrase": "DATE", "translation": "t"}]
+
+        with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
+            mock_gen.side_effect = ValueError("Not enough phrases")
+
+            with pytest.raises(ValueError, match="Could not generate crossword after 1 attempts"):
                 generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
 
-            assert mock_gen.call_count == 5  # Default max_retries
+            assert mock_gen.call_count == 1
 
-    def test_trims_to_target_count(self):
+    def test_trims_to_target_count(self, phrases_20):
         """Test that result is trimmed to target phrase count."""
-        phrases = self._make_phrases(20)
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
-            mock_grid = [[{"letter": "A", "phrase_indices": [0]}] * 10 for _ in range(10)]
             mock_placed = [
                 {
                     "phrase": f"TEST{i}",
@@ -167,24 +206,79 @@ class TestGenerateFormattedCrosswordGrid:
                 }
                 for i in range(10)  # More than target
             ]
-            mock_gen.return_value = (mock_grid, mock_placed)
+            mock_gen.return_value = (_MOCK_GRID, mock_placed)
 
-            grid, placed = generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5)
+            grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=10, target_phrase_count=5)
 
             assert len(placed) == 5  # Trimmed to target
 
-    def test_custom_max_retries(self):
+    def test_custom_max_retries(self, phrases_20):
         """Test that max_retries parameter is respected."""
-        phrases = self._make_phrases(20)
 
         with patch("osmosmjerka.game_api.helpers.generate_crossword_grid") as mock_gen:
             mock_gen.side_effect = ValueError("Not enough phrases")
 
             with pytest.raises(ValueError):
-                generate_formatted_crossword_grid(phrases, grid_size=10, target_phrase_count=5, max_retries=3)
+                generate_formatted_crossword_grid(phrases_20, grid_size=10, target_phrase_count=5, max_retries=3)
 
             assert mock_gen.call_count == 3
 
+    def test_parallel_attempts_on_large_grid(self, phrases_20, monkeypatch):
+        """Test that attempts on larger grids run through the shared pool and still succeed."""
+        # A thread pool stands in for the process pool; the dispatch path is the same
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            monkeypatch.setattr(helpers, "_crossword_executor", executor)
+            with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+                grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=12, target_phrase_count=10)
+
+        assert mock_submit.call_count >= 2  # One per attempt
+        assert len(grid) == 12
+        assert len(placed) >= 7  # 12 // 2 + 1
+        assert all(isinstance(coord, list) for phrase in placed for coord in phrase["coords"])
+
+    def test_without_pool_attempts_run_serially(self, phrases_20, monkeypatch):
+        """Test that large grids still generate when no pool was started (e.g. outside the app)."""
+        monkeypatch.setattr(helpers, "_crossword_executor", None)
+
+        grid, placed = generate_formatted_crossword_grid(phrases_20, grid_size=12, target_phrase_count=10)
+
+        assert len(grid) == 12
+        assert len(placed) >= 7
+
+
+class TestCrosswordExecutor:
+    """Tests for the crossword process pool lifecycle."""
+
+    @pytest.fixture(autouse=True)
+    def _no_pool(self, monkeypatch):
+        monkeypatch.setattr(helpers, "_crossword_executor", None)
+        yield
+        helpers.shutdown_crossword_executor()
+
+    def test_start_creates_bounded_spawn_pool(self, monkeypatch):
+        monkeypatch.setattr(helpers.os, "cpu_count", lambda: 64)
+
+        helpers.start_crossword_executor()
+
+        executor = helpers._crossword_executor
+        assert executor._max_workers == helpers.CROSSWORD_MAX_WORKERS
+        assert executor._mp_context.get_start_method() == "spawn"
+
+    def test_single_core_host_gets_no_pool(self, monkeypatch):
+        monkeypatch.setattr(helpers.os, "cpu_count", lambda: 1)
+
+        helpers.start_crossword_executor()
+
+        assert helpers._crossword_executor is None
+
+    def test_shutdown_clears_pool(self, monkeypatch):
+        monkeypatch.setattr(helpers.os, "cpu_count", lambda: 2)
+        helpers.start_crossword_executor()
+
+        helpers.shutdown_crossword_executor()
+
+        assert helpers._crossword_executor is None
+
 
 class TestConvertCrosswordGridToSimple:
     """Tests for the grid conversion helper."""
@@ -210,3 +304,14 @@ class TestConvertCrosswordGridToSimple:
         grid = [[None, None], [None, None]]
         result = _convert_crossword_grid_to_simple(grid)
         assert result == [[None, None], [None, None]]
+
+    def test_limit_drops_cells_of_removed_phrases(self):
+        """Test that cells only belonging to phrases past the limit are blanked, shared ones kept."""
+        grid = [
+            [{"letter": "A", "phrase_indices": [0]}, {"letter": "B", "phrase_indices": [0, 2]}],
+            [{"letter": "C", "phrase_indices": [2]}, {"letter": "D", "phrase_indices": []}],
+        ]
+
+        result = _convert_crossword_grid_to_simple(grid, limit_phrases=1)
+
+        assert result == [["A", "B"], [None, None]]
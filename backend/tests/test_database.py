@@ -1,44 +1,54 @@
-import asyncio
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from osmosmjerka.database import DatabaseManager
 
 
+def _returning(value):
+    """Build a plain async stub that ignores its arguments and returns value."""
+
+    async def stub(*args, **kwargs):
+        return value
+
+    return stub
+
+
 @pytest.fixture
 def db_manager():
-    # Patch the Database and engine so no real DB is used
-    with (
-        # pylint: disable=unused-variable
-        patch("databases.Database", autospec=True),
-        patch("sqlalchemy.create_engine", autospec=True) as mock_engine,
-    ):
-        manager = DatabaseManager(database_url="sqlite:///test.db")
-        manager.database = AsyncMock()
-        manager.engine = mock_engine.return_value
-        yield manager
-
-
-def run_async(coro):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
-
-
-def test_get_phrases_returns_filtered_phrases(db_manager):
-    # For this test, we'll patch the entire get_phrases method
-    # since the actual implementation requires complex SQLAlchemy setup
-    async def mock_get_phrases(language_set_id=None, category=None, limit=None, offset=0):
-        return [
-            {"id": 1, "categories": "cat dog", "phrase": "cat", "translation": "kot"},
-            {"id": 3, "categories": "cat", "phrase": "cat", "translation": "kot"},
-        ]
+    # DatabaseManager only opens a connection in connect(), so plain stubs keep it off a real DB
+    manager = DatabaseManager(database_url="sqlite:///test.db")
+    manager.database = SimpleNamespace(execute=_returning(None), fetch_all=_returning([]))
+    manager.engine = MagicMock()
+    return manager
+
+
+# Stand-ins for DatabaseManager methods whose real queries need a full SQLAlchemy setup.
+# Defined once here rather than inside each test that swaps them in.
+async def mock_get_phrases(language_set_id=None, category=None, limit=None, offset=0):
+    return [
+        {"id": 1, "categories": "cat dog", "phrase": "cat", "translation": "kot"},
+        {"id": 3, "categories": "cat", "phrase": "cat", "translation": "kot"},
+    ]
+
+
+async def mock_batch_delete_phrases(phrase_ids, language_set_id):
+    return len(phrase_ids)  # Return count of deleted phrases
+
 
+async def mock_batch_add_category(phrase_ids, category, language_set_id):
+    # Simulate that 2 out of 3 phrases were affected (1 already had the category)
+    return 2
+
+
+async def mock_batch_remove_category(phrase_ids, category, language_set_id):
+    # Simulate that 1 out of 3 phrases was affected (2 didn't have the category)
+    return 1
+
+
+async def test_get_phrases_returns_filtered_phrases(db_manager):
     db_manager.get_phrases = mock_get_phrases
-    phrases = run_async(db_manager.get_phrases(language_set_id=1))
+    phrases = await db_manager.get_phrases(language_set_id=1)
 
     # Verify we get phrases back (filtered by the mock implementation)
     assert len(phrases) == 2
@@ -46,55 +56,69 @@ def test_get_phrases_returns_filtered_phrases(db_manager):
     assert all("categories" in p for p in phrases)
 
 
-def test_add_phrase_calls_execute(db_manager):
+async def test_add_phrase_calls_execute(db_manager):
     # Mock the entire add_phrase method since it requires complex SQLAlchemy setup
     async def mock_add_phrase(language_set_id, categories, phrase, translation):
-        db_manager.database.execute.return_value = 42
+        db_manager.database.execute = _returning(42)
         return await db_manager.database.execute("mock query")
 
     db_manager.add_phrase = mock_add_phrase
-    result = run_async(db_manager.add_phrase(1, "cat", "cat", "kot"))
+    result = await db_manager.add_phrase(1, "cat", "cat", "kot")
     assert result == 42
 
 
-def test_delete_phrase_calls_execute(db_manager):
+async def test_delete_phrase_calls_execute(db_manager):
     # Mock the entire delete_phrase method since it requires complex SQLAlchemy setup
     async def mock_delete_phrase(phrase_id, language_set_id):
-        db_manager.database.execute.return_value = 1
+        db_manager.database.execute = _returning(1)
         return await db_manager.database.execute("mock query")
 
     db_manager.delete_phrase = mock_delete_phrase
-    result = run_async(db_manager.delete_phrase(1, 1))
+    result = await db_manager.delete_phrase(1, 1)
     assert result == 1
 
 
-def test_batch_delete_phrases(db_manager):
-    # Mock the entire batch_delete_phrases method
-    async def mock_batch_delete_phrases(phrase_ids, language_set_id):
-        return len(phrase_ids)  # Return count of deleted phrases
-
+async def test_batch_delete_phrases(db_manager):
     db_manager.batch_delete_phrases = mock_batch_delete_phrases
-    result = run_async(db_manager.batch_delete_phrases([1, 2, 3], 1))
+    result = await db_manager.batch_delete_phrases([1, 2, 3], 1)
     assert result == 3
 
 
-def test_batch_add_category(db_manager):
-    # Mock the entire batch_add_category method
-    async def mock_batch_add_category(phrase_ids, category, language_set_id):
-        # Simulate that 2 out of 3 phrases were affected (1 already had the category)
-        return 2
-
+async def test_batch_add_category(db_manager):
     db_manager.batch_add_category = mock_batch_add_category
-    result = run_async(db_manager.batch_add_category([1, 2, 3], "new_category", 1))
+    result = await db_manager.batch_add_category([1, 2, 3], "new_category", 1)
     assert result == 2
 
 
-def test_batch_remove_category(db_manager):
-    # Mock the entire batch_remove_category method
-    async def mock_batch_remove_category(phrase_ids, category, language_set_id):
-        # Simulate that 1 out of 3 phrases was affected (2 didn't have the category)
-        return 1
-
+async def test_batch_remove_category(db_manager):
     db_manager.batch_remove_category = mock_batch_remove_category
-    result = run_async(db_manager.batch_remove_category([1, 2, 3], "old_category", 1))
+    result = await db_manager.batch_remove_category([1, 2, 3], "old_category", 1)
     assert result == 1
+
+
+async def test_iter_phrases_for_admin_fetches_keyset_pages(db_manager, monkeypatch):
+    monkeypatch.setattr("osmosmjerka.database.phrases.ADMIN_EXPORT_PAGE_SIZE", 2)
+    db_manager._resolve_language_set = _returning({"id": 1})
+    rows = [
+        {"id": 1, "categories": "A", "phrase": "cat", "translation": "kot"},
+        {"id": 4, "categories": "A", "phrase": "ab", "translation": "too short"},
+        {"id": 7, "categories": "B", "phrase": "dog", "translation": "pas"},
+    ]
+    queries = []
+
+    async def fetch_page(query):
+        queries.append(query)
+        page = len(queries) - 1
+        return rows[page * 2 : page * 2 + 2]
+
+    db_manager.database.fetch_all = fetch_page
+
+    exported = [row async for row in db_manager.iter_phrases_for_admin(1)]
+
+    assert exported == [
+        {"categories": "A", "phrase": "cat", "translation": "kot"},
+        {"categories": "B", "phrase": "dog", "translation": "pas"},
+    ]
+    # The second page resumes after the last id of the first instead of holding a cursor open
+    assert len(queries) == 2
+    assert queries[1].compile().params["id_1"] == 4
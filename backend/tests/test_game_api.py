@@ -1,26 +1,29 @@
-import os
+from types import MappingProxyType
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from osmosmjerka.game_api import get_grid_size_and_num_phrases, router
-
-# Set testing environment variable to disable rate limiting
-os.environ["TESTING"] = "true"
+from osmosmjerka.cache import exports_cache
+from osmosmjerka.game_api import export, get_grid_size_and_num_phrases, router
 
 app = FastAPI()
 app.include_router(router)
 
+# Minimal /api/export request body; tests add the format and any overrides on a copy
+_EXPORT_PAYLOAD = MappingProxyType(
+    {"category": "Test", "grid": [["A"]], "phrases": [{"phrase": "A", "translation": "A"}]}
+)
+
 
 @pytest.fixture
-def client():
-    return TestClient(app)
+def client(module_client):
+    # The router app is stateless between requests, so every test shares the module's entered client
+    return module_client
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def mock_db_connection():
-    """Automatically mock the database connection for all tests"""
+    """Mock the database connection once for every test in this module; the targets never vary"""
     with (
         patch("osmosmjerka.database.db_manager._ensure_database"),
         patch("osmosmjerka.database.db_manager.database", Mock()),
@@ -28,6 +31,14 @@ def mock_db_connection():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_exports_cache():
+    """Rendered exports are cached by request body; start every test with an empty cache"""
+    exports_cache.invalidate()
+    yield
+    exports_cache.invalidate()
+
+
 def test_game_api_router_structure():
     """Test that the game API router is properly structured"""
     assert router is not None
@@ -58,6 +69,12 @@ def test_get_default_ignored_categories(mock_get_default_ignored, client):
     assert set(ignored) == {"X", "Y", "Z"}
 
 
+def test_get_default_ignored_categories_requires_language_set(client):
+    """The language_set_id query parameter is required and must be an integer"""
+    assert client.get("/api/default-ignored-categories").status_code == 422
+    assert client.get("/api/default-ignored-categories?language_set_id=abc").status_code == 422
+
+
 def test_get_user_ignored_categories_no_auth(client):
     """Test getting user ignored categories without authentication returns empty list"""
     response = client.get("/api/user/ignored-categories?language_set_id=1")
@@ -74,83 +91,68 @@ def test_get_system_tts_enabled(client):
         assert response.json() == {"enabled": False}
 
 
-def test_get_grid_size_and_num_phrases_very_easy():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "very_easy")
-    assert size == 8 and num_phrases == 5
-
-
-def test_get_grid_size_and_num_phrases_easy():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "easy")
-    assert size == 10 and num_phrases == 7
-
-
-def test_get_grid_size_and_num_phrases_medium():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 15, "medium")
-    assert size == 13 and num_phrases == 10
-
-
-def test_get_grid_size_and_num_phrases_hard():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 20, "hard")
-    assert size == 15 and num_phrases == 12
+# Shared, never-mutated phrase lists by size for the grid-size cases
+_PHRASE = {"phrase": "a"}
+_PHRASES = {n: [_PHRASE] * n for n in (0, 1, 10, 15, 20)}
+
+
+@pytest.mark.parametrize(
+    "phrase_count,difficulty,expected",
+    [
+        (10, "very_easy", (8, 5)),
+        (10, "easy", (10, 7)),
+        (15, "medium", (13, 10)),
+        (20, "hard", (15, 12)),
+        (20, "very_hard", (20, 16)),
+        # Unknown difficulties default to easy
+        (10, "invalid", (10, 7)),
+        # Phrase count doesn't change the difficulty settings
+        (0, "easy", (10, 7)),
+        (1, "easy", (10, 7)),
+        (1, "unknown", (10, 7)),
+    ],
+    ids=["very_easy", "easy", "medium", "hard", "very_hard", "invalid", "empty", "single", "single_unknown"],
+)
+def test_get_grid_size_and_num_phrases(phrase_count, difficulty, expected):
+    assert get_grid_size_and_num_phrases(_PHRASES[phrase_count], difficulty) == expected
 
 
-def test_get_grid_size_and_num_phrases_very_hard():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 20, "very_hard")
-    assert size == 20 and num_phrases == 16
-
-
-def test_get_grid_size_and_num_phrases_invalid():
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "a"}] * 10, "invalid")
-    assert size == 10 and num_phrases == 7  # defaults to easy
-
-
-def test_get_grid_size_and_num_phrases_edge_cases():
-    """Test edge cases for grid size calculation"""
-    # Empty phrase list - defaults to easy difficulty settings
-    size, num_phrases = get_grid_size_and_num_phrases([], "easy")
-    assert size == 10 and num_phrases == 7
-
-    # Single phrase - still uses difficulty settings
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "test"}], "easy")
-    assert size == 10 and num_phrases == 7
-
-    # Test unknown difficulty defaults to easy
-    size, num_phrases = get_grid_size_and_num_phrases([{"phrase": "test"}], "unknown")
-    assert size == 10 and num_phrases == 7
-
-
-@patch("osmosmjerka.database.db_manager.get_categories_for_language_set")
-@patch("osmosmjerka.database.db_manager.get_phrases")
-@patch("osmosmjerka.game_api.phrases._generate_grid_with_exact_phrase_count")
-def test_get_phrases_no_category_specified(mock_generate_grid, mock_get_phrases, mock_get_categories, client):
-    """Test getting phrases when no category is specified"""
-    mock_get_categories.return_value = ["A", "B"]
+@pytest.fixture
+def phrase_mocks():
+    """Patch the category, phrase and grid lookups behind /api/phrases in one go"""
+    with (
+        patch("osmosmjerka.game_api.phrases._generate_grid_with_exact_phrase_count") as mock_generate_grid,
+        patch("osmosmjerka.database.db_manager.get_phrases") as mock_get_phrases,
+        patch("osmosmjerka.database.db_manager.get_categories_for_language_set") as mock_get_categories,
+    ):
+        yield mock_generate_grid, mock_get_phrases, mock_get_categories
+
+
+@pytest.mark.parametrize(
+    "query,categories,expected_categories",
+    [
+        ("", ["A", "B"], ["A", "B"]),
+        # An invalid category falls back to a random valid one
+        ("?category=INVALID", ["A", "B"], ["A", "B"]),
+        ("?category=A&difficulty=easy", ["A"], ["A"]),
+    ],
+    ids=["no_category", "invalid_category", "success"],
+)
+def test_get_phrases(phrase_mocks, client, query, categories, expected_categories):
+    """Test getting phrases picks a grid from a valid category"""
+    mock_generate_grid, mock_get_phrases, mock_get_categories = phrase_mocks
+    mock_get_categories.return_value = categories
     mock_get_phrases.return_value = [{"phrase": "test", "categories": "A", "translation": "test"}] * 20
-    mock_generate_grid.return_value = ([["A"]], [{"phrase": "test"}])
+    mock_generate_grid.return_value = ([["A"]], [{"phrase": "test", "translation": "test"}])
 
-    response = client.get("/api/phrases")
+    response = client.get(f"/api/phrases{query}")
     assert response.status_code == 200
     data = response.json()
-    assert data["category"] in ["A", "B"]
+    assert data["category"] in expected_categories
     assert "grid" in data
     assert "phrases" in data
 
 
-@patch("osmosmjerka.database.db_manager.get_categories_for_language_set")
-@patch("osmosmjerka.database.db_manager.get_phrases")
-@patch("osmosmjerka.game_api.phrases._generate_grid_with_exact_phrase_count")
-def test_get_phrases_invalid_category(mock_generate_grid, mock_get_phrases, mock_get_categories, client):
-    """Test getting phrases with invalid category falls back to random"""
-    mock_get_categories.return_value = ["A", "B"]
-    mock_get_phrases.return_value = [{"phrase": "test", "categories": "A", "translation": "test"}] * 20
-    mock_generate_grid.return_value = ([["A"]], [{"phrase": "test"}])
-
-    response = client.get("/api/phrases?category=INVALID")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["category"] in ["A", "B"]  # Should pick a random valid category
-
-
 @patch("osmosmjerka.database.db_manager.get_categories_for_language_set")
 @patch("osmosmjerka.database.db_manager.get_phrases")
 def test_get_phrases_no_phrases_found(mock_get_phrases, mock_get_categories, client):
@@ -181,32 +183,10 @@ def test_get_phrases_not_enough_phrases(mock_get_phrases, mock_get_categories, c
     assert data["category"] == "A"
 
 
-@patch("osmosmjerka.database.db_manager.get_categories_for_language_set")
-@patch("osmosmjerka.database.db_manager.get_phrases")
-@patch("osmosmjerka.game_api.phrases._generate_grid_with_exact_phrase_count")
-def test_get_phrases_success(mock_generate_grid, mock_get_phrases, mock_get_categories, client):
-    """Test successful phrase retrieval"""
-    mock_get_categories.return_value = ["A"]
-    mock_get_phrases.return_value = [{"phrase": "a", "categories": "A", "translation": "a"}] * 20
-    mock_generate_grid.return_value = ([["A"]], [{"phrase": "a", "translation": "a"}])
-
-    response = client.get("/api/phrases?category=A&difficulty=easy")
-    assert response.status_code == 200
-    data = response.json()
-    assert "grid" in data
-    assert "phrases" in data
-    assert "category" in data
-    assert data["category"] == "A"
-
-
-@patch("osmosmjerka.database.db_manager.get_categories_for_language_set")
-@patch("osmosmjerka.database.db_manager.get_phrases")
 @patch("osmosmjerka.game_api.phrases.get_grid_size_and_num_phrases")
-@patch("osmosmjerka.game_api.phrases._generate_grid_with_exact_phrase_count")
-def test_get_phrases_all_categories(
-    mock_generate_grid, mock_get_grid_size, mock_get_phrases, mock_get_categories, client
-):
+def test_get_phrases_all_categories(mock_get_grid_size, phrase_mocks, client):
     """Test getting phrases with ALL category (all categories)"""
+    mock_generate_grid, mock_get_phrases, mock_get_categories = phrase_mocks
     mock_get_categories.return_value = ["A", "B", "C"]
     # Return phrases from multiple categories
     mock_get_phrases.return_value = [
@@ -234,7 +214,7 @@ def test_export_puzzle_docx(mock_export_docx, client):
     """Test exporting puzzle as DOCX"""
     mock_export_docx.return_value = b"docx_content"
 
-    data = {"category": "Test", "grid": [["A"]], "phrases": [{"phrase": "A", "translation": "A"}], "format": "docx"}
+    data = {**_EXPORT_PAYLOAD, "format": "docx"}
     response = client.post("/api/export", json=data)
     assert response.status_code == 200
     assert response.headers["content-type"].startswith(
@@ -248,11 +228,13 @@ def test_export_puzzle_png(mock_export_png, client):
     """Test exporting puzzle as PNG"""
     mock_export_png.return_value = b"png_content"
 
-    data = {"category": "Test", "grid": [["A"]], "phrases": [{"phrase": "A", "translation": "A"}], "format": "png"}
+    data = {**_EXPORT_PAYLOAD, "format": "png"}
     response = client.post("/api/export", json=data)
     assert response.status_code == 200
     assert response.headers["content-type"] == "image/png"
     assert "attachment; filename=wordsearch-test.png" in response.headers["content-disposition"]
+    assert response.content == b"png_content"
+    assert response.headers["content-length"] == str(len(b"png_content"))
 
 
 @patch("osmosmjerka.game_api.export.export_to_docx")
@@ -261,9 +243,8 @@ def test_export_puzzle_crossword_docx(mock_export_docx, client):
     mock_export_docx.return_value = b"docx_content"
 
     data = {
-        "category": "Test",
+        **_EXPORT_PAYLOAD,
         "grid": [["A", None]],
-        "phrases": [{"phrase": "A", "translation": "A"}],
         "format": "docx",
         "game_type": "crossword",
         "across_label": "Vodoravno",
@@ -277,17 +258,94 @@ def test_export_puzzle_crossword_docx(mock_export_docx, client):
     )
 
 
+@patch("osmosmjerka.game_api.export.export_to_png")
+def test_export_puzzle_reuses_cached_render(mock_export_png, client):
+    """Repeating an identical export request serves the cached file without re-rendering"""
+    mock_export_png.return_value = b"png_content"
+
+    data = {**_EXPORT_PAYLOAD, "format": "png"}
+    first = client.post("/api/export", json=data)
+    second = client.post("/api/export", json=data)
+    data["category"] = "Other"
+    third = client.post("/api/export", json=data)
+
+    assert first.content == second.content == third.content == b"png_content"
+    assert mock_export_png.call_count == 2
+
+
+@patch("osmosmjerka.game_api.export.export_to_png")
+def test_export_puzzle_large_grid_uses_export_executor(mock_export_png, client, monkeypatch):
+    """Large grids are rendered on the shared export executor rather than the threadpool"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    mock_export_png.return_value = b"png_content"
+    grid = [["A"] * 15 for _ in range(15)]
+    data = {**_EXPORT_PAYLOAD, "grid": grid, "format": "png"}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        monkeypatch.setattr(export, "_export_executor", executor)
+        with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+            response = client.post("/api/export", json=data)
+
+    assert response.status_code == 200
+    assert response.content == b"png_content"
+    mock_submit.assert_called_once()
+
+
+@patch("osmosmjerka.game_api.export.export_to_png")
+def test_export_puzzle_large_grid_without_pool_uses_threadpool(mock_export_png, client, monkeypatch):
+    """Without a started export pool, large grids still render on the threadpool"""
+    mock_export_png.return_value = b"png_content"
+    monkeypatch.setattr(export, "_export_executor", None)
+    data = {**_EXPORT_PAYLOAD, "grid": [["A"] * 15 for _ in range(15)], "format": "png"}
+
+    with patch("osmosmjerka.game_api.export.run_in_threadpool", wraps=export.run_in_threadpool) as mock_threadpool:
+        response = client.post("/api/export", json=data)
+
+    assert response.status_code == 200
+    mock_threadpool.assert_called_once()
+
+
+class TestExportExecutor:
+    """Tests for the export process pool lifecycle."""
+
+    @pytest.fixture(autouse=True)
+    def _no_pool(self, monkeypatch):
+        monkeypatch.setattr(export, "_export_executor", None)
+        yield
+        export.shutdown_export_executor()
+
+    def test_start_creates_bounded_spawn_pool(self, monkeypatch):
+        monkeypatch.setattr(export.os, "cpu_count", lambda: 64)
+
+        export.start_export_executor()
+
+        executor = export._export_executor
+        assert executor._max_workers == export.EXPORT_MAX_WORKERS
+        assert executor._mp_context.get_start_method() == "spawn"
+
+    def test_single_core_host_gets_no_pool(self, monkeypatch):
+        monkeypatch.setattr(export.os, "cpu_count", lambda: 1)
+
+        export.start_export_executor()
+
+        assert export._export_executor is None
+
+    def test_shutdown_clears_pool(self, monkeypatch):
+        monkeypatch.setattr(export.os, "cpu_count", lambda: 2)
+        export.start_export_executor()
+
+        export.shutdown_export_executor()
+
+        assert export._export_executor is None
+
+
 def test_export_puzzle_default_format(client):
     """Test exporting puzzle with default DOCX format"""
     with patch("osmosmjerka.game_api.export.export_to_docx") as mock_export:
         mock_export.return_value = b"docx_content"
 
-        data = {
-            "category": "Test",
-            "grid": [["A"]],
-            "phrases": [{"phrase": "A", "translation": "A"}],
-            # No format specified, should default to docx
-        }
+        data = dict(_EXPORT_PAYLOAD)  # No format specified, should default to docx
         response = client.post("/api/export", json=data)
         assert response.status_code == 200
         assert response.headers["content-type"].startswith(
@@ -297,12 +355,7 @@ def test_export_puzzle_default_format(client):
 
 def test_export_puzzle_invalid_format(client):
     """Test exporting puzzle with invalid format returns 422 (Pydantic validation)"""
-    data = {
-        "category": "Test",
-        "grid": [["A"]],
-        "phrases": [{"phrase": "A", "translation": "A"}],
-        "format": "invalid",
-    }
+    data = {**_EXPORT_PAYLOAD, "format": "invalid"}
     response = client.post("/api/export", json=data)
     # Pydantic regex pattern validation returns 422
     assert response.status_code == 422
@@ -313,12 +366,7 @@ def test_export_puzzle_filename_sanitization(client):
     with patch("osmosmjerka.game_api.export.export_to_docx") as mock_export:
         mock_export.return_value = b"docx_content"
 
-        data = {
-            "category": "Test Category with Spaces & Special!",
-            "grid": [["A"]],
-            "phrases": [{"phrase": "A", "translation": "A"}],
-            "format": "docx",
-        }
+        data = {**_EXPORT_PAYLOAD, "category": "Test Category with Spaces & Special!", "format": "docx"}
         response = client.post("/api/export", json=data)
         assert response.status_code == 200
         # Check that filename is sanitized - actual regex replaces non-alphanumeric with single underscore
@@ -330,7 +378,7 @@ def test_export_puzzle_no_category(client):
     with patch("osmosmjerka.game_api.export.export_to_docx") as mock_export:
         mock_export.return_value = b"docx_content"
 
-        data = {"category": "Test", "grid": [["A"]], "phrases": [{"phrase": "A", "translation": "A"}], "format": "docx"}
+        data = {**_EXPORT_PAYLOAD, "format": "docx"}
         response = client.post("/api/export", json=data)
         assert response.status_code == 200
         assert "wordsearch-test.docx" in response.headers["content-disposition"]
@@ -341,58 +389,25 @@ def test_export_puzzle_exception(client):
     with patch("osmosmjerka.game_api.export.export_to_docx") as mock_export:
         mock_export.side_effect = Exception("Export failed")
 
-        data = {"category": "Test", "grid": [["A"]], "phrases": [{"phrase": "A", "translation": "A"}], "format": "docx"}
+        data = {**_EXPORT_PAYLOAD, "format": "docx"}
         response = client.post("/api/export", json=data)
         assert response.status_code == 500
         assert "Export failed" in response.json()["detail"]
 
 
-def test_api_endpoints_exist():
-    """Test that expected API endpoints are registered with the router"""
-    # Just check that the router has routes
-    assert len(router.routes) > 0
-
-    # Check that we can import the functions that should be available
-    from osmosmjerka.game_api import get_grid_size_and_num_phrases
-
-    assert callable(get_grid_size_and_num_phrases)
-
-
-def test_imports_work():
-    """Test that all necessary imports work correctly"""
-    from osmosmjerka.database import db_manager
-    from osmosmjerka.game_api import router
-    from osmosmjerka.grid_generator.word_search import generate_grid
-    from osmosmjerka.utils import export_to_docx, export_to_png
-
-    # Basic sanity checks
-    assert router is not None
-    assert db_manager is not None
-    assert callable(generate_grid)
-    assert callable(export_to_docx)
-    assert callable(export_to_png)
-
-
-def test_game_api_integration():
-    """Test that game API imports all required modules correctly"""
+def test_public_surface():
+    """Test that the game API package re-exports what its endpoints rely on"""
     from osmosmjerka.game_api import (
         db_manager,
         export_to_docx,
         export_to_png,
         generate_grid,
-        get_grid_size_and_num_phrases,
-        router,
     )
 
-    assert router is not None
+    assert db_manager is not None
     assert callable(get_grid_size_and_num_phrases)
     assert callable(generate_grid)
     assert callable(export_to_docx)
     assert callable(export_to_png)
-    assert db_manager is not None
-
-
-def test_router_has_expected_routes():
-    """Test that router has the expected number of routes"""
     # Should have routes for: categories, phrases, export, ignored-categories
     assert len(router.routes) >= 4
@@ -42,6 +42,14 @@ def test_phrase_longer_than_grid():
     assert all(len(row) == 3 for row in grid)
 
 
+def test_phrase_normalizing_to_empty():
+    # "123" passes the length filter but normalizes to "", which must not break placement
+    phrases = [{"phrase": "123", "translation": "x"}, {"phrase": "HELLO", "translation": "y"}]
+    grid, placed = generate_grid(phrases, size=10)
+    assert sorted(p["phrase"] for p in placed) == ["123", "HELLO"]
+    assert next(p for p in placed if p["phrase"] == "123")["coords"] == []
+
+
 def test_multiple_phrases_no_overlap():
     phrases = [
         {"phrase": "CAT", "translation": "KOT"},
@@ -114,6 +122,12 @@ def test_normalize_phrase_mixed():
     assert normalize_phrase("") == ""
 
 
+def test_normalize_phrase_ascii_punctuation_and_digits():
+    assert normalize_phrase("Tab\tand\nnewline 42") == "TABANDNEWLINE"
+    assert normalize_phrase("it's_a-test?") == "ITSA-TEST"
+    assert normalize_phrase("-- 123 --") == ""
+
+
 def test_improved_phrase_intersections():
     """Test that the improved algorithm creates intersections between phrases"""
     phrases = [
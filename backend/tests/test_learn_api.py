@@ -1,26 +1,22 @@
 """Tests for the learning / SRS API endpoints (/api/learn/*)."""
 
-import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.auth import get_current_user
 from osmosmjerka.game_api import router
 
-os.environ["TESTING"] = "true"
-
 app = FastAPI()
 app.include_router(router)
 
 
 @pytest.fixture
-def client():
+def client(module_client):
     app.dependency_overrides = {}
     mock_user = {"id": 1, "username": "testuser", "role": "regular", "is_active": True}
     app.dependency_overrides[get_current_user] = lambda: mock_user
-    yield TestClient(app)
+    yield module_client
     app.dependency_overrides.clear()
 
 
@@ -2,14 +2,20 @@
 
 import json
 import logging
-from unittest.mock import patch
+import threading
+import traceback
+from logging.handlers import QueueHandler
+from unittest.mock import MagicMock, patch
 
+import pytest
+from osmosmjerka import logging_config
 from osmosmjerka.logging_config import (
     JSONFormatter,
     LevelBasedStreamHandler,
     PlainTextFormatter,
     configure_logging,
     get_logger,
+    log_if,
 )
 
 
@@ -84,15 +90,51 @@ class TestPlainTextFormatter:
         assert "ValueError" in result
         assert "Test error" in result
 
-    @patch("sys.stderr")
-    def test_colors_disabled_for_non_tty(self, mock_stderr):
+    def test_timestamp_is_iso8601_utc_with_milliseconds(self):
+        """Timestamp matches the ISO8601 UTC rendering with millisecond precision."""
+        formatter = PlainTextFormatter(use_colors=False)
+        record = logging.LogRecord(
+            name="test.module",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1759415535.234567
+        record.msecs = 234.567
+
+        result = formatter.format(record)
+
+        assert result.startswith("[2025-10-02T14:32:15.234Z]")
+
+    @patch.object(logging_config, "_STDERR_IS_TTY", False)
+    def test_colors_disabled_for_non_tty(self):
         """Colors are disabled when stderr is not a TTY."""
-        mock_stderr.isatty.return_value = False
         formatter = PlainTextFormatter(use_colors=True)
 
         # Colors should be disabled
         assert formatter.use_colors is False
 
+    @patch.object(logging_config, "_STDERR_IS_TTY", True)
+    def test_colors_level_for_tty(self):
+        """Level names are wrapped in their ANSI color when stderr is a TTY."""
+        formatter = PlainTextFormatter(use_colors=True)
+        record = logging.LogRecord(
+            name="test.module",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        result = formatter.format(record)
+
+        assert "[\033[32mINFO\033[0m]" in result
+
 
 class TestJSONFormatter:
     """Test cases for JSONFormatter class."""
@@ -159,6 +201,27 @@ class TestJSONFormatter:
         assert parsed["user_id"] == 123
         assert parsed["action"] == "login"
 
+    def test_plain_record_matches_dict_serialization(self):
+        """Records without extras produce the same JSON as the generic dict path."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test.module",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=7,
+            msg='Quote " backslash \\ newline \n unicode č',
+            args=(),
+            exc_info=None,
+            func="handler",
+        )
+
+        result = formatter.format(record)
+        record.extra_marker = True
+        generic = json.loads(formatter.format(record))
+        generic.pop("extra_marker")
+
+        assert list(json.loads(result).items()) == list(generic.items())
+
     def test_includes_exception_info(self):
         """Exception info is included in JSON output."""
         formatter = JSONFormatter()
@@ -187,72 +250,149 @@ class TestJSONFormatter:
         assert parsed["exception"]["type"] == "RuntimeError"
         assert "Something went wrong" in parsed["exception"]["message"]
         assert isinstance(parsed["exception"]["traceback"], list)
+        assert parsed["exception"]["traceback"] == traceback.format_exception(*exc_info)
 
+    def test_reuses_cached_exception_traceback(self):
+        """A traceback already formatted for the record is not formatted again."""
+        formatter = JSONFormatter()
 
-class TestLevelBasedStreamHandler:
-    """Test cases for LevelBasedStreamHandler class."""
+        try:
+            raise RuntimeError("Something went wrong")
+        except RuntimeError:
+            import sys
 
-    def test_info_goes_to_stdout(self):
-        """INFO level logs go to stdout."""
-        formatter = PlainTextFormatter(use_colors=False)
-        handler = LevelBasedStreamHandler(formatter)
+            exc_info = sys.exc_info()
 
         record = logging.LogRecord(
-            name="test",
+            name="test.module",
+            level=logging.ERROR,
+            pathname="test.py",
+            lineno=10,
+            msg="Error",
+            args=(),
+            exc_info=exc_info,
+        )
+
+        cached = ["Traceback (most recent call last):\n", "RuntimeError: cached\n"]
+        with patch.object(logging_config.traceback, "format_exception", return_value=cached) as mock_format:
+            formatter.format(record)
+            parsed = json.loads(formatter.format(record))
+
+        mock_format.assert_called_once()
+        assert parsed["exception"]["traceback"] == cached
+        assert "exc_traceback" not in parsed
+
+    def test_serializes_values_orjson_rejects(self):
+        """Values orjson cannot encode still produce valid JSON."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test.module",
             level=logging.INFO,
             pathname="test.py",
             lineno=10,
-            msg="Info message",
+            msg="Test",
             args=(),
             exc_info=None,
         )
+        record.big_number = 2**70
+        record.counts = {1: "one"}
 
-        # Check the filter logic
-        assert handler.stdout_handler.filters[0](record) is True
-        assert handler.stderr_handler.filters[0](record) is False
+        parsed = json.loads(formatter.format(record))
 
-    def test_error_goes_to_stderr(self):
-        """ERROR level logs go to stderr."""
-        formatter = PlainTextFormatter(use_colors=False)
-        handler = LevelBasedStreamHandler(formatter)
+        assert parsed["big_number"] == 2**70
+        assert parsed["counts"] == {"1": "one"}
 
+    def test_stdlib_fallback_matches_orjson_output(self):
+        """The stdlib json fallback writes the same compact UTF-8 line orjson would."""
+        formatter = JSONFormatter()
         record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
+            name="test.module",
+            level=logging.INFO,
             pathname="test.py",
             lineno=10,
-            msg="Error message",
-            args=(),
+            msg="Prijava uspješna: %s",
+            args=("Željko",),
             exc_info=None,
         )
+        record.counts = {1: "čćž"}
 
-        # Check the filter logic
-        assert handler.stdout_handler.filters[0](record) is False
-        assert handler.stderr_handler.filters[0](record) is True
+        expected = formatter.format(record)
+        with patch.object(logging_config.orjson, "dumps", side_effect=logging_config.orjson.JSONEncodeError):
+            result = formatter.format(record)
 
-    def test_warning_goes_to_stderr(self):
-        """WARNING level logs go to stderr."""
+        assert result == expected
+        assert "Željko" in result
+
+
+class TestLevelBasedStreamHandler:
+    """Test cases for LevelBasedStreamHandler class."""
+
+    def _emit(self, level: int, defer_flush: bool = False) -> tuple[MagicMock, MagicMock]:
+        """Emit one record at the given level and return the mocked (stdout, stderr) streams."""
         formatter = PlainTextFormatter(use_colors=False)
-        handler = LevelBasedStreamHandler(formatter)
+        handler = LevelBasedStreamHandler(formatter, defer_flush=defer_flush)
+        handler.stdout_stream = MagicMock()
+        handler.stderr_stream = MagicMock()
 
         record = logging.LogRecord(
             name="test",
-            level=logging.WARNING,
+            level=level,
             pathname="test.py",
             lineno=10,
-            msg="Warning message",
+            msg="Routed message",
             args=(),
             exc_info=None,
         )
+        handler.emit(record)
+        return handler.stdout_stream, handler.stderr_stream
+
+    def test_info_goes_to_stdout(self):
+        """INFO level logs go to stdout."""
+        stdout, stderr = self._emit(logging.INFO)
+
+        assert "Routed message" in stdout.write.call_args[0][0]
+        stdout.flush.assert_called_once()
+        stderr.write.assert_not_called()
+
+    def test_error_goes_to_stderr(self):
+        """ERROR level logs go to stderr."""
+        stdout, stderr = self._emit(logging.ERROR)
+
+        assert "Routed message" in stderr.write.call_args[0][0]
+        stdout.write.assert_not_called()
+
+    def test_warning_goes_to_stderr(self):
+        """WARNING level logs go to stderr."""
+        stdout, stderr = self._emit(logging.WARNING)
 
-        # WARNING goes to stderr
-        assert handler.stdout_handler.filters[0](record) is False
-        assert handler.stderr_handler.filters[0](record) is True
+        assert "Routed message" in stderr.write.call_args[0][0]
+        stdout.write.assert_not_called()
+
+    def test_deferred_flush_writes_without_flushing(self):
+        """With defer_flush the record is written to the stream but only flushed on flush()."""
+        stdout, stderr = self._emit(logging.INFO, defer_flush=True)
+
+        assert stdout.write.call_args[0][0].endswith("Routed message\n")
+        stdout.flush.assert_not_called()
 
 
 class TestConfigureLogging:
     """Test cases for configure_logging function."""
 
+    @pytest.fixture(autouse=True)
+    def _restore_root_logging(self):
+        """Put back the root handlers and restart the listener these tests replace."""
+        root_logger = logging.getLogger()
+        handlers, level = list(root_logger.handlers), root_logger.level
+        listener = logging_config._queue_listener
+        yield
+        logging_config._stop_queue_listener()
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+        logging_config._queue_listener = listener
+        if listener is not None and listener._thread is None:
+            listener.start()
+
     def test_configure_development_mode(self):
         """Development mode uses PlainTextFormatter."""
         # Clear existing handlers
@@ -263,7 +403,10 @@ class TestConfigureLogging:
 
         assert len(root_logger.handlers) == 1
         handler = root_logger.handlers[0]
-        assert isinstance(handler, LevelBasedStreamHandler)
+        assert isinstance(handler, QueueHandler)
+        stream_handler = logging_config._queue_listener.handlers[0]
+        assert isinstance(stream_handler, LevelBasedStreamHandler)
+        assert isinstance(stream_handler.formatter, PlainTextFormatter)
 
     def test_configure_production_mode(self):
         """Production mode uses JSONFormatter."""
@@ -284,6 +427,62 @@ class TestConfigureLogging:
 
         assert root_logger.level == logging.WARNING
 
+    def test_records_reach_stream_handler_with_exception_info(self):
+        """Records are handed to the stream handler off-thread with exc_info intact."""
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+
+        configure_logging(level="INFO", development_mode=False)
+        stream_handler = logging_config._queue_listener.handlers[0]
+
+        with patch.object(stream_handler, "emit") as mock_emit:
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                get_logger("test.queue").exception("Failed with %s", "details")
+            logging_config._stop_queue_listener()
+
+        record = mock_emit.call_args[0][0]
+        assert record.getMessage() == "Failed with details"
+        assert record.exc_info[0] is RuntimeError
+
+    def test_listener_flushes_after_draining_queue(self):
+        """The stream handler is flushed once the queued records have been written, before stop()."""
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+
+        configure_logging(level="INFO", development_mode=True)
+        listener = logging_config._queue_listener
+        stream_handler = listener.handlers[0]
+        calls = []
+        drained = threading.Event()
+
+        def record_flush():
+            calls.append("flush")
+            if "Second" in calls:
+                drained.set()
+
+        with (
+            patch.object(stream_handler, "emit", side_effect=lambda record: calls.append(record.getMessage())),
+            patch.object(stream_handler, "flush", side_effect=record_flush),
+        ):
+            get_logger("test.queue").info("First")
+            get_logger("test.queue").info("Second")
+
+            assert drained.wait(timeout=5)
+            assert listener._thread is not None  # Flushed by the running listener, not by stop()
+        assert calls.index("First") < calls.index("Second") < calls.index("flush", calls.index("Second"))
+
+    def test_reconfigure_replaces_listener(self):
+        """Configuring again stops the previous listener before starting a new one."""
+        configure_logging(level="INFO", development_mode=True)
+        first_listener = logging_config._queue_listener
+
+        configure_logging(level="INFO", development_mode=True)
+
+        assert logging_config._queue_listener is not first_listener
+        assert first_listener._thread is None
+
 
 class TestGetLogger:
     """Test cases for get_logger function."""
@@ -301,3 +500,34 @@ class TestGetLogger:
         logger2 = get_logger("test.same")
 
         assert logger1 is logger2
+
+
+class TestLogIf:
+    """Test cases for log_if helper."""
+
+    def test_skips_disabled_level(self):
+        """No record is created when the level is disabled."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = False
+
+        log_if(logger, logging.DEBUG, "Skipped", key="value")
+
+        logger.log.assert_not_called()
+
+    def test_passes_extras_when_enabled(self):
+        """Keyword extras are attached to the record as extra fields."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = True
+
+        log_if(logger, logging.INFO, "Count %d", 3, key="value")
+
+        logger.log.assert_called_once_with(logging.INFO, "Count %d", 3, extra={"key": "value"}, stacklevel=2)
+
+    def test_extras_may_shadow_parameter_names(self):
+        """Extras named like the positional parameters do not clash with them."""
+        logger = MagicMock(spec=logging.Logger)
+        logger.isEnabledFor.return_value = True
+
+        log_if(logger, logging.INFO, "Configured", level="DEBUG")
+
+        logger.log.assert_called_once_with(logging.INFO, "Configured", extra={"level": "DEBUG"}, stacklevel=2)
@@ -2,7 +2,6 @@ import asyncio
 from unittest.mock import AsyncMock
 
 import osmosmjerka.maintenance as maintenance
-import pytest
 from osmosmjerka.maintenance import (
     DEFAULT_INTERVAL_SECONDS,
     get_interval_seconds,
@@ -27,7 +26,6 @@ def test_interval_falls_back_on_garbage(monkeypatch):
     assert get_interval_seconds() == DEFAULT_INTERVAL_SECONDS
 
 
-@pytest.mark.asyncio
 async def test_run_maintenance_once_calls_both_purges(monkeypatch):
     db = AsyncMock()
     db.cleanup_expired_notifications.return_value = 3
@@ -40,7 +38,6 @@ async def test_run_maintenance_once_calls_both_purges(monkeypatch):
     db.cleanup_expired_sets.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_one_failing_purge_does_not_skip_the_other(monkeypatch):
     """A broken notifications purge must not stop phrase sets from being cleaned."""
     db = AsyncMock()
@@ -53,14 +50,12 @@ async def test_one_failing_purge_does_not_skip_the_other(monkeypatch):
     db.cleanup_expired_sets.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_start_maintenance_disabled_returns_none(monkeypatch):
     monkeypatch.setenv("MAINTENANCE_INTERVAL_SECONDS", "0")
     assert start_maintenance() is None
     await stop_maintenance(None)  # no-op, must not raise
 
 
-@pytest.mark.asyncio
 async def test_loop_sweeps_then_cancels_cleanly(monkeypatch):
     db = AsyncMock()
     db.cleanup_expired_notifications.return_value = 0
@@ -26,7 +26,6 @@ def mock_database():
 # ===== Learn This Later Tests =====
 
 
-@pytest.mark.asyncio
 async def test_create_learn_later_list(mock_database):
     """Test creating a Learn This Later list for a user"""
     user_id = 1
@@ -50,7 +49,6 @@ async def test_create_learn_later_list(mock_database):
         mock_create.assert_called_once_with(user_id, language_set_id)
 
 
-@pytest.mark.asyncio
 async def test_get_or_create_learn_later_list(mock_database):
     """Test get_or_create functionality"""
     user_id = 2
@@ -74,7 +72,6 @@ async def test_get_or_create_learn_later_list(mock_database):
         assert result2["id"] == result1["id"]
 
 
-@pytest.mark.asyncio
 async def test_bulk_add_phrases_to_private_list(mock_database):
     """Test adding phrases to a private list"""
     user_id = 3
@@ -98,7 +95,6 @@ async def test_bulk_add_phrases_to_private_list(mock_database):
         assert added_count == 3
 
 
-@pytest.mark.asyncio
 async def test_skip_duplicate_phrases(mock_database):
     """Test that duplicate phrases are skipped"""
     user_id = 4
@@ -127,7 +123,6 @@ async def test_skip_duplicate_phrases(mock_database):
         assert added_count2 == 0
 
 
-@pytest.mark.asyncio
 async def test_get_phrase_ids_in_private_list(mock_database):
     """Test checking which phrases are in a list"""
     user_id = 5
@@ -163,7 +158,6 @@ async def test_get_phrase_ids_in_private_list(mock_database):
 # ===== List Management Tests =====
 
 
-@pytest.mark.asyncio
 async def test_create_private_list(mock_database):
     """Test creating a custom private list"""
     user_id = 10
@@ -192,7 +186,6 @@ async def test_create_private_list(mock_database):
         assert list_info["is_system_list"] is False
 
 
-@pytest.mark.asyncio
 async def test_create_private_list_duplicate_name(mock_database):
     """Test that duplicate list names are prevented"""
     user_id = 11
@@ -209,7 +202,6 @@ async def test_create_private_list_duplicate_name(mock_database):
             await db_manager.create_private_list(user_id, list_name, language_set_id)
 
 
-@pytest.mark.asyncio
 async def test_get_user_private_lists(mock_database):
     """Test retrieving all private lists for a user"""
     user_id = 12
@@ -238,7 +230,6 @@ async def test_get_user_private_lists(mock_database):
         assert any(lst["list_name"] == "Learn This Later" for lst in result["lists"])
 
 
-@pytest.mark.asyncio
 async def test_get_user_private_lists_pagination(mock_database):
     """Test pagination for user private lists"""
     user_id = 13
@@ -265,7 +256,6 @@ async def test_get_user_private_lists_pagination(mock_database):
         assert len(result2["lists"]) >= 2
 
 
-@pytest.mark.asyncio
 async def test_update_private_list_name(mock_database):
     """Test renaming a private list"""
     user_id = 14
@@ -295,7 +285,6 @@ async def test_update_private_list_name(mock_database):
         assert list_info["list_name"] == new_name
 
 
-@pytest.mark.asyncio
 async def test_delete_private_list(mock_database):
     """Test deleting a non-system private list"""
     user_id = 15
@@ -328,7 +317,6 @@ async def test_delete_private_list(mock_database):
 # ===== Phrase Management Tests =====
 
 
-@pytest.mark.asyncio
 async def test_add_phrase_to_private_list(mock_database):
     """Test adding a public phrase to a private list"""
     user_id = 20
@@ -348,7 +336,6 @@ async def test_add_phrase_to_private_list(mock_database):
         assert isinstance(entry_id, int)
 
 
-@pytest.mark.asyncio
 async def test_add_custom_phrase_to_private_list(mock_database):
     """Test adding a custom phrase to a private list"""
     user_id = 21
@@ -368,7 +355,6 @@ async def test_add_custom_phrase_to_private_list(mock_database):
         assert entry_id is not None
 
 
-@pytest.mark.asyncio
 async def test_get_private_list_entries(mock_database):
     """Test retrieving entries from a private list"""
     user_id = 22
@@ -398,7 +384,6 @@ async def test_get_private_list_entries(mock_database):
         assert len(result["entries"]) >= 2
 
 
-@pytest.mark.asyncio
 async def test_get_private_list_entries_pagination(mock_database):
     """Test pagination for list entries"""
     user_id = 23
@@ -430,7 +415,6 @@ async def test_get_private_list_entries_pagination(mock_database):
         assert len(result2["entries"]) >= 2
 
 
-@pytest.mark.asyncio
 async def test_remove_phrase_from_private_list(mock_database):
     """Test removing a phrase from a private list"""
     user_id = 24
@@ -464,7 +448,6 @@ async def test_remove_phrase_from_private_list(mock_database):
         assert entry_id not in entry_ids
 
 
-@pytest.mark.asyncio
 async def test_get_phrase_counts_batch(mock_database):
     """Test batch fetching phrase counts for multiple lists"""
     user_id = 25
@@ -498,7 +481,6 @@ async def test_get_phrase_counts_batch(mock_database):
 # ===== List Sharing Tests =====
 
 
-@pytest.mark.asyncio
 async def test_share_private_list(mock_database):
     """Test sharing a private list with another user"""
     owner_id = 30
@@ -523,7 +505,6 @@ async def test_share_private_list(mock_database):
         assert shares[0]["shared_with_user_id"] == shared_with_user_id
 
 
-@pytest.mark.asyncio
 async def test_get_shared_with_me_lists(mock_database):
     """Test getting lists shared with a user"""
     owner_id = 32
@@ -547,7 +528,6 @@ async def test_get_shared_with_me_lists(mock_database):
         assert any(lst["id"] == list_id for lst in shared_lists)
 
 
-@pytest.mark.asyncio
 async def test_unshare_private_list(mock_database):
     """Test unsharing a private list"""
     owner_id = 34
@@ -578,7 +558,6 @@ async def test_unshare_private_list(mock_database):
 # ===== Resource Limits Tests =====
 
 
-@pytest.mark.asyncio
 async def test_list_limit_enforcement(mock_database):
     """Test that list limit is enforced"""
     user_id = 40
@@ -596,7 +575,6 @@ async def test_list_limit_enforcement(mock_database):
             await db_manager.create_private_list(user_id, "List 50", language_set_id)
 
 
-@pytest.mark.asyncio
 async def test_phrase_limit_enforcement(mock_database):
     """Test that phrase limit per list is enforced"""
     user_id = 41
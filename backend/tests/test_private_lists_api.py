@@ -2,30 +2,25 @@
 Tests for user private lists API endpoints
 """
 
-import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.auth import get_current_user
 from osmosmjerka.game_api import router
 
-# Set testing environment variable to disable rate limiting
-os.environ["TESTING"] = "true"
-
 app = FastAPI()
 app.include_router(router)
 
 
 @pytest.fixture
-def client():
+def client(module_client):
     # Clear any existing overrides before each test
     app.dependency_overrides = {}
     # Set up default mock user
     mock_user = {"id": 1, "username": "testuser", "role": "user", "is_active": True}
     app.dependency_overrides[get_current_user] = lambda: mock_user
-    yield TestClient(app)
+    yield module_client
     # Clean up after test
     app.dependency_overrides.clear()
 
@@ -2,7 +2,6 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.admin_api import router
 from osmosmjerka.auth import require_root_admin
 
@@ -11,8 +10,8 @@ app.include_router(router)
 
 
 @pytest.fixture
-def client():
-    return TestClient(app)
+def client(module_client):
+    return module_client
 
 
 @pytest.fixture
@@ -25,7 +24,6 @@ def mock_regular_user():
     return {"username": "user", "role": "regular", "id": 2, "is_active": True}
 
 
-@pytest.mark.asyncio
 async def test_get_statistics_enabled_root_admin(client, mock_root_admin_user):
     """Test getting statistics enabled status as root admin"""
     # Clear any existing overrides first
@@ -49,7 +47,6 @@ async def test_get_statistics_enabled_root_admin(client, mock_root_admin_user):
         app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_get_statistics_enabled_unauthorized(client):
     """Test getting statistics enabled status without authorization"""
     # Clear any existing overrides first
@@ -59,7 +56,6 @@ async def test_get_statistics_enabled_unauthorized(client):
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_set_statistics_enabled_root_admin(client, mock_root_admin_user):
     """Test setting statistics enabled status as root admin"""
     # Clear any existing overrides first
@@ -84,7 +80,6 @@ async def test_set_statistics_enabled_root_admin(client, mock_root_admin_user):
         app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_set_statistics_enabled_invalid_data(client, mock_root_admin_user):
     """Test setting statistics enabled with invalid data"""
     # Clear any existing overrides first
@@ -110,7 +105,6 @@ async def test_set_statistics_enabled_invalid_data(client, mock_root_admin_user)
         app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_clear_all_statistics_root_admin(client, mock_root_admin_user):
     """Test clearing all statistics as root admin"""
     # Clear any existing overrides first
@@ -128,7 +122,6 @@ async def test_clear_all_statistics_root_admin(client, mock_root_admin_user):
         app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_settings_endpoints_non_root_admin(client, mock_regular_user):
     """Test that settings endpoints reject non-root admin users"""
     # Clear any existing overrides first
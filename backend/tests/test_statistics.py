@@ -22,7 +22,6 @@ async def db_manager():
     return manager
 
 
-@pytest.mark.asyncio
 async def test_start_game_session(db_manager):
     """Test starting a game session"""
     session_id = await db_manager.start_game_session(
@@ -33,7 +32,6 @@ async def test_start_game_session(db_manager):
     assert db_manager.database.execute.call_count == 2  # game session + user stats update
 
 
-@pytest.mark.asyncio
 async def test_complete_game_session(db_manager):
     """Test completing a game session"""
     # Mock session data
@@ -46,7 +44,6 @@ async def test_complete_game_session(db_manager):
     assert db_manager.database.execute.call_count >= 3
 
 
-@pytest.mark.asyncio
 async def test_get_user_statistics(db_manager):
     """Test getting user statistics"""
     # Mock statistics data
@@ -70,7 +67,6 @@ async def test_get_user_statistics(db_manager):
     assert result["total_phrases_found"] == 25
 
 
-@pytest.mark.asyncio
 async def test_get_user_favorite_categories(db_manager):
     """Test getting user's favorite categories"""
     # Mock category data
@@ -99,7 +95,6 @@ async def test_get_user_favorite_categories(db_manager):
     assert result[0]["plays_count"] == 5
 
 
-@pytest.mark.asyncio
 async def test_record_phrase_operation(db_manager):
     """Test recording phrase operations"""
     await db_manager.record_phrase_operation(1, 1, "added")
@@ -107,7 +102,6 @@ async def test_record_phrase_operation(db_manager):
     assert db_manager.database.execute.call_count >= 1
 
 
-@pytest.mark.asyncio
 async def test_get_admin_statistics_overview(db_manager):
     """Test getting admin statistics overview"""
     # Mock overview data
@@ -127,7 +121,6 @@ async def test_get_admin_statistics_overview(db_manager):
     assert result["total_games_completed"] == 35
 
 
-@pytest.mark.asyncio
 async def test_statistics_caching(db_manager):
     """Test that statistics are properly cached"""
     # Mock statistics data
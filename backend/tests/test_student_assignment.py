@@ -2,7 +2,6 @@ from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.admin_api import router
 from osmosmjerka.auth import require_teacher_access
 
@@ -11,9 +10,9 @@ app.include_router(router)
 
 
 @pytest.fixture
-def client():
+def client(module_client):
     app.dependency_overrides = {}
-    return TestClient(app)
+    return module_client
 
 
 @pytest.fixture
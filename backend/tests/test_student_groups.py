@@ -5,7 +5,6 @@ from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.auth import get_current_user
 from osmosmjerka.game_api import router
 
@@ -14,9 +13,9 @@ app.include_router(router)
 
 
 @pytest.fixture
-def client():
+def client(module_client):
     app.dependency_overrides = {}
-    return TestClient(app)
+    return module_client
 
 
 @pytest.fixture
@@ -3,7 +3,6 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.auth import get_current_user
 from osmosmjerka.game_api.student_study import router
 
@@ -12,8 +11,8 @@ app.include_router(router)
 
 
 @pytest.fixture
-def client():
-    return TestClient(app)
+def client(module_client):
+    return module_client
 
 
 @pytest.fixture
@@ -5,7 +5,6 @@ from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 from osmosmjerka.admin_api import router
 from osmosmjerka.auth import get_current_user_optional, require_teacher_access
 
@@ -14,9 +13,9 @@ app.include_router(router)
 
 
 @pytest.fixture
-def client():
+def client(module_client):
     app.dependency_overrides = {}
-    return TestClient(app)
+    return module_client
 
 
 @pytest.fixture
@@ -518,7 +517,6 @@ def test_list_sessions_for_set(client, mock_teacher_user, mock_phrase_set):
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_generate_hotlink_token():
     """Test hotlink token generation."""
     from osmosmjerka.database.teacher_sets import generate_hotlink_token
@@ -528,7 +526,6 @@ async def test_generate_hotlink_token():
     assert token.isalnum() or "-" in token or "_" in token  # URL-safe
 
 
-@pytest.mark.asyncio
 async def test_default_config():
     """Test default configuration values."""
     from osmosmjerka.database.teacher_sets import DEFAULT_CONFIG
@@ -538,3 +535,6 @@ async def test_default_config():
     assert DEFAULT_CONFIG["require_translation_input"] is False
     assert DEFAULT_CONFIG["grid_size"] == 10
     assert DEFAULT_CONFIG["difficulty"] == "medium"
+
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG["grid_size"] = 20  # type: ignore[index]
@@ -74,6 +74,25 @@ def test_export_to_docx_phrases_with_special_characters(tmp_path):
     assert "ß" in doc.tables[0].cell(1, 1).text
 
 
+def test_export_to_docx_phrase_line_formatting(tmp_path):
+    """The phrase list is a single centered run in the bold Arial character style, with markup escaped."""
+    phrases = [{"phrase": "r&b", "translation": "music"}, {"phrase": "<tag>", "translation": "html"}]
+    docx_bytes = export_to_docx("Markup", [["A", "B"], ["C", "D"]], phrases)
+    docx_file = tmp_path / "markup.docx"
+    docx_file.write_bytes(docx_bytes)
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    paragraph = Document(str(docx_file)).paragraphs[-1]
+    assert paragraph.text == "R&B, <TAG>"
+    assert paragraph.alignment == WD_ALIGN_PARAGRAPH.CENTER
+    (run,) = paragraph.runs
+    assert run.style.name == "PhraseList"
+    assert run.style.font.bold
+    assert run.style.font.name == "Arial"
+    assert run.style.font.size.pt == 11
+
+
 def test_export_to_png_valid_input(tmp_path):
     from osmosmjerka.utils import export_to_png
 
@@ -186,6 +205,33 @@ def test_crossword_start_numbers_shared_cell():
     assert numbers[(2, 2)] == "3"
 
 
+def test_prepare_puzzle_keys_clue_numbers_to_cropped_grid():
+    """Preparing a crossword crops the grid once and moves clue numbers onto cropped coordinates,
+    so both export formats can look them up directly."""
+    from osmosmjerka.utils import _prepare_puzzle
+
+    size = 10
+    grid = [[None for _ in range(size)] for _ in range(size)]
+    grid[4][4], grid[4][5], grid[4][6] = "C", "A", "T"
+    phrases = [
+        {
+            "phrase": "cat",
+            "translation": "kot",
+            "coords": [[4, 4], [4, 5], [4, 6]],
+            "direction": "across",
+            "start_number": 1,
+        }
+    ]
+
+    puzzle = _prepare_puzzle("Animals", grid, phrases, "crossword")
+
+    assert puzzle.title == "ANIMALS"
+    assert puzzle.numbers == {(1, 1): "1"}
+    assert puzzle.grid[1][1] == "C"
+    assert puzzle.across_lines == ["1. kot"]
+    assert puzzle.down_lines == []
+
+
 def test_export_to_docx_crossword_is_blank_with_clues(tmp_path):
     """Crossword export is a blank, printable puzzle: numbered cells with no answer
     letters, non-playable cells shaded, and a numbered Across/Down clue list (using
@@ -223,3 +269,87 @@ def test_export_to_png_crossword_blank_cells(tmp_path):
 
     img = Image.open(str(png_file))
     assert img.format == "PNG"
+
+
+def test_export_fonts_are_loaded_once_per_size():
+    """Fonts are parsed from disk once per (path, size) and reused by later exports."""
+    from unittest.mock import MagicMock, patch
+
+    from osmosmjerka.utils import _load_export_fonts, _truetype_font
+
+    _truetype_font.cache_clear()
+    _load_export_fonts.cache_clear()
+    try:
+        with patch("osmosmjerka.utils.ImageFont.truetype", return_value=MagicMock()) as mock_truetype:
+            first = _load_export_fonts(40)
+            _load_export_fonts.cache_clear()
+            second = _load_export_fonts(40)
+            third = _load_export_fonts(40)
+    finally:
+        _truetype_font.cache_clear()
+        _load_export_fonts.cache_clear()
+
+    assert mock_truetype.call_count == 5  # one load per distinct size
+    assert first == second
+    assert second is third  # the resolved font set itself is reused per cell size
+
+
+def test_export_fonts_fall_back_to_shared_default_font():
+    """When no TrueType font loads, every export reuses one default font instance."""
+    from unittest.mock import patch
+
+    from osmosmjerka.utils import _load_export_fonts
+
+    _load_export_fonts.cache_clear()
+    try:
+        with patch("osmosmjerka.utils._truetype_font", return_value=None):
+            first = _load_export_fonts(40)
+            second = _load_export_fonts(30)
+    finally:
+        _load_export_fonts.cache_clear()
+
+    assert len({id(font) for font in [*first.values(), *second.values()]}) == 1
+
+
+def test_wrap_text_packs_items_greedily():
+    """Items are packed into as few lines as fit; an oversized item gets its own line."""
+    from unittest.mock import MagicMock
+
+    from osmosmjerka.utils import _wrap_text
+
+    font = MagicMock()
+    font.getlength.side_effect = lambda text: 10.0 * len(text)
+
+    assert _wrap_text(["AB", "CD", "EF"], ", ", font, 60) == ["AB, CD", "EF"]
+    assert _wrap_text(["ABCDEFGH", "IJ"], ", ", font, 50) == ["ABCDEFGH", "IJ"]
+    assert _wrap_text([], ", ", font, 50) == []
+
+
+def test_export_to_docx_grid_table_is_borderless(tmp_path):
+    """The grid table is created without a table style or borders, so nothing needs stripping afterwards."""
+    from docx import Document
+    from docx.oxml.ns import qn
+
+    docx_bytes = export_to_docx("Grid", [["A", "B"], ["C", "D"]], [{"phrase": "ab", "translation": "x"}])
+    docx_file = tmp_path / "grid.docx"
+    docx_file.write_bytes(docx_bytes)
+
+    tbl_pr = Document(str(docx_file)).tables[0]._tbl.tblPr
+    assert tbl_pr.find(qn("w:tblStyle")) is None
+    assert tbl_pr.find(qn("w:tblBorders")) is None
+
+
+def test_export_fonts_resolve_independently_of_working_directory(tmp_path, monkeypatch):
+    """The bundled TrueType font is found even when the process runs from another directory."""
+    from osmosmjerka.utils import _load_export_fonts
+    from PIL import ImageFont
+
+    monkeypatch.chdir(tmp_path)
+    _load_export_fonts.cache_clear()
+    try:
+        fonts = _load_export_fonts(40)
+    finally:
+        _load_export_fonts.cache_clear()
+
+    assert isinstance(fonts["grid"], ImageFont.FreeTypeFont)
+    assert fonts["grid"].path.endswith("DejaVuSans-Bold.ttf")